@@ -0,0 +1,238 @@
+"""
+Benchmarks de las rutas principales del proyecto.
+
+Uso:
+    python -m benchmarks.ejecutar                          # tamaños por defecto
+    python -m benchmarks.ejecutar --tamanos 30,1e6,1e8     # hasta 10^8 datos
+    python -m benchmarks.ejecutar --casos construccion,grafico_png
+    python -m benchmarks.ejecutar --comparar anterior.json actual.json
+
+Los resultados (tiempo y memoria pico de cada caso y tamaño) se guardan en JSON,
+por defecto en benchmarks/resultados/<commit>.json, para comparar entre commits.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+
+from functions.regresion_lineal import RegresionLineal
+from functions.coeficiente_correlacion import calcular_coeficiente_correlacion
+from functions.regresion_helper import ejecutar_regresion
+
+TAMANOS_POR_DEFECTO = [30, 1_000, 100_000, 1_000_000]
+
+# Módulos que no deben cargarse al importar el núcleo numérico
+MODULOS_PESADOS = ("scipy", "matplotlib", "rich", "plotext")
+
+
+def generar_datos(n, semilla=0):
+    """Datos reproducibles parecidos al ejemplo de main.py (x entre 10 y 30, y decreciente con ruido)."""
+    rng = np.random.default_rng(semilla)
+    x = rng.uniform(10, 30, n)
+    y = 5 - 0.15 * x + rng.normal(0, 1.2, n)
+    return x, y
+
+
+def _caso_construccion(x, y, directorio):
+    return lambda: RegresionLineal(x, y, "x", "y")
+
+
+def _caso_correlacion(x, y, directorio):
+    return lambda: calcular_coeficiente_correlacion(x, y, "x", "y")
+
+
+def _caso_tabla(x, y, directorio):
+    from functions.table import table
+
+    regresion = RegresionLineal(x, y, "x", "y")
+    resultados = regresion.resultados
+
+    def ejecutar():
+        with contextlib.redirect_stdout(io.StringIO()):
+            table("x", "y", resultados["correlacion"]["r"], resultados["correlacion"]["conclusion"], regresion.n, resultados)
+
+    return ejecutar
+
+
+def _caso_grafico_png(x, y, directorio):
+    from functions.graphic import graphic
+
+    ruta = os.path.join(directorio, "grafico.png")
+    return lambda: graphic(x, y, "x", "y", "Benchmark", save_path=ruta, a=5, b=-0.15)
+
+
+def _caso_grafico_ascii(x, y, directorio):
+    from functions.graphic import show_ascii_plot
+
+    def ejecutar():
+        with contextlib.redirect_stdout(io.StringIO()):
+            show_ascii_plot(x, y, "x", "y", "Benchmark", "blue", a=5, b=-0.15)
+
+    return ejecutar
+
+
+def _caso_ejecutar_regresion(x, y, directorio):
+    ruta = os.path.join(directorio, "diagrama.png")
+
+    def ejecutar():
+        with contextlib.redirect_stdout(io.StringIO()):
+            ejecutar_regresion(x, y, "x", "y", 0.05, "Benchmark", save_path=ruta)
+
+    return ejecutar
+
+
+# nombre -> (constructor del caso, tamaño máximo razonable)
+CASOS = {
+    "construccion": (_caso_construccion, None),
+    "correlacion": (_caso_correlacion, None),
+    "tabla": (_caso_tabla, None),
+    "grafico_png": (_caso_grafico_png, None),
+    "grafico_ascii": (_caso_grafico_ascii, 100_000),
+    "ejecutar_regresion": (_caso_ejecutar_regresion, None),
+}
+
+
+def medir(funcion, repeticiones):
+    """Mide la función: tiempos de `repeticiones` corridas y la memoria pico de una corrida extra."""
+    # Corrida de calentamiento (imports diferidos, cachés) que no se cuenta
+    funcion()
+
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+
+    # La memoria se mide aparte porque tracemalloc hace más lento el código
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "tiempo_s": statistics.median(tiempos),
+        "tiempo_min_s": min(tiempos),
+        "memoria_pico_bytes": pico,
+        "repeticiones": repeticiones,
+    }
+
+
+def medir_importacion():
+    """Mide en un proceso nuevo el tiempo de importar el núcleo y verifica que no cargue módulos pesados."""
+    codigo = (
+        "import sys, time, json\n"
+        "inicio = time.perf_counter()\n"
+        "import functions.regresion_helper\n"
+        "tiempo = time.perf_counter() - inicio\n"
+        f"pesados = sorted({{m.split('.')[0] for m in sys.modules}} & set({MODULOS_PESADOS!r}))\n"
+        "print(json.dumps({'tiempo_s': tiempo, 'modulos_pesados': pesados}))\n"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True)
+    return json.loads(salida.stdout)
+
+
+def _commit_actual():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconocido"
+
+
+def ejecutar(tamanos, casos, repeticiones):
+    """Corre los casos pedidos para cada tamaño y retorna el reporte completo."""
+    resultados = []
+
+    with tempfile.TemporaryDirectory() as directorio:
+        for n in tamanos:
+            x, y = generar_datos(n)
+            for nombre in casos:
+                constructor, maximo = CASOS[nombre]
+                if maximo is not None and n > maximo:
+                    continue
+
+                # Los casos grandes son lentos: se repiten menos
+                reps = repeticiones if n <= 1_000_000 else 1
+                medicion = medir(constructor(x, y, directorio), reps)
+                medicion.update({"caso": nombre, "n": n})
+                resultados.append(medicion)
+                print(f"{nombre:<20} n={n:<11} {medicion['tiempo_s']:.6f} s  {medicion['memoria_pico_bytes'] / 2**20:.2f} MiB",
+                      file=sys.stderr)
+            del x, y
+
+    importacion = medir_importacion()
+    print(f"{'importacion':<20} {importacion['tiempo_s']:.6f} s  pesados={importacion['modulos_pesados']}", file=sys.stderr)
+
+    return {
+        "commit": _commit_actual(),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "importacion": importacion,
+        "resultados": resultados,
+    }
+
+
+def comparar(ruta_anterior, ruta_actual):
+    """Imprime la razón actual/anterior de tiempo y memoria para cada caso y tamaño en común."""
+    with open(ruta_anterior) as f:
+        anterior = {(r["caso"], r["n"]): r for r in json.load(f)["resultados"]}
+    with open(ruta_actual) as f:
+        actual = {(r["caso"], r["n"]): r for r in json.load(f)["resultados"]}
+
+    print(f"{'caso':<20} {'n':>11} {'tiempo':>9} {'memoria':>9}")
+    for llave in sorted(anterior.keys() & actual.keys()):
+        antes, ahora = anterior[llave], actual[llave]
+        razon_tiempo = ahora["tiempo_s"] / antes["tiempo_s"] if antes["tiempo_s"] else float("nan")
+        razon_memoria = ahora["memoria_pico_bytes"] / antes["memoria_pico_bytes"] if antes["memoria_pico_bytes"] else float("nan")
+        print(f"{llave[0]:<20} {llave[1]:>11} {razon_tiempo:>8.2f}x {razon_memoria:>8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de regresión lineal")
+    parser.add_argument("--tamanos", default=",".join(map(str, TAMANOS_POR_DEFECTO)),
+                        help="Tamaños separados por comas (acepta notación como 1e8)")
+    parser.add_argument("--casos", default=",".join(CASOS), help="Casos separados por comas")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--salida", help="Archivo JSON de salida (por defecto benchmarks/resultados/<commit>.json)")
+    parser.add_argument("--comparar", nargs=2, metavar=("ANTERIOR", "ACTUAL"), help="Compara dos archivos de resultados")
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparar(*args.comparar)
+        return
+
+    tamanos = [int(float(t)) for t in args.tamanos.split(",")]
+    casos = args.casos.split(",")
+    desconocidos = set(casos) - set(CASOS)
+    if desconocidos:
+        parser.error(f"Casos desconocidos: {', '.join(sorted(desconocidos))}")
+
+    reporte = ejecutar(tamanos, casos, args.repeticiones)
+
+    salida = args.salida or os.path.join(os.path.dirname(__file__), "resultados", f"{reporte['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(salida)), exist_ok=True)
+    with open(salida, "w") as f:
+        json.dump(reporte, f, indent=2)
+    print(f"Resultados guardados en {salida}", file=sys.stderr)
+
+    # Regresión de tiempo de arranque: el núcleo no debe importar scipy/matplotlib/rich
+    if reporte["importacion"]["modulos_pesados"]:
+        sys.exit(f"El núcleo importó módulos pesados: {', '.join(reporte['importacion']['modulos_pesados'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import math
+import numpy as np
+
+
+class AcumuladorRegresion:
+    """
+    Acumula por bloques los estadísticos suficientes de una regresión lineal simple.
+
+    Guarda únicamente n, las medias y los co-momentos centrados (Sxx, Syy, Sxy),
+    por lo que la memoria es constante sin importar cuántos datos se agreguen.
+    Los bloques se combinan con la fórmula de Chan et al., que es estable
+    numéricamente, y dos acumuladores se pueden fusionar con `combinar`.
+
+    Parámetros:
+      - dtype: Precisión de trabajo de los bloques (por defecto float64). Los datos en
+        float32 se convierten bloque por bloque, nunca el arreglo completo.
+    """
+
+    def __init__(self, dtype=np.float64):
+        self.dtype = np.dtype(dtype)
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.Sxx = 0.0
+        self.Syy = 0.0
+        self.Sxy = 0.0
+
+    def agregar(self, x_arr, y_arr, bloque=1 << 14):
+        """
+        Agrega datos al acumulador en una sola pasada por bloques.
+
+        Cada bloque es lo bastante pequeño para quedarse en caché: se calcula su media,
+        se centra en dos buffers reutilizables y se obtienen Sxx, Syy y Sxy con productos
+        punto. No se crean temporales del tamaño de los datos y el resultado es
+        equivalente al de centrar todo el arreglo (dos pasadas).
+
+        Parámetros:
+          - x_arr: Valores de la variable independiente.
+          - y_arr: Valores de la variable dependiente.
+          - bloque: Cantidad de datos que se procesan a la vez.
+
+        Retorna:
+          - El mismo acumulador (para poder encadenar llamadas).
+        """
+        x = np.asarray(x_arr).ravel()
+        y = np.asarray(y_arr).ravel()
+
+        if len(x) != len(y):
+            raise ValueError("Los bloques de x y y deben tener la misma longitud.")
+
+        n = len(x)
+        if n == 0:
+            return self
+
+        tamano = min(bloque, n)
+        dx = np.empty(tamano, dtype=self.dtype)
+        dy = np.empty(tamano, dtype=self.dtype)
+
+        for i in range(0, n, bloque):
+            xb = x[i:i + bloque]
+            yb = y[i:i + bloque]
+            m = len(xb)
+            dx_b = dx[:m]
+            dy_b = dy[:m]
+
+            mean_x = float(np.sum(xb, dtype=np.float64)) / m
+            mean_y = float(np.sum(yb, dtype=np.float64)) / m
+
+            # La resta se hace directo en la precisión de trabajo, sin convertir el bloque antes
+            np.subtract(xb, mean_x, out=dx_b, dtype=self.dtype, casting="unsafe")
+            np.subtract(yb, mean_y, out=dy_b, dtype=self.dtype, casting="unsafe")
+
+            self._combinar_momentos(m, mean_x, mean_y, float(np.dot(dx_b, dx_b)), float(np.dot(dy_b, dy_b)), float(np.dot(dx_b, dy_b)))
+
+        return self
+
+    def combinar(self, otro):
+        """
+        Fusiona otro acumulador dentro de este.
+
+        Parámetros:
+          - otro: AcumuladorRegresion con datos de otro bloque o de otro proceso.
+
+        Retorna:
+          - El mismo acumulador ya fusionado.
+        """
+        self._combinar_momentos(otro.n, otro.mean_x, otro.mean_y, otro.Sxx, otro.Syy, otro.Sxy)
+        return self
+
+    def _combinar_momentos(self, n_b, mean_x_b, mean_y_b, Sxx_b, Syy_b, Sxy_b):
+        """Combina los momentos de un bloque con los acumulados (Chan et al.)."""
+        if n_b == 0:
+            return
+
+        if self.n == 0:
+            self.n = n_b
+            self.mean_x, self.mean_y = mean_x_b, mean_y_b
+            self.Sxx, self.Syy, self.Sxy = Sxx_b, Syy_b, Sxy_b
+            return
+
+        n_a = self.n
+        n = n_a + n_b
+        delta_x = mean_x_b - self.mean_x
+        delta_y = mean_y_b - self.mean_y
+        factor = n_a * n_b / n
+
+        self.mean_x += delta_x * n_b / n
+        self.mean_y += delta_y * n_b / n
+        self.Sxx += Sxx_b + delta_x * delta_x * factor
+        self.Syy += Syy_b + delta_y * delta_y * factor
+        self.Sxy += Sxy_b + delta_x * delta_y * factor
+        self.n = n
+
+    def quitar(self, x_arr, y_arr):
+        """
+        Quita del acumulador datos que se habían agregado antes (por ejemplo, los que salen
+        de una ventana móvil).
+
+        Parámetros:
+          - x_arr: Valores de la variable independiente a quitar.
+          - y_arr: Valores de la variable dependiente a quitar.
+
+        Retorna:
+          - El mismo acumulador sin esos datos.
+        """
+        bloque = AcumuladorRegresion(self.dtype).agregar(x_arr, y_arr)
+        self._quitar_momentos(bloque.n, bloque.mean_x, bloque.mean_y, bloque.Sxx, bloque.Syy, bloque.Sxy)
+        return self
+
+    def _quitar_momentos(self, n_b, mean_x_b, mean_y_b, Sxx_b, Syy_b, Sxy_b):
+        """Operación inversa de _combinar_momentos: separa un bloque de los acumulados."""
+        if n_b == 0:
+            return
+        if n_b > self.n:
+            raise ValueError("No se pueden quitar más datos de los que hay en el acumulador.")
+
+        n = self.n
+        n_a = n - n_b
+        if n_a == 0:
+            self.n = 0
+            self.mean_x = self.mean_y = 0.0
+            self.Sxx = self.Syy = self.Sxy = 0.0
+            return
+
+        mean_x_a = (n * self.mean_x - n_b * mean_x_b) / n_a
+        mean_y_a = (n * self.mean_y - n_b * mean_y_b) / n_a
+        delta_x = mean_x_b - mean_x_a
+        delta_y = mean_y_b - mean_y_a
+        factor = n_a * n_b / n
+
+        self.mean_x, self.mean_y = mean_x_a, mean_y_a
+        # max(0, ...) por errores de redondeo al restar
+        self.Sxx = max(0.0, self.Sxx - Sxx_b - delta_x * delta_x * factor)
+        self.Syy = max(0.0, self.Syy - Syy_b - delta_y * delta_y * factor)
+        self.Sxy -= Sxy_b + delta_x * delta_y * factor
+        self.n = n_a
+
+    # Sumas equivalentes a las que se calculan con los arreglos completos
+    @property
+    def sum_x(self):
+        return self.n * self.mean_x
+
+    @property
+    def sum_y(self):
+        return self.n * self.mean_y
+
+    @property
+    def sum_x2(self):
+        return self.Sxx + self.n * self.mean_x ** 2
+
+    @property
+    def sum_y2(self):
+        return self.Syy + self.n * self.mean_y ** 2
+
+    @property
+    def sum_xy(self):
+        return self.Sxy + self.n * self.mean_x * self.mean_y
+
+    @property
+    def r(self):
+        """Coeficiente de correlación de Pearson (nan si alguna varianza es cero)."""
+        denominador = math.sqrt(self.Sxx * self.Syy)
+        if denominador == 0:
+            return float("nan")
+        # Se recorta por errores de redondeo que lo saquen de [-1, 1]
+        return max(-1.0, min(1.0, self.Sxy / denominador))
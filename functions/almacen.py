@@ -0,0 +1,299 @@
+import json
+import os
+from enum import IntEnum
+import numpy as np
+from .coeficiente_correlacion import CodigoCorrelacion, codigos_correlacion, concluir_correlacion
+
+
+class CodigoPrueba(IntEnum):
+    """Resultado de una prueba de hipótesis como código pequeño."""
+    NO_APLICA = 0     # No hay grados de libertad (n <= 2) o SCE = 0
+    NO_RECHAZA = 1
+    RECHAZA = 2
+
+
+# Estadístico usado: código -> texto
+_STAT_USED = ("", "t", "z")
+
+# Campos de cada resultado: (grupo de resultados, llave, tipo)
+CAMPOS = (
+    (None, "n", np.int64),
+    (None, "alpha", np.float64),
+    ("correlacion", "r", np.float64),
+    ("regresion", "sum_x", np.float64),
+    ("regresion", "sum_y", np.float64),
+    ("regresion", "mean_x", np.float64),
+    ("regresion", "mean_y", np.float64),
+    ("regresion", "sum_x2", np.float64),
+    ("regresion", "sum_y2", np.float64),
+    ("regresion", "sum_xy", np.float64),
+    ("regresion", "Sxx", np.float64),
+    ("regresion", "Syy", np.float64),
+    ("regresion", "Sxy", np.float64),
+    ("regresion", "a", np.float64),
+    ("regresion", "b", np.float64),
+    ("determinacion", "r_squared", np.float64),
+    ("determinacion", "SCE", np.float64),
+    ("determinacion", "CMT", np.float64),
+    ("determinacion", "CME", np.float64),
+    ("determinacion", "r_squared_adj", np.float64),
+    ("prueba_beta", "error_std_b", np.float64),
+    ("prueba_beta", "ep_b", np.float64),
+    ("prueba_beta", "p_valor_beta", np.float64),
+    ("prueba_rho", "error_std_r", np.float64),
+    ("prueba_rho", "ep_r", np.float64),
+    ("prueba_rho", "p_valor_rho", np.float64),
+    (None, "stat_tabla", np.float64),
+    (None, "stat_used", np.int8),
+    (None, "codigo_correlacion", np.int8),
+    (None, "codigo_beta", np.int8),
+    (None, "codigo_rho", np.int8),
+)
+
+# Un registro por regresión (220 bytes, sin textos ni diccionarios)
+DTYPE_RESULTADO = np.dtype([(llave, tipo) for _, llave, tipo in CAMPOS])
+
+
+class ResultadoRegresion:
+    """
+    Resultado compacto de una regresión: solo números y códigos, sin los datos ni los textos.
+
+    Las conclusiones se redactan hasta que se piden con `resultados()`, que arma el mismo
+    diccionario anidado que RegresionLineal.resultados.
+    """
+
+    __slots__ = tuple(llave for _, llave, _ in CAMPOS) + ("var_ind", "var_dep")
+
+    def __init__(self, registro, var_ind=None, var_dep=None):
+        """
+        Parámetros:
+          - registro: Elemento de un arreglo con DTYPE_RESULTADO (o una tupla con los campos en orden).
+          - var_ind, var_dep: Nombres de las variables (para redactar la conclusión de la correlación).
+        """
+        for (_, llave, _), valor in zip(CAMPOS, registro.tolist() if hasattr(registro, "tolist") else registro):
+            setattr(self, llave, valor)
+        self.var_ind = var_ind
+        self.var_dep = var_dep
+
+    @classmethod
+    def desde_regresion(cls, regresion):
+        """Compacta un RegresionLineal (sus resultados ya calculados o perezosos)."""
+        return cls(_registro_desde_regresion(regresion), regresion.var_ind, regresion.var_dep)
+
+    def registro(self):
+        """Retorna los campos como un registro de NumPy con DTYPE_RESULTADO."""
+        return np.array(tuple(getattr(self, llave) for _, llave, _ in CAMPOS), dtype=DTYPE_RESULTADO)
+
+    @property
+    def stat_used_texto(self):
+        return _STAT_USED[self.stat_used]
+
+    @property
+    def clasificacion(self):
+        return CodigoCorrelacion(self.codigo_correlacion)
+
+    def resultados(self):
+        """
+        Arma el diccionario de resultados con las conclusiones en texto.
+
+        Retorna:
+          - Un diccionario con la misma estructura que RegresionLineal.resultados.
+        """
+        from .regresion_lineal import concluir_prueba
+
+        resultados = {grupo: {} for grupo, _, _ in CAMPOS if grupo}
+        for grupo, llave, _ in CAMPOS:
+            if grupo:
+                resultados[grupo][llave.replace("_beta", "").replace("_rho", "")] = getattr(self, llave)
+
+        resultados["correlacion"]["conclusion"] = concluir_correlacion(
+            self.r, self.var_ind or "(variable independiente)", self.var_dep or "(variable dependiente)")
+
+        for grupo, llave_ep, codigo, parametro in (("prueba_beta", "ep_b", self.codigo_beta, "β"),
+                                                   ("prueba_rho", "ep_r", self.codigo_rho, "ρ")):
+            resultados[grupo]["stat_tabla"] = self.stat_tabla
+            resultados[grupo]["stat_used"] = self.stat_used_texto
+            resultados[grupo]["conclusion"] = (
+                "" if codigo == CodigoPrueba.NO_APLICA else concluir_prueba(getattr(self, llave_ep), self.stat_tabla, parametro))
+
+        return resultados
+
+    def __repr__(self):
+        return f"ResultadoRegresion(n={self.n}, a={self.a:.4f}, b={self.b:.4f}, r={self.r:.4f})"
+
+
+def _codigo_prueba(estadistico, stat_tabla):
+    """Código vectorizado de una prueba de dos colas (NO_APLICA donde el estadístico es nan)."""
+    estadistico = np.asarray(estadistico, dtype=np.float64)
+    codigos = np.where(np.abs(estadistico) > stat_tabla, CodigoPrueba.RECHAZA, CodigoPrueba.NO_RECHAZA)
+    return np.where(np.isnan(estadistico), CodigoPrueba.NO_APLICA, codigos).astype(np.int8)
+
+
+def _registro_desde_regresion(regresion):
+    """Llena un registro con los resultados de un RegresionLineal (nan donde no se calculó)."""
+    resultados = regresion.resultados
+    registro = np.zeros((), dtype=DTYPE_RESULTADO)
+    registro["n"] = regresion.n
+    registro["alpha"] = regresion.alpha
+
+    for grupo, llave, _ in CAMPOS:
+        if grupo:
+            valor = resultados.get(grupo)[llave.replace("_beta", "").replace("_rho", "")]
+            registro[llave] = valor if not isinstance(valor, str) else np.nan
+
+    # Los valores que la regresión no llega a calcular se quedan en 0 en la plantilla
+    beta, rho = resultados.get("prueba_beta"), resultados.get("prueba_rho")
+    if not beta.get("conclusion"):
+        for llave in ("error_std_b", "ep_b", "p_valor_beta"):
+            registro[llave] = np.nan
+    if not rho.get("conclusion"):
+        for llave in ("error_std_r", "ep_r", "p_valor_rho"):
+            registro[llave] = np.nan
+
+    registro["stat_tabla"] = beta["stat_tabla"]
+    registro["stat_used"] = _STAT_USED.index(beta["stat_used"])
+    registro["codigo_correlacion"] = codigos_correlacion(registro["r"])
+    registro["codigo_beta"] = _codigo_prueba(registro["ep_b"], registro["stat_tabla"])
+    registro["codigo_rho"] = _codigo_prueba(registro["ep_r"], registro["stat_tabla"])
+    return registro
+
+
+class AlmacenResultados:
+    """
+    Muchos resultados de regresiones guardados como columnas de un solo arreglo estructurado de NumPy.
+
+    Cada regresión ocupa un registro de tamaño fijo (DTYPE_RESULTADO); las conclusiones se
+    guardan como códigos (CodigoCorrelacion, CodigoPrueba) y se redactan solo al pedir un
+    resultado. Se puede guardar en un archivo .npy y abrirlo con memory-map sin copiarlo.
+
+    Parámetros:
+      - capacidad: Cantidad de registros a reservar desde el inicio.
+      - var_ind, var_dep: Nombres de las variables (compartidos por todo el almacén).
+    """
+
+    def __init__(self, capacidad=0, var_ind=None, var_dep=None):
+        self._datos = np.zeros(capacidad, dtype=DTYPE_RESULTADO)
+        self._n = 0
+        self.var_ind = var_ind
+        self.var_dep = var_dep
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def datos(self):
+        """Vista del arreglo estructurado con los registros ocupados."""
+        return self._datos[:self._n]
+
+    @property
+    def nbytes(self):
+        return self.datos.nbytes
+
+    def columna(self, llave):
+        """Vista (sin copia) de un campo de todos los registros, por ejemplo columna("b")."""
+        return self.datos[llave]
+
+    def __getitem__(self, i):
+        if not -self._n <= i < self._n:
+            raise IndexError(i)
+        return ResultadoRegresion(self.datos[i], self.var_ind, self.var_dep)
+
+    def _reservar(self, cantidad):
+        """Amplía el arreglo (al doble) si no caben `cantidad` registros más."""
+        if self._n + cantidad <= len(self._datos):
+            return
+        if not self._datos.flags.writeable:
+            raise ValueError("El almacén se abrió con memory-map de solo lectura.")
+
+        nuevo = np.zeros(max(self._n + cantidad, 2 * len(self._datos), 16), dtype=DTYPE_RESULTADO)
+        nuevo[:self._n] = self._datos[:self._n]
+        self._datos = nuevo
+
+    def agregar(self, resultado):
+        """
+        Agrega un resultado.
+
+        Parámetros:
+          - resultado: RegresionLineal o ResultadoRegresion.
+
+        Retorna:
+          - El índice del registro agregado.
+        """
+        registro = resultado.registro() if isinstance(resultado, ResultadoRegresion) else _registro_desde_regresion(resultado)
+        self._reservar(1)
+        self._datos[self._n] = registro
+        self._n += 1
+        return self._n - 1
+
+    def agregar_lote(self, lote, niv_significancia=0.05):
+        """
+        Agrega de forma vectorizada los resultados de ajustar_lote, ajustar_por_grupo o regresion_movil.
+
+        Parámetros:
+          - lote: Diccionario de arreglos con los estadísticos de estadisticos_desde_momentos.
+          - niv_significancia: Nivel de significancia con el que se calculó el lote.
+
+        Retorna:
+          - El rango de índices agregados.
+        """
+        cantidad = len(lote["n"])
+        self._reservar(cantidad)
+        destino = self._datos[self._n:self._n + cantidad]
+
+        n = lote["n"]
+        destino["n"] = n
+        destino["alpha"] = niv_significancia
+        destino["sum_x"] = n * lote["mean_x"]
+        destino["sum_y"] = n * lote["mean_y"]
+        destino["sum_x2"] = lote["Sxx"] + n * lote["mean_x"] ** 2
+        destino["sum_y2"] = lote["Syy"] + n * lote["mean_y"] ** 2
+        destino["sum_xy"] = lote["Sxy"] + n * lote["mean_x"] * lote["mean_y"]
+        for llave in ("r", "mean_x", "mean_y", "Sxx", "Syy", "Sxy", "a", "b", "r_squared", "SCE", "CMT", "CME",
+                      "r_squared_adj", "error_std_b", "ep_b", "p_valor_beta", "error_std_r", "ep_r", "p_valor_rho", "stat_tabla"):
+            destino[llave] = lote[llave]
+
+        destino["stat_used"] = np.select([lote["stat_used"] == "t", lote["stat_used"] == "z"], [1, 2], 0)
+        destino["codigo_correlacion"] = codigos_correlacion(lote["r"])
+        destino["codigo_beta"] = _codigo_prueba(lote["ep_b"], lote["stat_tabla"])
+        destino["codigo_rho"] = _codigo_prueba(lote["ep_r"], lote["stat_tabla"])
+
+        inicio = self._n
+        self._n += cantidad
+        return range(inicio, self._n)
+
+    def guardar(self, ruta):
+        """
+        Guarda los registros en un archivo .npy (y los nombres de las variables en ruta + ".json").
+
+        Parámetros:
+          - ruta: Ruta del archivo .npy.
+        """
+        np.save(ruta, self.datos, allow_pickle=False)
+        with open(f"{ruta}.json", "w", encoding="utf-8") as archivo:
+            json.dump({"var_ind": self.var_ind, "var_dep": self.var_dep}, archivo, ensure_ascii=False)
+
+    @classmethod
+    def cargar(cls, ruta, mmap=True):
+        """
+        Abre un almacén guardado con `guardar`.
+
+        Parámetros:
+          - ruta: Ruta del archivo .npy.
+          - mmap: Si es True el archivo se abre con memory-map de solo lectura (sin copiarlo a memoria).
+
+        Retorna:
+          - Un AlmacenResultados.
+        """
+        datos = np.load(ruta, mmap_mode="r" if mmap else None, allow_pickle=False)
+        if datos.dtype != DTYPE_RESULTADO:
+            raise ValueError(f"{ruta} no es un almacén de resultados.")
+
+        nombres = {}
+        if os.path.exists(f"{ruta}.json"):
+            with open(f"{ruta}.json", encoding="utf-8") as archivo:
+                nombres = json.load(archivo)
+
+        almacen = cls(0, nombres.get("var_ind"), nombres.get("var_dep"))
+        almacen._datos = datos
+        almacen._n = len(datos)
+        return almacen
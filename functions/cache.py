@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+from collections import OrderedDict
+import numpy as np
+from .entrada import como_arreglo
+
+
+def llave_cache(x_arr, y_arr, **opciones):
+    """
+    Calcula una llave que identifica el contenido de los datos y las opciones del análisis.
+
+    Se hashean directamente los bytes de los arreglos (con su tipo y forma) con BLAKE2b,
+    sin convertirlos a texto; si los arreglos ya son contiguos no se copian. Las rutas a
+    archivos .npy se resuelven con como_arreglo, así la llave depende de los datos y no de la ruta.
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - opciones: Todo lo demás que cambia el resultado (nivel de significancia, títulos, etc.).
+
+    Retorna:
+      - La llave como texto hexadecimal.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    for arr, nombre in ((x_arr, "x_arr"), (y_arr, "y_arr")):
+        # Las rutas .npy se abren para hashear su contenido (si el archivo cambia, cambia la llave)
+        arr = np.ascontiguousarray(como_arreglo(arr, nombre))
+        h.update(f"{arr.dtype.str}{arr.shape}".encode())
+        h.update(memoryview(arr).cast("B"))
+    h.update(json.dumps(opciones, sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+
+class CacheResultados:
+    """
+    Caché de resultados de regresiones en dos niveles: memoria (LRU) y disco (limitado en bytes).
+
+    Cada entrada guarda los `resultados` y los artefactos ya generados (por ejemplo el PNG
+    del diagrama de dispersión) como bytes. Al consultar una llave se busca primero en memoria
+    y luego en disco; lo que se encuentra en disco se sube a memoria.
+
+    Parámetros:
+      - directorio: Carpeta del nivel en disco (None para usar solo memoria).
+      - max_entradas: Cantidad de entradas que se mantienen en memoria.
+      - max_bytes_disco: Tamaño máximo del nivel en disco; se borran primero las entradas usadas hace más tiempo.
+    """
+
+    def __init__(self, directorio=None, max_entradas=128, max_bytes_disco=512 * 1024 ** 2):
+        self.directorio = os.path.expanduser(directorio) if directorio else None
+        self.max_entradas = max_entradas
+        self.max_bytes_disco = max_bytes_disco
+
+        self._memoria = OrderedDict()
+        # obtener/guardar pueden llamarse desde el hilo de fondo de ejecutar_regresion_en_fondo
+        self._candado = threading.RLock()
+        self.estadisticas = {"aciertos_memoria": 0, "aciertos_disco": 0, "fallos": 0}
+
+        if self.directorio:
+            os.makedirs(self.directorio, exist_ok=True)
+
+    def obtener(self, llave):
+        """
+        Busca una entrada.
+
+        Parámetros:
+          - llave: Llave calculada con llave_cache.
+
+        Retorna:
+          - Un diccionario {"resultados", "artefactos"} o None si no está en caché.
+        """
+        with self._candado:
+            entrada = self._memoria.get(llave)
+            if entrada is not None:
+                self._memoria.move_to_end(llave)
+                self.estadisticas["aciertos_memoria"] += 1
+                return entrada
+
+            entrada = self._leer_disco(llave)
+            if entrada is not None:
+                self._guardar_memoria(llave, entrada)
+                self.estadisticas["aciertos_disco"] += 1
+                return entrada
+
+            self.estadisticas["fallos"] += 1
+            return None
+
+    def guardar(self, llave, resultados, artefactos=None):
+        """
+        Guarda una entrada en memoria y, si hay directorio, en disco.
+
+        Parámetros:
+          - llave: Llave calculada con llave_cache.
+          - resultados: Diccionario de resultados de la regresión.
+          - artefactos: Diccionario {nombre: bytes} con los archivos generados.
+        """
+        entrada = {"resultados": resultados, "artefactos": artefactos or {}}
+        with self._candado:
+            self._guardar_memoria(llave, entrada)
+            if self.directorio:
+                self._escribir_disco(llave, entrada)
+
+    def limpiar(self):
+        """Borra todas las entradas, en memoria y en disco."""
+        with self._candado:
+            self._memoria.clear()
+            if self.directorio:
+                for nombre in os.listdir(self.directorio):
+                    shutil.rmtree(os.path.join(self.directorio, nombre), ignore_errors=True)
+
+    def _guardar_memoria(self, llave, entrada):
+        """Inserta en el nivel de memoria y descarta la entrada usada hace más tiempo si se excede."""
+        self._memoria[llave] = entrada
+        self._memoria.move_to_end(llave)
+        while len(self._memoria) > self.max_entradas:
+            self._memoria.popitem(last=False)
+
+    def _ruta(self, llave):
+        return os.path.join(self.directorio, llave)
+
+    def _leer_disco(self, llave):
+        """Lee una entrada del disco (None si no existe o está incompleta)."""
+        if not self.directorio:
+            return None
+
+        ruta = self._ruta(llave)
+        try:
+            with open(os.path.join(ruta, "resultados.pickle"), "rb") as archivo:
+                resultados = pickle.load(archivo)
+            artefactos = {}
+            for nombre in os.listdir(ruta):
+                if nombre != "resultados.pickle":
+                    with open(os.path.join(ruta, nombre), "rb") as archivo:
+                        artefactos[nombre] = archivo.read()
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+        # Marca la entrada como usada recientemente para el desalojo del disco
+        os.utime(ruta)
+        return {"resultados": resultados, "artefactos": artefactos}
+
+    def _escribir_disco(self, llave, entrada):
+        """Escribe una entrada en su carpeta (de forma atómica) y respeta el tamaño máximo."""
+        ruta = self._ruta(llave)
+        temporal = f"{ruta}.tmp{os.getpid()}"
+        os.makedirs(temporal, exist_ok=True)
+
+        with open(os.path.join(temporal, "resultados.pickle"), "wb") as archivo:
+            pickle.dump(entrada["resultados"], archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        for nombre, datos in entrada["artefactos"].items():
+            with open(os.path.join(temporal, nombre), "wb") as archivo:
+                archivo.write(datos)
+
+        shutil.rmtree(ruta, ignore_errors=True)
+        os.replace(temporal, ruta)
+        self._desalojar_disco()
+
+    def _desalojar_disco(self):
+        """Borra las entradas usadas hace más tiempo hasta quedar debajo de max_bytes_disco."""
+        entradas = []
+        total = 0
+        for nombre in os.listdir(self.directorio):
+            ruta = os.path.join(self.directorio, nombre)
+            if not os.path.isdir(ruta) or ".tmp" in nombre:
+                continue
+            tamano = sum(entrada.stat().st_size for entrada in os.scandir(ruta))
+            entradas.append((os.stat(ruta).st_mtime, tamano, ruta))
+            total += tamano
+
+        for _, tamano, ruta in sorted(entradas):
+            if total <= self.max_bytes_disco:
+                break
+            shutil.rmtree(ruta, ignore_errors=True)
+            total -= tamano
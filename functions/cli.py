@@ -0,0 +1,319 @@
+"""
+Ajuste en lote de archivos CSV/NPY desde la línea de comandos.
+
+Uso:
+    python -m functions datos/ --x temperatura --y consumo --salida resultados.jsonl
+    python -m functions "datos/*.csv" --x 0 --y 2 --trabajadores 8 --graficos graficos/ --reanudar
+    python -m functions datos/*.npy --memoria-acotada
+
+Cada archivo produce una línea JSON en la salida, en cuanto termina. Con --reanudar se
+omiten los archivos que ya aparecen en la salida, así se puede continuar después de un fallo.
+"""
+import argparse
+import glob
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+import numpy as np
+from .entrada import validar_datos
+from .reportes import valor_plano
+
+EXTENSIONES = (".csv", ".npy")
+
+
+def buscar_archivos(entradas):
+    """
+    Expande directorios y patrones glob a una lista ordenada de archivos CSV/NPY (sin repetidos).
+
+    Parámetros:
+      - entradas: Lista de rutas, directorios o patrones glob.
+
+    Retorna:
+      - La lista de rutas de archivos.
+    """
+    archivos = []
+    for entrada in entradas:
+        entrada = os.path.expanduser(entrada)
+        if os.path.isdir(entrada):
+            candidatos = sorted(os.path.join(entrada, nombre) for nombre in os.listdir(entrada))
+        else:
+            candidatos = sorted(glob.glob(entrada)) or [entrada]
+        archivos.extend(c for c in candidatos if c.lower().endswith(EXTENSIONES))
+
+    return list(dict.fromkeys(archivos))
+
+
+def _leer_bloques(ruta, columna_x, columna_y, bloque):
+    """
+    Genera los datos de un archivo en bloques (x, y) de a lo más `bloque` filas.
+
+    Los CSV se leen por partes con np.loadtxt; si la primera fila no son números se toma como
+    encabezado con los nombres de las columnas (sin encabezado, las columnas se indican por número).
+    Los NPY deben ser 2-D y se abren con memory-map. Cada bloque se valida con
+    entrada.validar_datos (sin nan ni infinitos) y un archivo sin filas de datos es un error.
+    """
+    filas = 0
+    for x, y in _bloques_archivo(ruta, columna_x, columna_y, bloque):
+        try:
+            validar_datos(x, y)
+        except ValueError as e:
+            raise ValueError(f"{ruta} (bloque desde la fila de datos {filas}): {e}") from None
+        filas += len(x)
+        yield x, y
+
+    if filas == 0:
+        raise ValueError(f"{ruta}: el archivo no tiene filas de datos.")
+
+
+def _bloques_archivo(ruta, columna_x, columna_y, bloque):
+    """Genera los bloques (x, y) de un CSV o NPY tal como se leen, sin validarlos."""
+    if ruta.lower().endswith(".npy"):
+        datos = np.load(ruta, mmap_mode="r")
+        if datos.ndim != 2:
+            raise ValueError(f"{ruta}: se esperaba un arreglo 2-D (filas × columnas).")
+        ix, iy = int(columna_x), int(columna_y)
+        for i in range(0, len(datos), bloque):
+            yield datos[i:i + bloque, ix], datos[i:i + bloque, iy]
+        return
+
+    with open(ruta, encoding="utf-8") as archivo:
+        primera = archivo.readline()
+        if not primera.strip():
+            return
+        campos = [nombre.strip() for nombre in primera.split(",")]
+
+        # La primera fila es encabezado solo si no son puros números; si no, es el primer dato
+        if _son_numeros(campos):
+            encabezado, lineas_archivo = [], itertools.chain([primera], archivo)
+        else:
+            encabezado, lineas_archivo = campos, archivo
+        ix, iy = (_indice_columna(encabezado, columna, ruta) for columna in (columna_x, columna_y))
+
+        while True:
+            lineas = list(itertools.islice(lineas_archivo, bloque))
+            if not lineas:
+                break
+            datos = np.loadtxt(lineas, delimiter=",", usecols=(ix, iy), ndmin=2)
+            yield datos[:, 0], datos[:, 1]
+
+
+def _son_numeros(campos):
+    """True si todos los campos de una fila del CSV se pueden leer como números."""
+    try:
+        for campo in campos:
+            float(campo)
+    except ValueError:
+        return False
+    return True
+
+
+def _indice_columna(encabezado, columna, ruta):
+    """Posición de una columna del CSV, ya sea por nombre o por número."""
+    if columna in encabezado:
+        return encabezado.index(columna)
+    if str(columna).isdigit():
+        return int(columna)
+    if not encabezado:
+        raise ValueError(f"{ruta}: el archivo no tiene encabezado, indica la columna {columna!r} por número.")
+    raise ValueError(f"{ruta}: no existe la columna {columna!r} (columnas: {', '.join(encabezado)}).")
+
+
+def procesar_archivo(ruta, opciones):
+    """
+    Ajusta la regresión de un archivo y, si se pidió, guarda su gráfico y su reporte.
+
+    Parámetros:
+      - ruta: Archivo CSV o NPY.
+      - opciones: Diccionario con x, y, niv_significancia, bloque, memoria_acotada,
+        graficos, reportes y formato.
+
+    Retorna:
+      - Un diccionario {"archivo", "ok", "error", "tiempo_s", "n", "resultados"} listo para JSON.
+    """
+    from .acumulador import AcumuladorRegresion
+    from .regresion_lineal import RegresionLineal
+    from .reportes import datos_reporte, escribir_reporte
+
+    inicio = time.perf_counter()
+    estado = {"archivo": ruta, "ok": True, "error": None, "tiempo_s": 0.0, "n": 0, "resultados": None}
+    var_ind, var_dep = str(opciones["x"]), str(opciones["y"])
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+
+    try:
+        bloques = _leer_bloques(ruta, opciones["x"], opciones["y"], opciones["bloque"])
+
+        if opciones["memoria_acotada"]:
+            # Solo se guardan los momentos: la memoria no depende del tamaño del archivo
+            acumulador = AcumuladorRegresion()
+            for x, y in bloques:
+                acumulador.agregar(x, y)
+            regresion = RegresionLineal.desde_acumulador(acumulador, var_ind, var_dep, opciones["niv_significancia"])
+        else:
+            partes = list(bloques)
+            x = np.concatenate([x for x, _ in partes])
+            y = np.concatenate([y for _, y in partes])
+            regresion = RegresionLineal(x, y, var_ind, var_dep, opciones["niv_significancia"])
+
+        if opciones["graficos"] and regresion.x is not None:
+            regresion.mostrar_grafico(save_path=os.path.join(opciones["graficos"], f"{nombre}.png"))
+        if opciones["reportes"]:
+            extension = {"texto": "txt", "json": "json", "html": "html"}[opciones["formato"]]
+            escribir_reporte(regresion, opciones["formato"], os.path.join(opciones["reportes"], f"{nombre}.{extension}"))
+
+        datos = datos_reporte(regresion)
+        estado["n"] = datos["n"]
+        estado["resultados"] = datos["resultados"]
+    except Exception as e:
+        estado["ok"] = False
+        estado["error"] = repr(e)
+
+    estado["tiempo_s"] = time.perf_counter() - inicio
+    return estado
+
+
+def archivos_terminados(salida):
+    """
+    Lee una salida JSON Lines anterior y retorna los archivos que ya se procesaron bien.
+
+    Una última línea incompleta (por ejemplo, si el proceso se interrumpió) se ignora.
+    """
+    terminados = set()
+    if not salida or salida == "-" or not os.path.exists(salida):
+        return terminados
+
+    with open(salida, encoding="utf-8") as archivo:
+        for linea in archivo:
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                continue
+            if registro.get("ok"):
+                terminados.add(registro["archivo"])
+
+    return terminados
+
+
+def ejecutar_lote(archivos, opciones, salida="-", trabajadores=None, reanudar=False, progreso=True):
+    """
+    Procesa muchos archivos en un pool de procesos y escribe una línea JSON por archivo.
+
+    Solo hay `2 × trabajadores` archivos en proceso a la vez, así la memoria del lote no
+    crece con la cantidad de archivos.
+
+    Parámetros:
+      - archivos: Lista de rutas.
+      - opciones: Opciones de procesar_archivo.
+      - salida: Ruta del archivo JSON Lines ("-" para la salida estándar).
+      - trabajadores: Cantidad de procesos (por defecto, los núcleos disponibles; 1 = sin pool).
+      - reanudar: Si es True se omiten los archivos que ya están en la salida y se agrega al final.
+      - progreso: Si es True se muestra el avance en stderr.
+
+    Retorna:
+      - Una tupla (procesados, con error, omitidos).
+    """
+    omitidos = archivos_terminados(salida) if reanudar else set()
+    pendientes = [ruta for ruta in archivos if ruta not in omitidos]
+    total = len(pendientes)
+
+    for carpeta in (opciones["graficos"], opciones["reportes"]):
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+
+    destino = sys.stdout if salida == "-" else open(salida, "a" if reanudar else "w", encoding="utf-8")
+    if reanudar and destino.tell() > 0:
+        # Si la última línea quedó cortada se termina, para que la siguiente empiece en su propia línea
+        with open(salida, "rb") as anterior:
+            anterior.seek(-1, os.SEEK_END)
+            if anterior.read(1) != b"\n":
+                destino.write("\n")
+    hechos = errores = 0
+    inicio = time.perf_counter()
+
+    def registrar(estado):
+        nonlocal hechos, errores
+        hechos += 1
+        errores += not estado["ok"]
+        # NaN e infinito (por ejemplo r de una columna constante) no son JSON válido: se escriben como null
+        destino.write(json.dumps(valor_plano(estado), ensure_ascii=False, allow_nan=False) + "\n")
+        destino.flush()  # Cada línea queda completa en disco para poder reanudar
+        if progreso:
+            transcurrido = time.perf_counter() - inicio
+            print(f"[{hechos}/{total}] {'ok' if estado['ok'] else 'error'} {estado['archivo']} "
+                  f"({estado['tiempo_s']:.2f} s, {hechos / transcurrido:.1f} archivos/s)", file=sys.stderr)
+
+    try:
+        trabajadores = trabajadores or os.cpu_count() or 1
+        if trabajadores == 1:
+            for ruta in pendientes:
+                registrar(procesar_archivo(ruta, opciones))
+        else:
+            with ProcessPoolExecutor(max_workers=trabajadores) as executor:
+                restantes = iter(pendientes)
+                en_proceso = {}
+
+                while True:
+                    for ruta in itertools.islice(restantes, 2 * trabajadores - len(en_proceso)):
+                        en_proceso[executor.submit(procesar_archivo, ruta, opciones)] = ruta
+                    if not en_proceso:
+                        break
+
+                    listos, _ = wait(en_proceso, return_when=FIRST_COMPLETED)
+                    for futuro in listos:
+                        ruta = en_proceso.pop(futuro)
+                        try:
+                            estado = futuro.result()
+                        except Exception as e:
+                            # Por ejemplo, si el proceso trabajador murió
+                            estado = {"archivo": ruta, "ok": False, "error": repr(e), "tiempo_s": 0.0, "n": 0, "resultados": None}
+                        registrar(estado)
+    finally:
+        if destino is not sys.stdout:
+            destino.close()
+
+    return hechos, errores, len(archivos) - total
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog="python -m functions", description="Regresión lineal en lote sobre archivos CSV/NPY")
+    parser.add_argument("entradas", nargs="+", help="Archivos, directorios o patrones glob")
+    parser.add_argument("--x", default="0", help="Columna de la variable independiente (nombre o número)")
+    parser.add_argument("--y", default="1", help="Columna de la variable dependiente (nombre o número)")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Nivel de significancia")
+    parser.add_argument("--salida", default="-", help="Archivo JSON Lines de resultados (por defecto, la salida estándar)")
+    parser.add_argument("--trabajadores", type=int, default=None, help="Cantidad de procesos")
+    parser.add_argument("--graficos", help="Carpeta donde guardar un PNG por archivo")
+    parser.add_argument("--reportes", help="Carpeta donde guardar un reporte por archivo")
+    parser.add_argument("--formato", choices=("texto", "json", "html"), default="texto", help="Formato de los reportes")
+    parser.add_argument("--reanudar", action="store_true", help="Omitir los archivos que ya están en --salida")
+    parser.add_argument("--memoria-acotada", action="store_true",
+                        help="Leer por bloques y guardar solo los momentos (sin gráficos)")
+    parser.add_argument("--bloque", type=int, default=1 << 16, help="Filas por bloque de lectura")
+    parser.add_argument("--sin-progreso", action="store_true", help="No mostrar el avance en stderr")
+    args = parser.parse_args(argumentos)
+
+    archivos = buscar_archivos(args.entradas)
+    if not archivos:
+        parser.error("No se encontraron archivos .csv o .npy.")
+    if args.reanudar and args.salida == "-":
+        parser.error("--reanudar necesita un archivo en --salida.")
+    if args.memoria_acotada and args.graficos:
+        print("Aviso: con --memoria-acotada no se conservan los datos, así que no se generan gráficos.", file=sys.stderr)
+
+    opciones = {
+        "x": args.x,
+        "y": args.y,
+        "niv_significancia": args.alpha,
+        "bloque": args.bloque,
+        "memoria_acotada": args.memoria_acotada,
+        "graficos": args.graficos,
+        "reportes": args.reportes,
+        "formato": args.formato,
+    }
+
+    hechos, errores, omitidos = ejecutar_lote(archivos, opciones, args.salida, args.trabajadores, args.reanudar, not args.sin_progreso)
+
+    print(f"Procesados: {hechos}, con error: {errores}, omitidos: {omitidos}", file=sys.stderr)
+    return 1 if errores else 0
@@ -1,5 +1,7 @@
+from enum import IntEnum
 import numpy as np
-from scipy import stats
+from .acumulador import AcumuladorRegresion
+from .entrada import como_arreglo
 
 def calcular_coeficiente_correlacion(arr1, arr2, nombre_var_ind="(variable independiente)", nombre_var_dep="(variable dependiente)"):
     """
@@ -14,10 +16,35 @@ def calcular_coeficiente_correlacion(arr1, arr2, nombre_var_ind="(variable indep
       - Una tupla (coeficiente, conclusión).
     """
 
-    arr1, arr2 = (np.array(a) if not isinstance(a, np.ndarray) else a for a in (arr1, arr2))
+    arr1, arr2 = como_arreglo(arr1, "arr1"), como_arreglo(arr2, "arr2")
 
-    r, _ = stats.pearsonr(arr1, arr2)
+    r = _pearson(arr1, arr2)
 
+    conclusion = concluir_correlacion(r, nombre_var_ind, nombre_var_dep)
+
+    return (r, conclusion, len(arr1))
+
+
+def _pearson(arr1, arr2):
+    """Coeficiente de Pearson en una sola pasada por bloques (mismo resultado que scipy.stats.pearsonr)."""
+    if len(arr1) != len(arr2):
+        raise ValueError("Los arreglos deben tener la misma longitud.")
+
+    return AcumuladorRegresion().agregar(arr1, arr2).r
+
+
+def concluir_correlacion(r, nombre_var_ind="(variable independiente)", nombre_var_dep="(variable dependiente)"):
+    """
+    Redacta la conclusión correspondiente a un coeficiente de correlación ya calculado.
+
+    Parámetros:
+      - r: Coeficiente de correlación de Pearson.
+      - nombre_var_ind: Es el nombre de la var. independiente declarada.
+      - nombre_var_dep: Es el nombre de la var. dependiente declarada.
+
+    Retorna:
+      - La conclusión como string.
+    """
     match r:
         case _ if 0.5 < r < 1:
             conclusion = f"Como 0.5 < r < 1 entonces la correlación entre {nombre_var_dep} y el/la {nombre_var_ind} se considera fuerte y positiva."
@@ -36,4 +63,66 @@ def calcular_coeficiente_correlacion(arr1, arr2, nombre_var_ind="(variable indep
         case _:
             conclusion = "El valor de r no está en el rango esperado (-1, 1)."
 
-    return (r, conclusion, len(arr1))
+    return conclusion
+
+
+class CodigoCorrelacion(IntEnum):
+    """Clasificación de una correlación como código pequeño (los rangos de concluir_correlacion)."""
+    FUERA_DE_RANGO = 0
+    FUERTE_POSITIVA = 1
+    MODERADA_POSITIVA = 2
+    DEBIL_POSITIVA = 3
+    FUERTE_NEGATIVA = 4
+    MODERADA_NEGATIVA = 5
+    DEBIL_NEGATIVA = 6
+    INEXISTENTE = 7
+
+
+# Etiqueta de cada CodigoCorrelacion (mismo orden)
+ETIQUETAS_CORRELACION = (
+    "fuera de rango",
+    "fuerte y positiva",
+    "moderada y positiva",
+    "débil y positiva",
+    "fuerte y negativa",
+    "moderada y negativa",
+    "débil y negativa",
+    "inexistente",
+)
+
+
+def codigos_correlacion(r):
+    """
+    Versión vectorizada de la clasificación de concluir_correlacion (mismos rangos).
+
+    Parámetros:
+      - r: Coeficiente o arreglo de coeficientes de correlación.
+
+    Retorna:
+      - Un arreglo int8 de CodigoCorrelacion; FUERA_DE_RANGO donde concluir_correlacion
+        diría que r no está en (-1, 1).
+    """
+    r = np.asarray(r, dtype=np.float64)
+    condiciones = [
+        (r > 0.5) & (r < 1),
+        r == 0.5,
+        (r > 0) & (r < 0.5),
+        (r > -1) & (r < -0.5),
+        r == -0.5,
+        (r > -0.5) & (r < 0),
+        r == 0,
+    ]
+    return np.select(condiciones, list(range(1, 8)), default=CodigoCorrelacion.FUERA_DE_RANGO).astype(np.int8)
+
+
+def clasificar_correlacion(r):
+    """
+    Etiquetas de texto de codigos_correlacion ("fuerte y positiva", "inexistente", etc.).
+
+    Parámetros:
+      - r: Coeficiente o arreglo de coeficientes de correlación.
+
+    Retorna:
+      - Un arreglo de etiquetas.
+    """
+    return np.array(ETIQUETAS_CORRELACION)[codigos_correlacion(r)]
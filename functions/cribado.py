@@ -0,0 +1,201 @@
+import numpy as np
+from .coeficiente_correlacion import clasificar_correlacion
+from .valores_criticos import estadistico_tabla, valor_p
+
+
+def _columnas_estandarizadas(X, inicio, fin, medias, normas):
+    """Columnas X[:, inicio:fin] centradas y con norma 1 (un bloque, no toda la matriz)."""
+    Z = np.subtract(X[:, inicio:fin], medias[inicio:fin], dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Z /= normas[inicio:fin]
+    return Z
+
+
+def _medias_normas(X, bloque):
+    """Media y norma centrada de cada columna, calculadas por bloques de columnas."""
+    p = X.shape[1]
+    medias = np.empty(p)
+    normas = np.empty(p)
+    for inicio in range(0, p, bloque):
+        Xb = np.asarray(X[:, inicio:inicio + bloque], dtype=np.float64)
+        media = Xb.mean(axis=0)
+        medias[inicio:inicio + bloque] = media
+        Xb = Xb - media
+        normas[inicio:inicio + bloque] = np.sqrt(np.einsum("ij,ij->j", Xb, Xb))
+
+    # Columnas constantes: norma 0 -> su correlación queda como nan
+    normas[normas == 0] = np.nan
+    return medias, normas
+
+
+def _prueba_rho(r, n, niv_significancia):
+    """Estadísticos de la prueba para ρ (los mismos de RegresionLineal) de un arreglo de r."""
+    stat_tabla, stat_used = estadistico_tabla(niv_significancia, n)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        error_std_r = np.sqrt((1 - r ** 2) / (n - 2)) if n > 2 else np.full(r.shape, np.nan)
+        ep_r = r / error_std_r
+
+    p_valor = valor_p(ep_r, n - 2 if stat_used == "t" else None)
+    return {
+        "ep_r": ep_r,
+        "stat_tabla": np.full(r.shape, stat_tabla if n > 2 else np.nan),
+        "stat_used": stat_used,
+        "p_valor": np.asarray(p_valor),
+        "rechaza_h0": np.abs(ep_r) > stat_tabla if n > 2 else np.zeros(r.shape, dtype=bool),
+        "etiqueta": clasificar_correlacion(r),
+    }
+
+
+def _validar_matriz(X):
+    """Convierte X a un arreglo 2-D (muestras × variables) sin copiarlo."""
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError("X debe ser un arreglo 2-D (muestras × variables).")
+    if X.dtype.kind not in "biuf":
+        raise ValueError(f"X debe ser numérico (se recibió dtype {X.dtype}).")
+    return X
+
+
+def matriz_correlacion(X, bloque=1024, out=None):
+    """
+    Calcula la matriz completa de correlaciones de Pearson entre las columnas de X.
+
+    Se trabaja por bloques de columnas: cada bloque se estandariza por separado y cada
+    parte de la matriz sale de un producto de matrices, así la memoria extra es de unos
+    cuantos bloques (n × bloque) además de la matriz de salida.
+
+    Parámetros:
+      - X: Arreglo (muestras × variables).
+      - bloque: Cantidad de columnas por bloque.
+      - out: Arreglo (variables × variables) donde escribir, por ejemplo un np.memmap.
+
+    Retorna:
+      - La matriz de correlaciones (nan en las columnas constantes).
+    """
+    X = _validar_matriz(X)
+    p = X.shape[1]
+    medias, normas = _medias_normas(X, bloque)
+
+    if out is None:
+        out = np.empty((p, p))
+    elif out.shape != (p, p):
+        raise ValueError(f"out debe tener forma {(p, p)}.")
+
+    for i in range(0, p, bloque):
+        Zi = _columnas_estandarizadas(X, i, i + bloque, medias, normas)
+        for j in range(i, p, bloque):
+            Zj = Zi if j == i else _columnas_estandarizadas(X, j, j + bloque, medias, normas)
+            parte = np.clip(Zi.T @ Zj, -1.0, 1.0)
+            out[i:i + bloque, j:j + bloque] = parte
+            if j != i:
+                out[j:j + bloque, i:i + bloque] = parte.T
+
+    return out
+
+
+def cribar_objetivo(X, y, k=None, niv_significancia=0.05, nombres=None, bloque=1024):
+    """
+    Correlación de cada columna de X contra una variable objetivo, ordenada de la más fuerte a la más débil.
+
+    Parámetros:
+      - X: Arreglo (muestras × variables) con los predictores candidatos.
+      - y: Variable objetivo (una por muestra).
+      - k: Cantidad de variables a retornar (None para todas).
+      - niv_significancia: Nivel de significancia de la prueba para ρ.
+      - nombres: Nombres de las columnas (por defecto, sus índices).
+      - bloque: Cantidad de columnas por bloque.
+
+    Retorna:
+      - Un diccionario de arreglos: indice, nombre, r, ep_r, stat_tabla, stat_used, p_valor,
+        rechaza_h0 y etiqueta (clasificación de la correlación).
+    """
+    X = _validar_matriz(X)
+    y = np.asarray(y, dtype=np.float64).ravel()
+    n, p = X.shape
+    if len(y) != n:
+        raise ValueError("y debe tener un valor por cada fila de X.")
+
+    medias, normas = _medias_normas(X, bloque)
+    zy = y - y.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zy /= np.sqrt(zy @ zy)
+
+    r = np.empty(p)
+    for inicio in range(0, p, bloque):
+        r[inicio:inicio + bloque] = _columnas_estandarizadas(X, inicio, inicio + bloque, medias, normas).T @ zy
+    r = np.clip(r, -1.0, 1.0)
+
+    orden = _mas_fuertes(r, k)
+    return _tabla_cribado({"indice": orden}, r[orden], n, niv_significancia, nombres, ("indice",))
+
+
+def cribar_pares(X, k=100, niv_significancia=0.05, nombres=None, bloque=1024):
+    """
+    Encuentra los k pares de columnas de X con la correlación más fuerte (en valor absoluto).
+
+    La matriz completa nunca se guarda: cada bloque de la matriz se calcula, se reduce a
+    sus k mejores candidatos y se descarta.
+
+    Parámetros:
+      - X: Arreglo (muestras × variables).
+      - k: Cantidad de pares a retornar.
+      - niv_significancia: Nivel de significancia de la prueba para ρ.
+      - nombres: Nombres de las columnas (por defecto, sus índices).
+      - bloque: Cantidad de columnas por bloque.
+
+    Retorna:
+      - Un diccionario de arreglos: i, j (con i < j), nombre_i, nombre_j, r, ep_r, stat_tabla,
+        stat_used, p_valor, rechaza_h0 y etiqueta.
+    """
+    X = _validar_matriz(X)
+    n, p = X.shape
+    medias, normas = _medias_normas(X, bloque)
+
+    mejores_i = np.empty(0, dtype=np.int64)
+    mejores_j = np.empty(0, dtype=np.int64)
+    mejores_r = np.empty(0)
+
+    for i in range(0, p, bloque):
+        Zi = _columnas_estandarizadas(X, i, i + bloque, medias, normas)
+        for j in range(i, p, bloque):
+            Zj = Zi if j == i else _columnas_estandarizadas(X, j, j + bloque, medias, normas)
+            parte = np.clip(Zi.T @ Zj, -1.0, 1.0)
+            if j == i:
+                # Solo la mitad superior (i < j), sin la diagonal
+                parte[np.tril_indices(parte.shape[0], 0, parte.shape[1])] = np.nan
+
+            # Los nan (diagonal o columnas constantes) no son candidatos
+            candidatos = _mas_fuertes(parte.ravel(), k)
+            candidatos = candidatos[~np.isnan(parte.ravel()[candidatos])]
+
+            mejores_i = np.concatenate([mejores_i, candidatos // parte.shape[1] + i])
+            mejores_j = np.concatenate([mejores_j, candidatos % parte.shape[1] + j])
+            mejores_r = np.concatenate([mejores_r, parte.ravel()[candidatos]])
+
+            # Se conserva solo el top-k global
+            seleccion = _mas_fuertes(mejores_r, k)
+            mejores_i, mejores_j, mejores_r = mejores_i[seleccion], mejores_j[seleccion], mejores_r[seleccion]
+
+    return _tabla_cribado({"i": mejores_i, "j": mejores_j}, mejores_r, n, niv_significancia, nombres, ("i", "j"))
+
+
+def _mas_fuertes(r, k):
+    """Índices de los k valores con mayor |r|, ordenados de mayor a menor (los nan al final)."""
+    fuerza = np.nan_to_num(np.abs(r), nan=-1.0)
+    if k is not None and k < len(r):
+        candidatos = np.argpartition(-fuerza, k)[:k]
+    else:
+        candidatos = np.arange(len(r))
+    return candidatos[np.argsort(-fuerza[candidatos], kind="stable")]
+
+
+def _tabla_cribado(indices, r, n, niv_significancia, nombres, columnas_indice):
+    """Junta los índices, los nombres y los estadísticos de la prueba para ρ en un diccionario de arreglos."""
+    tabla = dict(indices)
+    for columna in columnas_indice:
+        nombre = "nombre" if columna == "indice" else f"nombre_{columna}"
+        tabla[nombre] = np.asarray(nombres, dtype=object)[indices[columna]] if nombres is not None else indices[columna]
+    tabla["r"] = r
+    tabla.update(_prueba_rho(r, n, niv_significancia))
+    return tabla
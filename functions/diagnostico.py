@@ -0,0 +1,141 @@
+import numpy as np
+
+# Diagnósticos por dato, en el orden en que se guardan en los buffers de cada bloque
+CAMPOS_DIAGNOSTICO = ("residuo", "residuo_estandarizado", "apalancamiento", "cook")
+
+
+def diagnosticar(x_arr, y_arr, a, b, mean_x, Sxx, CME, k=None, umbral_residuo=3.0, umbral_cook=None, bloque=1 << 16, out=None):
+    """
+    Diagnóstico de residuos de la recta ŷ = a + b·x, recorriendo los datos por bloques.
+
+    Para cada dato se calcula (con p = 2 parámetros):
+      - Residuo: e = y - ŷ
+      - Apalancamiento: h = 1/n + (x - x̄)²/Sxx
+      - Residuo estandarizado: e / √(CME·(1 - h))
+      - Distancia de Cook: (residuo estandarizado)²/p · h/(1 - h)
+
+    Solo se guardan los diagnósticos de un bloque a la vez (en buffers reutilizados). Un dato se
+    marca si |residuo estandarizado| > umbral_residuo o si su distancia de Cook > umbral_cook.
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - a: Intercepto de la recta.
+      - b: Pendiente de la recta.
+      - mean_x: Media de x.
+      - Sxx: Suma de cuadrados centrada de x.
+      - CME: Cuadrado medio del error.
+      - k: Si se da, se retornan los k datos con mayor distancia de Cook en lugar de la máscara.
+      - umbral_residuo: Límite para |residuo estandarizado|.
+      - umbral_cook: Límite para la distancia de Cook (por defecto, 4/n).
+      - bloque: Cantidad de datos que se procesan a la vez.
+      - out: Arreglo booleano de longitud n donde escribir la máscara (opcional).
+
+    Retorna:
+      - Con k, un diccionario con "indices" y un arreglo por cada diagnóstico (de mayor a menor
+        distancia de Cook) más "marcado".
+      - Sin k, un diccionario con "marcados" (máscara booleana de longitud n, un byte por dato),
+        "n_marcados", "cook_max" y los umbrales usados.
+    """
+    x = np.asarray(x_arr).reshape(-1)
+    y = np.asarray(y_arr).reshape(-1)
+    n = len(x)
+    if len(y) != n:
+        raise ValueError("x y y deben tener la misma longitud.")
+    if n <= 2 or Sxx <= 0 or CME <= 0:
+        raise ValueError("Se necesitan n > 2, valores de x distintos y CME > 0 para el diagnóstico.")
+
+    if k is not None and k < 1:
+        raise ValueError("k debe ser al menos 1.")
+
+    umbral_cook = 4 / n if umbral_cook is None else umbral_cook
+
+    if k is None:
+        if out is None:
+            out = np.empty(n, dtype=bool)
+        elif out.shape != (n,) or out.dtype != bool:
+            raise ValueError(f"out debe ser un arreglo booleano de forma ({n},).")
+    else:
+        # Candidatos a los k más influyentes: (índices, diagnósticos); nunca más de k + bloque
+        mejores_indices = np.empty(0, dtype=np.int64)
+        mejores = np.empty((len(CAMPOS_DIAGNOSTICO), 0))
+
+    # Buffers de un bloque: residuo, residuo estandarizado, apalancamiento y Cook
+    buffers = np.empty((len(CAMPOS_DIAGNOSTICO), min(bloque, n)))
+    n_marcados = 0
+    cook_max = 0.0
+
+    for i in range(0, n, bloque):
+        xb = x[i:i + bloque]
+        yb = y[i:i + bloque]
+        m = len(xb)
+        e, r, h, d = buffers[:, :m]
+
+        # e = y - (a + b·x)
+        np.multiply(xb, -b, out=e)
+        e += yb
+        e -= a
+
+        # h = 1/n + (x - x̄)²/Sxx
+        np.subtract(xb, mean_x, out=h)
+        np.square(h, out=h)
+        h /= Sxx
+        h += 1 / n
+
+        # r = e / √(CME·(1 - h)); con d como temporal
+        np.subtract(1, h, out=d)
+        d *= CME
+        np.sqrt(d, out=d)
+        np.divide(e, d, out=r)
+
+        # D = r²/2 · h/(1 - h)
+        np.subtract(1, h, out=d)
+        np.divide(h, d, out=d)
+        d *= r
+        d *= r
+        d /= 2
+
+        cook_max = max(cook_max, float(d.max()))
+
+        if k is None:
+            marcados = out[i:i + m]
+            np.greater(np.abs(r), umbral_residuo, out=marcados)
+            marcados |= d > umbral_cook
+            n_marcados += int(np.count_nonzero(marcados))
+        else:
+            # Se juntan los candidatos anteriores con los k mayores del bloque y se conservan k
+            locales = np.argpartition(d, m - k)[m - k:] if k < m else np.arange(m)
+            mejores_indices = np.concatenate([mejores_indices, locales + i])
+            mejores = np.concatenate([mejores, buffers[:, locales]], axis=1)
+            if len(mejores_indices) > k:
+                seleccion = np.argpartition(mejores[3], len(mejores_indices) - k)[-k:]
+                mejores_indices, mejores = mejores_indices[seleccion], mejores[:, seleccion]
+
+    if k is None:
+        return {
+            "marcados": out,
+            "n_marcados": n_marcados,
+            "cook_max": cook_max,
+            "umbral_residuo": umbral_residuo,
+            "umbral_cook": umbral_cook
+        }
+
+    orden = np.argsort(mejores[3])[::-1]
+    resultado = {"indices": mejores_indices[orden]}
+    resultado.update(zip(CAMPOS_DIAGNOSTICO, mejores[:, orden]))
+    resultado["marcado"] = (np.abs(resultado["residuo_estandarizado"]) > umbral_residuo) | (resultado["cook"] > umbral_cook)
+    return resultado
+
+
+def indices_marcados(diagnostico):
+    """
+    Índices de los datos marcados de un resultado de diagnosticar (máscara o top-k), o de una
+    máscara booleana o arreglo de índices ya dado.
+    """
+    if isinstance(diagnostico, dict):
+        if "marcados" in diagnostico:
+            return np.flatnonzero(diagnostico["marcados"])
+        return diagnostico["indices"]
+
+    seleccion = np.asarray(diagnostico)
+    return np.flatnonzero(seleccion) if seleccion.dtype == bool else seleccion
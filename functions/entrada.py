@@ -0,0 +1,83 @@
+import os
+import numpy as np
+
+
+def como_arreglo(datos, nombre="datos"):
+    """
+    Convierte los datos de entrada en un arreglo 1-D de solo lectura, sin copiarlos cuando se puede.
+
+    Acepta:
+      - Rutas a archivos .npy: se abren con memory-map (np.load(mmap_mode="r")), así los datos
+        se leen del disco conforme se usan en lugar de cargarse completos en memoria.
+      - Arreglos de NumPy (incluido np.memmap): se usa una vista.
+      - Cualquier objeto con el protocolo de buffer (memoryview, bytes, array.array) o con
+        __array__ (columnas de pandas, arreglos de Arrow): se usa la vista que expongan.
+      - Listas y tuplas: aquí sí se crea un arreglo nuevo.
+
+    Parámetros:
+      - datos: Los datos de entrada.
+      - nombre: Nombre que se usa en los mensajes de error.
+
+    Retorna:
+      - Un arreglo numérico 1-D de solo lectura.
+    """
+    if isinstance(datos, (str, os.PathLike)):
+        arr = np.load(os.path.expanduser(datos), mmap_mode="r", allow_pickle=False)
+    else:
+        arr = np.asarray(datos)
+
+    if arr.dtype.kind not in "biuf":
+        raise ValueError(f"{nombre} debe ser numérico (se recibió dtype {arr.dtype}).")
+
+    # reshape(-1) es una vista si los datos son contiguos; la vista de solo lectura no cambia el original
+    arr = arr.reshape(-1).view()
+    arr.flags.writeable = False
+    return arr
+
+
+def validar_datos(x, y, bloque=1 << 20):
+    """
+    Valida, en una sola pasada por bloques, que x y y se puedan ajustar.
+
+    Revisa que tengan la misma longitud y que no haya valores nan ni infinitos; la revisión
+    se hace por bloques para no crear una máscara del tamaño de los datos.
+
+    Parámetros:
+      - x, y: Arreglos 1-D (por ejemplo, salidas de como_arreglo).
+      - bloque: Cantidad de datos que se revisan a la vez.
+    """
+    if len(x) != len(y):
+        raise ValueError(f"x y y deben tener la misma longitud ({len(x)} != {len(y)}).")
+
+    for arr, nombre in ((x, "x"), (y, "y")):
+        # Los enteros y booleanos siempre son finitos
+        if arr.dtype.kind != "f":
+            continue
+        for i in range(0, len(arr), bloque):
+            if not np.isfinite(np.sum(arr[i:i + bloque])):
+                # La suma es nan/inf si hay algún valor no finito (o si se desborda); se confirma
+                no_finitos = ~np.isfinite(arr[i:i + bloque])
+                if np.any(no_finitos):
+                    posicion = i + int(np.argmax(no_finitos))
+                    raise ValueError(f"{nombre} tiene un valor no finito en la posición {posicion}.")
+
+
+def preparar_datos(x_arr, y_arr, validar=True):
+    """
+    Convierte y valida una sola vez los datos de un ajuste.
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente (ver como_arreglo).
+      - y_arr: Valores de la variable dependiente.
+      - validar: Si es False no se revisan longitudes ni valores no finitos.
+
+    Retorna:
+      - Una tupla (x, y) de arreglos 1-D de solo lectura.
+    """
+    x = como_arreglo(x_arr, "x")
+    y = como_arreglo(y_arr, "y")
+
+    if validar:
+        validar_datos(x, y)
+
+    return x, y
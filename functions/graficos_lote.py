@@ -0,0 +1,87 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .graphic import graphic
+
+
+def graficar_lote(trabajos, n_trabajadores=None, umbral_densidad=100_000, al_terminar=None):
+    """
+    Genera muchos diagramas de dispersión en paralelo usando un pool de procesos.
+
+    Cada proceso tiene su propia figura headless (Agg), así que no se comparte el
+    estado global de pyplot entre trabajos.
+
+    Parámetros:
+      - trabajos: Lista de trabajos. Cada uno puede ser un diccionario con las llaves
+        x, y, a, b, titulo_diagrama y save_path (y opcionalmente nombre_var_ind,
+        nombre_var_dep y color), o una tupla (x, y, a, b, titulo_diagrama, save_path).
+      - n_trabajadores: Cantidad de procesos (por defecto, los núcleos disponibles).
+      - umbral_densidad: Se pasa a graphic(); arriba de esa cantidad se grafica la densidad.
+      - al_terminar: Función opcional que recibe el estado de cada trabajo en cuanto termina.
+
+    Retorna:
+      - Una lista con el estado de cada trabajo, en el mismo orden que `trabajos`:
+        {"save_path", "ok", "error", "tiempo_s"}.
+    """
+    trabajos = [_normalizar_trabajo(trabajo) for trabajo in trabajos]
+    estados = [None] * len(trabajos)
+
+    with ProcessPoolExecutor(max_workers=n_trabajadores or os.cpu_count()) as executor:
+        futuros = {
+            executor.submit(_graficar_trabajo, trabajo, umbral_densidad): i
+            for i, trabajo in enumerate(trabajos)
+        }
+
+        for futuro in as_completed(futuros):
+            i = futuros[futuro]
+            try:
+                estado = futuro.result()
+            except Exception as e:
+                # Por ejemplo, si el proceso trabajador murió
+                estado = {"save_path": trabajos[i]["save_path"], "ok": False, "error": repr(e), "tiempo_s": 0.0}
+
+            estados[i] = estado
+            if al_terminar is not None:
+                al_terminar(estado)
+
+    return estados
+
+
+def _normalizar_trabajo(trabajo):
+    """Convierte un trabajo en tupla a diccionario y verifica que tenga ruta de salida."""
+    if not isinstance(trabajo, dict):
+        x, y, a, b, titulo_diagrama, save_path = trabajo
+        trabajo = {"x": x, "y": y, "a": a, "b": b, "titulo_diagrama": titulo_diagrama, "save_path": save_path}
+
+    if not trabajo.get("save_path"):
+        raise ValueError("Cada trabajo necesita un save_path (los procesos no pueden mostrar ventanas).")
+
+    return trabajo
+
+
+def _graficar_trabajo(trabajo, umbral_densidad):
+    """Genera un solo gráfico dentro del proceso trabajador y reporta su estado."""
+    inicio = time.perf_counter()
+    try:
+        graphic(
+            trabajo["x"],
+            trabajo["y"],
+            trabajo.get("nombre_var_ind", "Eje X"),
+            trabajo.get("nombre_var_dep", "Eje Y"),
+            trabajo.get("titulo_diagrama") or "Diagrama de dispersión",
+            color=trabajo.get("color", "mediumslateblue"),
+            save_path=trabajo["save_path"],
+            a=trabajo.get("a"),
+            b=trabajo.get("b"),
+            umbral_densidad=umbral_densidad
+        )
+        error = None
+    except Exception as e:
+        error = repr(e)
+
+    return {
+        "save_path": trabajo["save_path"],
+        "ok": error is None,
+        "error": error,
+        "tiempo_s": time.perf_counter() - inicio
+    }
@@ -1,6 +1,22 @@
-import matplotlib.pyplot as plt
+import matplotlib
+import matplotlib.style
 import numpy as np
+import threading
 import warnings
+from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from .entrada import como_arreglo
+
+# Figura headless (Agg) que se reutiliza entre llamadas cuando se guarda la imagen; hay una por
+# hilo, así graphic() se puede llamar a la vez desde varios hilos (por ejemplo el renderizador de fondo).
+_FIGURAS = threading.local()
+
+# rc_context cambia los rcParams globales de matplotlib, así que dibujar con el estilo se hace de a un hilo
+_CANDADO_ESTILO = threading.RLock()
+
+# Parámetros del estilo 'ggplot', se cargan una sola vez
+_ESTILO = None
 
 def show_ascii_plot(x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a=None, b=None):
     """
@@ -37,10 +53,16 @@ def show_ascii_plot(x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagram
         print("Para la salida ASCII, instala plotext: pip install plotext")
 
 
-def graphic(x_arr, y_arr, nombre_var_ind="Eje X", nombre_var_dep="Eje Y", titulo_diagrama="Diagrama de dispersión", color="mediumslateblue", save_path="./diagrama_dispersion.png", ascii_output=False, a=None, b=None):
+
+
+def graphic(x_arr, y_arr, nombre_var_ind="Eje X", nombre_var_dep="Eje Y", titulo_diagrama="Diagrama de dispersión", color="mediumslateblue", save_path="./diagrama_dispersion.png", ascii_output=False, a=None, b=None, umbral_densidad=100_000, bins_densidad=200, curvas=None, marcados=None):
     """
     Crea un diagrama de dispersión comparando dos arreglos numéricos y opcionalmente añade la línea de regresión.
 
+    Con más de `umbral_densidad` puntos no se dibuja cada punto: se agrupan en una
+    rejilla de `bins_densidad` × `bins_densidad` celdas y se dibuja la densidad, así
+    que el tiempo de generar la imagen casi no crece con n.
+
     Parámetros:
       - x_arr: arreglo del eje X a graficar (var independiente).
       - y_arr: arreglo del eje Y a graficar (var dependiente).
@@ -52,38 +74,135 @@ def graphic(x_arr, y_arr, nombre_var_ind="Eje X", nombre_var_dep="Eje Y", titulo
       - ascii_output: Si es True, muestra la salida en ASCII.
       - a: Intercepto de la línea de regresión (opcional).
       - b: Pendiente de la línea de regresión (opcional).
+      - umbral_densidad: Cantidad de puntos a partir de la cual se grafica la densidad.
+      - bins_densidad: Cantidad de celdas por eje del gráfico de densidad.
+      - curvas: Diccionario {nombre: ajuste} de modelos de polinomial.IndicePotencias a dibujar
+        además de la recta (no se dibujan en la salida ASCII).
+      - marcados: Puntos a resaltar (máscara booleana, arreglo de índices o resultado de
+        diagnostico.diagnosticar); se dibujan encima de los datos o de la densidad.
     """
 
-    # Esta List Comprehension itera sobre ambos arreglos y verifica si alguno
-    # no es un numpy array; en ese caso, lo convierte.
-    x_arr, y_arr = (np.array(a_val) if not isinstance(a_val, np.ndarray) else a_val for a_val in (x_arr, y_arr))
+    # Vistas sin copia (las listas sí se convierten); si vienen de RegresionLineal ya son arreglos
+    x_arr, y_arr = como_arreglo(x_arr, "x_arr"), como_arreglo(y_arr, "y_arr")
     nombre_var_ind, nombre_var_dep = (str(a_val) if not type(a_val) == str else a_val for a_val in (nombre_var_ind, nombre_var_dep))
 
     if ascii_output:
-        show_ascii_plot(x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b)
+        x_ascii, y_ascii = _submuestrear(x_arr, y_arr, umbral_densidad)
+        show_ascii_plot(x_ascii, y_ascii, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b)
+        return
+
+    if save_path:
+        # Guardar la imagen no necesita pyplot: se usa una figura Agg reutilizable
+        figura = _figura_agg()
+        try:
+            with _CANDADO_ESTILO, matplotlib.rc_context(_estilo()):
+                _dibujar(figura, x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b, umbral_densidad, bins_densidad, curvas, marcados)
+                figura.savefig(save_path)
+        finally:
+            # Aunque falle el dibujo o el guardado, la figura queda limpia para la siguiente llamada
+            figura.clear()
         return
 
-    # Se fuerza el uso del estilo 'ggplot'
-    plt.style.use('ggplot')
+    import matplotlib.pyplot as plt
+
+    with _CANDADO_ESTILO, matplotlib.rc_context(_estilo()):
+        figura = plt.figure(figsize=(10, 5))
+        _dibujar(figura, x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b, umbral_densidad, bins_densidad, curvas, marcados)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", category=UserWarning)
+            plt.show()
+    except UserWarning as e:
+        print(f"Error al mostrar el gráfico con Matplotlib: {e}\nIntenando salida ASCII...")
+        x_ascii, y_ascii = _submuestrear(x_arr, y_arr, umbral_densidad)
+        show_ascii_plot(x_ascii, y_ascii, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b)
+
+
+def _estilo():
+    """Retorna los parámetros del estilo 'ggplot' (se leen una sola vez)."""
+    global _ESTILO
+    if _ESTILO is None:
+        _ESTILO = dict(matplotlib.style.library["ggplot"])
+    return _ESTILO
+
+
+def _figura_agg():
+    """Retorna la figura headless reutilizable del hilo actual, creándola la primera vez."""
+    figura = getattr(_FIGURAS, "figura", None)
+    if figura is None:
+        figura = _FIGURAS.figura = Figure(figsize=(10, 5))
+        FigureCanvasAgg(figura)
+    return figura
+
 
-    plt.figure(figsize=(10, 5))
+def _submuestrear(x_arr, y_arr, limite):
+    """Toma uno de cada k puntos para no pasar de `limite` (plotext no escala a millones de puntos)."""
+    if len(x_arr) <= limite:
+        return x_arr, y_arr
+    paso = -(-len(x_arr) // limite)
+    return x_arr[::paso], y_arr[::paso]
 
-    # Graficar los puntos de dispersión
-    plt.scatter(x_arr, y_arr, color=color, label="Datos")
+
+def _densidad(x_arr, y_arr, x_min, x_max, y_min, y_max, bins, bloque=1 << 20):
+    """Cuenta los puntos de cada celda de una rejilla bins × bins, recorriendo los datos por bloques."""
+    conteos = np.zeros(bins * bins, dtype=np.int64)
+
+    # Si un eje no tiene rango, todos los puntos caen en la primera celda de ese eje
+    escala_x = bins / (x_max - x_min) if x_max > x_min else 0.0
+    escala_y = bins / (y_max - y_min) if y_max > y_min else 0.0
+
+    for i in range(0, len(x_arr), bloque):
+        celda_x = ((x_arr[i:i + bloque] - x_min) * escala_x).astype(np.int64)
+        celda_y = ((y_arr[i:i + bloque] - y_min) * escala_y).astype(np.int64)
+
+        # El valor máximo cae justo en el borde, se manda a la última celda
+        np.minimum(celda_x, bins - 1, out=celda_x)
+        np.minimum(celda_y, bins - 1, out=celda_y)
+
+        conteos += np.bincount(celda_x * bins + celda_y, minlength=bins * bins)
+
+    return conteos.reshape(bins, bins)
+
+
+def _dibujar(figura, x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b, umbral_densidad, bins_densidad, curvas, marcados):
+    """Dibuja los datos (puntos o densidad) y la línea de regresión en la figura."""
+    ax = figura.add_subplot()
+
+    x_min, x_max = np.min(x_arr), np.max(x_arr)
+    y_min, y_max = np.min(y_arr), np.max(y_arr)
+
+    if len(x_arr) > umbral_densidad:
+        # Muchos datos: se dibuja cuántos puntos caen en cada celda
+        conteos = _densidad(x_arr, y_arr, x_min, x_max, y_min, y_max, bins_densidad)
+        imagen = ax.imshow(np.ma.masked_equal(conteos.T, 0), origin="lower", aspect="auto", interpolation="nearest",
+                           extent=(x_min, x_max, y_min, y_max), cmap="viridis", norm=LogNorm())
+        figura.colorbar(imagen, ax=ax, label="Cantidad de datos")
+    else:
+        # Graficar los puntos de dispersión
+        ax.scatter(x_arr, y_arr, color=color, label="Datos")
+
+    # Puntos marcados (por ejemplo, los influyentes del diagnóstico de residuos)
+    if marcados is not None:
+        from .diagnostico import indices_marcados
+
+        indices = indices_marcados(marcados)[:umbral_densidad]
+        if len(indices):
+            ax.scatter(x_arr[indices], y_arr[indices], facecolors="none", edgecolors="red", s=80,
+                       linewidths=1.5, label="Puntos marcados", zorder=3)
 
     # Si se proporcionan a y b, añadir línea de regresión
     if a is not None and b is not None:
-        x_min, x_max = np.min(x_arr), np.max(x_arr)
         x_line = np.linspace(x_min, x_max, 100)
         y_line = b * x_line + a
 
         # Graficar la línea de regresión en rojo
-        plt.plot(x_line, y_line, color='red', linewidth=2, label=f"Línea de regresión")
+        ax.plot(x_line, y_line, color='red', linewidth=2, label=f"Línea de regresión")
 
         # Añadir texto con la ecuación de la línea
         # Posicionar el texto en la parte superior izquierda
         text_x = x_min + 0.05 * (x_max - x_min)
-        text_y = np.max(y_arr) - 0.1 * (np.max(y_arr) - np.min(y_arr))
+        text_y = y_max - 0.1 * (y_max - y_min)
 
         # Determinar si la pendiente es positiva o negativa para formatear correctamente
         if b >= 0:
@@ -91,23 +210,21 @@ def graphic(x_arr, y_arr, nombre_var_ind="Eje X", nombre_var_dep="Eje Y", titulo
         else:
             equation_text = f"ŷ = {a:.3f} - {abs(b):.3f}x"
 
-        plt.text(text_x, text_y, equation_text, fontsize=12,
-                 bbox=dict(facecolor='white', alpha=0.7, edgecolor='darkgray'))
+        ax.text(text_x, text_y, equation_text, fontsize=12,
+                bbox=dict(facecolor='white', alpha=0.7, edgecolor='darkgray'))
 
-    plt.title(titulo_diagrama)
-    plt.xlabel(nombre_var_ind)
-    plt.ylabel(nombre_var_dep)
-    plt.grid(True)
-    plt.legend()
+    # Modelos adicionales (polinomios y variantes con logaritmos)
+    if curvas:
+        from .polinomial import evaluar_modelo
 
-    if save_path:
-        plt.savefig(save_path)
-        plt.close()
-    else:
-        try:
-            with warnings.catch_warnings():
-                warnings.filterwarnings("error", category=UserWarning)
-                plt.show()
-        except UserWarning as e:
-            print(f"Error al mostrar el gráfico con Matplotlib: {e}\nIntenando salida ASCII...")
-            show_ascii_plot(x_arr, y_arr, nombre_var_ind, nombre_var_dep, titulo_diagrama, color, a, b)
+        x_curva = np.linspace(x_min, x_max, 200)
+        for nombre, ajuste in curvas.items():
+            ax.plot(x_curva, evaluar_modelo(ajuste, x_curva), linewidth=1.5, linestyle="--", label=nombre)
+
+    ax.set_title(titulo_diagrama)
+    ax.set_xlabel(nombre_var_ind)
+    ax.set_ylabel(nombre_var_dep)
+    ax.grid(True)
+
+    if ax.get_legend_handles_labels()[0]:
+        ax.legend()
@@ -0,0 +1,43 @@
+import numpy as np
+from .entrada import como_arreglo, validar_datos
+from .lote import momentos_por_ids, estadisticos_desde_momentos
+
+
+def ajustar_por_grupo(llaves, x_arr, y_arr, niv_significancia=0.05):
+    """
+    Ajusta una regresión lineal por cada grupo de una tabla larga (por ejemplo, por dispositivo).
+
+    No hace falta ordenar ni partir la tabla: cada dato se asigna a su grupo con
+    np.unique (las llaves enteras no negativas y densas se usan directo, sin ordenar)
+    y los momentos de todos los grupos salen de reducciones segmentadas
+    (np.bincount), sin ciclos de Python por grupo.
+
+    Parámetros:
+      - llaves: Llave de grupo de cada dato (números o textos).
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - niv_significancia: Nivel de significancia para las pruebas de hipótesis.
+
+    Retorna:
+      - Un diccionario de arreglos con "llave" (los grupos, ordenados) y los mismos estadísticos
+        que ajustar_lote (n, a, b, r, r_squared_adj, ep_b, ep_r, p_valor_beta, ...), un elemento por grupo.
+    """
+    x = como_arreglo(x_arr, "x")
+    y = como_arreglo(y_arr, "y")
+    validar_datos(x, y)
+
+    llaves = np.asarray(llaves).ravel()
+    if len(llaves) != len(x):
+        raise ValueError("Debe haber una llave por cada dato.")
+
+    if llaves.dtype.kind in "iu" and len(llaves) and llaves.min() >= 0 and llaves.max() < 2 * len(llaves):
+        # Llaves enteras densas: se usan directo como índice y no hace falta ordenar
+        momentos = momentos_por_ids(x, y, llaves, int(llaves.max()) + 1)
+        presentes = momentos[0] > 0
+        grupos = np.flatnonzero(presentes).astype(llaves.dtype)
+        momentos = [m[presentes] for m in momentos]
+    else:
+        grupos, ids = np.unique(llaves, return_inverse=True)
+        momentos = momentos_por_ids(x, y, ids.ravel(), len(grupos))
+
+    return {"llave": grupos, **estadisticos_desde_momentos(*momentos, niv_significancia)}
@@ -0,0 +1,76 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Instrumentacion:
+    """
+    Mide el tiempo y la memoria de cada etapa de una regresión.
+
+    Las mediciones se acumulan por etapa en `metricas`:
+        {etapa: {"llamadas", "tiempo_s", "memoria_pico_bytes", "memoria_neta_bytes"}}
+    Las etapas anidadas (por ejemplo "sumas" dentro de "regresion") también se
+    cuentan dentro de la etapa que las contiene.
+
+    Parámetros:
+      - callback: Función opcional callback(etapa, medicion) que se llama al terminar
+        cada etapa, por ejemplo para mandar la medición a un sistema de métricas.
+      - memoria: Si es True se mide la memoria con tracemalloc (hace más lento el código).
+    """
+
+    def __init__(self, callback=None, memoria=True):
+        self.callback = callback
+        self.memoria = memoria
+        self.metricas = {}
+        self._pila = []
+
+    @contextmanager
+    def etapa(self, nombre):
+        """Context manager que mide el bloque de código como la etapa `nombre`."""
+        inicio_tracemalloc = self.memoria and not tracemalloc.is_tracing()
+        if inicio_tracemalloc:
+            tracemalloc.start()
+
+        marco = None
+        if self.memoria:
+            actual, pico = tracemalloc.get_traced_memory()
+            if self._pila:
+                # El pico se va a reiniciar: se guarda el que llevaba la etapa de afuera
+                self._pila[-1]["pico"] = max(self._pila[-1]["pico"], pico)
+            tracemalloc.reset_peak()
+            marco = {"base": actual, "pico": actual}
+            self._pila.append(marco)
+
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            medicion = {"tiempo_s": time.perf_counter() - inicio}
+
+            if self.memoria:
+                actual, pico = tracemalloc.get_traced_memory()
+                marco["pico"] = max(marco["pico"], pico)
+                self._pila.pop()
+                if self._pila:
+                    self._pila[-1]["pico"] = max(self._pila[-1]["pico"], marco["pico"])
+
+                medicion["memoria_pico_bytes"] = marco["pico"] - marco["base"]
+                medicion["memoria_neta_bytes"] = actual - marco["base"]
+
+                if inicio_tracemalloc:
+                    tracemalloc.stop()
+
+            self._registrar(nombre, medicion)
+
+    def _registrar(self, nombre, medicion):
+        """Acumula la medición de la etapa y avisa al callback."""
+        total = self.metricas.setdefault(nombre, {"llamadas": 0, "tiempo_s": 0.0})
+        total["llamadas"] += 1
+        total["tiempo_s"] += medicion["tiempo_s"]
+
+        if "memoria_pico_bytes" in medicion:
+            total["memoria_pico_bytes"] = max(total.get("memoria_pico_bytes", 0), medicion["memoria_pico_bytes"])
+            total["memoria_neta_bytes"] = total.get("memoria_neta_bytes", 0) + medicion["memoria_neta_bytes"]
+
+        if self.callback is not None:
+            self.callback(nombre, medicion)
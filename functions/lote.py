@@ -0,0 +1,239 @@
+import numpy as np
+from .valores_criticos import estadisticos_tabla, valor_p
+
+
+def ajustar_lote(x_arr, y_arr, offsets=None, niv_significancia=0.05):
+    """
+    Ajusta muchas regresiones lineales independientes en una sola llamada.
+
+    Los datos pueden venir de dos formas:
+      - Arreglos 2-D (series × muestras): cada fila es una serie. Si x es 1-D se usa
+        la misma x para todas las filas de y.
+      - Arreglos 1-D concatenados junto con `offsets` (longitud series + 1), donde la
+        serie i ocupa x[offsets[i]:offsets[i + 1]].
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - offsets: Inicio de cada serie en los arreglos concatenados (opcional).
+      - niv_significancia: Nivel de significancia para las pruebas de hipótesis.
+
+    Retorna:
+      - Un diccionario de arreglos (uno por estadístico, un elemento por serie).
+    """
+    x = np.asarray(x_arr, dtype=np.float64)
+    y = np.asarray(y_arr, dtype=np.float64)
+
+    if offsets is None:
+        n, mean_x, mean_y, Sxx, Syy, Sxy = _momentos_2d(x, y)
+    else:
+        n, mean_x, mean_y, Sxx, Syy, Sxy = _momentos_segmentados(x, y, np.asarray(offsets, dtype=np.int64))
+
+    return estadisticos_desde_momentos(n, mean_x, mean_y, Sxx, Syy, Sxy, niv_significancia)
+
+
+def _momentos_2d(x, y):
+    """Momentos centrados por fila de arreglos (series × muestras)."""
+    if y.ndim != 2:
+        raise ValueError("Sin offsets, y debe ser un arreglo 2-D (series × muestras).")
+    x = np.broadcast_to(x, y.shape)
+
+    n = np.full(y.shape[0], y.shape[1], dtype=np.int64)
+    mean_x = x.mean(axis=1)
+    mean_y = y.mean(axis=1)
+    dx = x - mean_x[:, None]
+    dy = y - mean_y[:, None]
+
+    Sxx = np.einsum("ij,ij->i", dx, dx)
+    Syy = np.einsum("ij,ij->i", dy, dy)
+    Sxy = np.einsum("ij,ij->i", dx, dy)
+
+    return n, mean_x, mean_y, Sxx, Syy, Sxy
+
+
+def _momentos_segmentados(x, y, offsets):
+    """Momentos centrados por serie de arreglos concatenados con offsets."""
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("Con offsets, x y y deben ser arreglos 1-D de la misma longitud.")
+    if offsets[0] != 0 or offsets[-1] != len(x) or np.any(np.diff(offsets) < 0):
+        raise ValueError("Los offsets deben ir de 0 a len(x) sin decrecer.")
+
+    n = np.diff(offsets)
+    series = len(n)
+    ids = np.repeat(np.arange(series), n)
+
+    return momentos_por_ids(x, y, ids, series)
+
+
+def momentos_por_ids(x, y, ids, series):
+    """
+    Momentos centrados por serie cuando cada dato trae el número de su serie (ids), en cualquier orden.
+
+    Se hacen reducciones segmentadas con np.bincount: una pasada para las medias y otra
+    para los co-momentos ya centrados (más estable que Σx² - n·x̄²).
+
+    Parámetros:
+      - x, y: Arreglos 1-D de datos.
+      - ids: Número de serie (0..series-1) de cada dato.
+      - series: Cantidad de series.
+
+    Retorna:
+      - Una tupla (n, mean_x, mean_y, Sxx, Syy, Sxy) de arreglos con un elemento por serie.
+    """
+    n = np.bincount(ids, minlength=series)
+
+    # Se evita dividir entre cero en las series vacías
+    divisor = np.maximum(n, 1)
+    mean_x = np.bincount(ids, weights=x, minlength=series) / divisor
+    mean_y = np.bincount(ids, weights=y, minlength=series) / divisor
+    dx = x - mean_x[ids]
+    dy = y - mean_y[ids]
+
+    Sxx = np.bincount(ids, weights=dx * dx, minlength=series)
+    Syy = np.bincount(ids, weights=dy * dy, minlength=series)
+    Sxy = np.bincount(ids, weights=dx * dy, minlength=series)
+
+    return n, mean_x, mean_y, Sxx, Syy, Sxy
+
+
+def estadisticos_desde_momentos(n, mean_x, mean_y, Sxx, Syy, Sxy, niv_significancia=0.05):
+    """
+    Calcula de forma vectorizada los mismos estadísticos que RegresionLineal a partir de los momentos.
+
+    Sigue las reglas de RegresionLineal: b = 0 si Sxx = 0, prueba t si n < 30 y z si n >= 30.
+    Los valores críticos salen del caché de valores_criticos.
+    Los valores que no están definidos (por ejemplo CME con n <= 2) quedan como nan.
+
+    Parámetros:
+      - n: Cantidad de datos de cada serie.
+      - mean_x, mean_y: Medias de cada serie.
+      - Sxx, Syy, Sxy: Co-momentos centrados de cada serie.
+      - niv_significancia: Nivel de significancia para las pruebas de hipótesis.
+
+    Retorna:
+      - Un diccionario de arreglos con los estadísticos de cada serie.
+    """
+    n = np.asarray(n, dtype=np.int64)
+    mean_x, mean_y, Sxx, Syy, Sxy = (np.asarray(v, dtype=np.float64) for v in (mean_x, mean_y, Sxx, Syy, Sxy))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b = np.where(Sxx == 0, 0.0, Sxy / Sxx)
+        a = mean_y - b * mean_x
+
+        r = Sxy / np.sqrt(Sxx * Syy)
+        r = np.clip(r, -1.0, 1.0)
+        r_squared = r ** 2
+
+        SCE = Syy * (1 - r_squared)
+        CMT = np.where(n > 1, Syy / (n - 1), np.nan)
+        CME = np.where(n > 2, SCE / (n - 2), np.nan)
+        r_squared_adj = 1 - CME / CMT
+
+        error_std_b = np.where(SCE > 0, np.sqrt(CME / Sxx), np.nan)
+        ep_b = b / error_std_b
+
+        error_std_r = np.where(n > 2, np.sqrt((1 - r_squared) / (n - 2)), np.nan)
+        ep_r = r / error_std_r
+
+    stat_tabla, stat_used = estadisticos_tabla(niv_significancia, n)
+
+    # Valores p exactos con la misma distribución que el valor de tabla (nan = normal)
+    gl = np.where(stat_used == "t", n - 2, np.nan)
+    p_valor_beta = valor_p(ep_b, gl)
+    p_valor_rho = valor_p(ep_r, gl)
+
+    return {
+        "n": n,
+        "mean_x": mean_x,
+        "mean_y": mean_y,
+        "Sxx": Sxx,
+        "Syy": Syy,
+        "Sxy": Sxy,
+        "a": a,
+        "b": b,
+        "r": r,
+        "r_squared": r_squared,
+        "SCE": SCE,
+        "CMT": CMT,
+        "CME": CME,
+        "r_squared_adj": r_squared_adj,
+        "error_std_b": error_std_b,
+        "ep_b": ep_b,
+        "error_std_r": error_std_r,
+        "ep_r": ep_r,
+        "stat_tabla": stat_tabla,
+        "stat_used": stat_used,
+        "p_valor_beta": p_valor_beta,
+        "p_valor_rho": p_valor_rho,
+        "rechaza_beta": np.abs(ep_b) > stat_tabla,
+        "rechaza_rho": np.abs(ep_r) > stat_tabla,
+    }
+
+
+def resultados_desde_lote(lote, i):
+    """
+    Arma, para la serie i de un lote, un diccionario con la misma estructura que RegresionLineal.resultados.
+
+    Solo incluye valores numéricos (las conclusiones en texto no se generan); los valores
+    no definidos (nan o infinito) quedan como None para poder serializarlo a JSON.
+
+    Parámetros:
+      - lote: Diccionario de arreglos retornado por ajustar_lote o estadisticos_desde_momentos.
+      - i: Índice de la serie.
+
+    Retorna:
+      - Un diccionario anidado con los grupos correlacion, regresion, determinacion,
+        prueba_beta y prueba_rho.
+    """
+    def plano(v):
+        v = v.item() if isinstance(v, np.generic) else v
+        return None if isinstance(v, float) and not np.isfinite(v) else v
+
+    def valor(llave):
+        return plano(lote[llave][i])
+
+    n = int(lote["n"][i])
+    mean_x, mean_y = lote["mean_x"][i], lote["mean_y"][i]
+
+    return {
+        "correlacion": {
+            "r": valor("r")
+        },
+        "regresion": {
+            "sum_x": plano(n * mean_x),
+            "sum_y": plano(n * mean_y),
+            "mean_x": plano(mean_x),
+            "mean_y": plano(mean_y),
+            "sum_x2": plano(lote["Sxx"][i] + n * mean_x ** 2),
+            "sum_y2": plano(lote["Syy"][i] + n * mean_y ** 2),
+            "sum_xy": plano(lote["Sxy"][i] + n * mean_x * mean_y),
+            "Sxx": valor("Sxx"),
+            "Syy": valor("Syy"),
+            "Sxy": valor("Sxy"),
+            "a": valor("a"),
+            "b": valor("b")
+        },
+        "determinacion": {
+            "r_squared": valor("r_squared"),
+            "SCE": valor("SCE"),
+            "CMT": valor("CMT"),
+            "CME": valor("CME"),
+            "r_squared_adj": valor("r_squared_adj")
+        },
+        "prueba_beta": {
+            "error_std_b": valor("error_std_b"),
+            "ep_b": valor("ep_b"),
+            "stat_tabla": valor("stat_tabla"),
+            "stat_used": valor("stat_used"),
+            "p_valor": valor("p_valor_beta"),
+            "rechaza_h0": valor("rechaza_beta")
+        },
+        "prueba_rho": {
+            "error_std_r": valor("error_std_r"),
+            "ep_r": valor("ep_r"),
+            "stat_tabla": valor("stat_tabla"),
+            "stat_used": valor("stat_used"),
+            "p_valor": valor("p_valor_rho"),
+            "rechaza_h0": valor("rechaza_rho")
+        }
+    }
@@ -0,0 +1,124 @@
+import os
+import multiprocessing
+from multiprocessing import shared_memory
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import numpy as np
+from .acumulador import AcumuladorRegresion
+from .entrada import preparar_datos
+from .regresion_lineal import RegresionLineal
+
+# Datos compartidos con los procesos hijos cuando se usa "fork" (copy-on-write, sin copias)
+_DATOS_COMPARTIDOS = {}
+
+
+def ajustar_paralelo(x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, n_trabajadores=None, modo="hilos", bloque=1 << 14):
+    """
+    Ajusta una sola regresión sobre muchos datos repartiendo el trabajo en varios núcleos.
+
+    Cada trabajador calcula los momentos parciales de su rango con el kernel por bloques
+    de AcumuladorRegresion (sin temporales del tamaño completo); al final los parciales
+    se combinan y se arma el RegresionLineal.
+
+    Parámetros:
+      - x_arr: Array de valores de la variable independiente.
+      - y_arr: Array de valores de la variable dependiente.
+      - var_ind: Descripción de la variable independiente.
+      - var_dep: Descripción de la variable dependiente.
+      - niv_significancia: Nivel de significancia para calcular las hipótesis.
+      - titulo_diagrama: Título para el diagrama de dispersión.
+      - n_trabajadores: Cantidad de hilos o procesos (por defecto, los núcleos disponibles).
+      - modo: "hilos" (NumPy libera el GIL y se leen vistas de los mismos arreglos) o
+        "procesos" (los hijos leen la memoria del padre; con "fork" no se copia nada,
+        en otras plataformas se copia una vez a memoria compartida).
+      - bloque: Tamaño de bloque del kernel de momentos de cada trabajador.
+
+    Retorna:
+      - Un objeto RegresionLineal con todos los cálculos realizados.
+    """
+    # Misma conversión y validación (longitudes, nan e infinitos) que en RegresionLineal
+    x, y = preparar_datos(x_arr, y_arr)
+    n_trabajadores = n_trabajadores or os.cpu_count() or 1
+    rangos = _repartir(len(x), n_trabajadores)
+
+    if modo == "hilos":
+        with ThreadPoolExecutor(max_workers=n_trabajadores) as executor:
+            parciales = list(executor.map(lambda rango: _momentos_rango(x, y, rango, bloque), rangos))
+    elif modo == "procesos":
+        parciales = _momentos_procesos(x, y, rangos, n_trabajadores, bloque)
+    else:
+        raise ValueError(f"Modo no soportado: {modo} (usa 'hilos' o 'procesos').")
+
+    # Reducción: combinar los momentos parciales en orden
+    acumulador = AcumuladorRegresion()
+    for parcial in parciales:
+        acumulador.combinar(parcial)
+
+    regresion = RegresionLineal.desde_acumulador(acumulador, var_ind, var_dep, niv_significancia, titulo_diagrama)
+
+    # Se conservan las vistas de los datos para poder graficar
+    regresion.x = x
+    regresion.y = y
+
+    return regresion
+
+
+def _repartir(n, partes):
+    """Divide el rango [0, n) en `partes` rangos contiguos de tamaño similar."""
+    limites = np.linspace(0, n, min(partes, max(n, 1)) + 1).astype(np.int64)
+    return [(int(inicio), int(fin)) for inicio, fin in zip(limites[:-1], limites[1:])]
+
+
+def _momentos_rango(x, y, rango, bloque):
+    """Calcula los momentos parciales de x[inicio:fin]."""
+    inicio, fin = rango
+    return AcumuladorRegresion().agregar(x[inicio:fin], y[inicio:fin], bloque)
+
+
+def _momentos_procesos(x, y, rangos, n_trabajadores, bloque):
+    """Reparte los rangos en un pool de procesos."""
+    if "fork" in multiprocessing.get_all_start_methods():
+        # Los hijos heredan los arreglos del padre sin copiarlos
+        _DATOS_COMPARTIDOS["x"], _DATOS_COMPARTIDOS["y"] = x, y
+        try:
+            contexto = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(max_workers=n_trabajadores, mp_context=contexto) as executor:
+                return list(executor.map(_momentos_heredados, rangos, [bloque] * len(rangos)))
+        finally:
+            _DATOS_COMPARTIDOS.clear()
+
+    # Sin fork: se copian los datos una sola vez a un segmento de memoria compartida
+    segmentos = []
+    try:
+        descriptores = []
+        for arr in (x, y):
+            segmento = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            segmentos.append(segmento)
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=segmento.buf)[:] = arr
+            descriptores.append((segmento.name, arr.shape, arr.dtype.str))
+
+        with ProcessPoolExecutor(max_workers=n_trabajadores) as executor:
+            futuros = [executor.submit(_momentos_memoria_compartida, descriptores, rango, bloque) for rango in rangos]
+            return [futuro.result() for futuro in futuros]
+    finally:
+        for segmento in segmentos:
+            segmento.close()
+            segmento.unlink()
+
+
+def _momentos_heredados(rango, bloque):
+    """Trabajador para procesos creados con fork."""
+    return _momentos_rango(_DATOS_COMPARTIDOS["x"], _DATOS_COMPARTIDOS["y"], rango, bloque)
+
+
+def _momentos_memoria_compartida(descriptores, rango, bloque):
+    """Trabajador que lee los datos desde memoria compartida sin copiarlos."""
+    segmentos = [shared_memory.SharedMemory(name=nombre) for nombre, _, _ in descriptores]
+    try:
+        x, y = (np.ndarray(forma, dtype=np.dtype(dtype), buffer=segmento.buf)
+                for segmento, (_, forma, dtype) in zip(segmentos, descriptores))
+        acumulador = _momentos_rango(x, y, rango, bloque)
+        del x, y
+        return acumulador
+    finally:
+        for segmento in segmentos:
+            segmento.close()
@@ -0,0 +1,230 @@
+import numpy as np
+
+# Transformación -> (función para x, función para y, cómo se escribe x, cómo se escribe ŷ)
+TRANSFORMACIONES = {
+    "lineal": (None, None, "x", "ŷ"),
+    "log_x": (np.log, None, "ln(x)", "ŷ"),
+    "log_y": (None, np.log, "x", "ln(ŷ)"),
+    "log_xy": (np.log, np.log, "ln(x)", "ln(ŷ)"),
+}
+
+
+class IndicePotencias:
+    """
+    Índice de sumas de potencias para ajustar polinomios (y variantes con logaritmos) sin volver a leer los datos.
+
+    En una sola pasada por bloques se acumulan, para cada transformación, Σuᵏ (k = 0..2·grado_max),
+    Σuᵏ·v (k = 0..grado_max) y Σv², donde u y v son x y y (o sus logaritmos) desplazados y escalados
+    con la media y la desviación del primer bloque, para que las potencias altas no pierdan precisión.
+    Con eso, cualquier polinomio de grado <= grado_max sale de resolver un sistema pequeño
+    (las ecuaciones normales) en lugar de recorrer los datos otra vez.
+
+    Parámetros:
+      - grado_max: Grado máximo de los polinomios que se podrán ajustar.
+      - transformaciones: Variantes a indexar ("lineal", "log_x", "log_y", "log_xy").
+    """
+
+    def __init__(self, grado_max=3, transformaciones=tuple(TRANSFORMACIONES)):
+        for transformacion in transformaciones:
+            if transformacion not in TRANSFORMACIONES:
+                raise ValueError(f"Transformación no soportada: {transformacion} (usa {', '.join(TRANSFORMACIONES)}).")
+
+        self.grado_max = grado_max
+        self.transformaciones = tuple(transformaciones)
+        self.n = 0
+
+        # Por transformación: desplazamientos y escalas, y las sumas acumuladas
+        self._centros = {}
+        self._potencias = {t: np.zeros(2 * grado_max + 1) for t in self.transformaciones}
+        self._cruzadas = {t: np.zeros(grado_max + 1) for t in self.transformaciones}
+        self._cuadrados = {t: 0.0 for t in self.transformaciones}
+        # Transformaciones que no aplican (por ejemplo log de valores <= 0)
+        self.invalidas = set()
+
+    def agregar(self, x_arr, y_arr, bloque=1 << 16):
+        """
+        Agrega datos al índice en una sola pasada por bloques.
+
+        Parámetros:
+          - x_arr: Valores de la variable independiente.
+          - y_arr: Valores de la variable dependiente.
+          - bloque: Cantidad de datos que se procesan a la vez.
+
+        Retorna:
+          - El mismo índice (para poder encadenar llamadas).
+        """
+        x = np.asarray(x_arr).ravel()
+        y = np.asarray(y_arr).ravel()
+        if len(x) != len(y):
+            raise ValueError("x y y deben tener la misma longitud.")
+
+        tamano = min(bloque, len(x))
+        u = np.empty(tamano)
+        potencia = np.empty(tamano)
+
+        for i in range(0, len(x), bloque):
+            xb = np.asarray(x[i:i + bloque], dtype=np.float64)
+            yb = np.asarray(y[i:i + bloque], dtype=np.float64)
+            m = len(xb)
+
+            for transformacion in self.transformaciones:
+                if transformacion in self.invalidas:
+                    continue
+
+                funcion_x, funcion_y, _, _ = TRANSFORMACIONES[transformacion]
+                if (funcion_x and np.any(xb <= 0)) or (funcion_y and np.any(yb <= 0)):
+                    self.invalidas.add(transformacion)
+                    continue
+
+                xt = funcion_x(xb) if funcion_x else xb
+                yt = funcion_y(yb) if funcion_y else yb
+
+                if transformacion not in self._centros:
+                    escala = float(np.std(xt))
+                    self._centros[transformacion] = (float(np.mean(xt)), escala if escala > 0 else 1.0, float(np.mean(yt)))
+                centro_x, escala_x, centro_y = self._centros[transformacion]
+
+                ub, pb = u[:m], potencia[:m]
+                np.subtract(xt, centro_x, out=ub)
+                ub /= escala_x
+                vb = yt - centro_y
+
+                # u⁰, u¹, ..., u^(2·grado) reutilizando el mismo buffer
+                pb.fill(1.0)
+                sumas = self._potencias[transformacion]
+                cruzadas = self._cruzadas[transformacion]
+                for k in range(2 * self.grado_max + 1):
+                    sumas[k] += pb.sum()
+                    if k <= self.grado_max:
+                        cruzadas[k] += pb @ vb
+                    pb *= ub
+                self._cuadrados[transformacion] += vb @ vb
+
+            self.n += m
+
+        return self
+
+    def ajustar(self, grado=1, transformacion="lineal"):
+        """
+        Ajusta un polinomio usando solo el índice.
+
+        Parámetros:
+          - grado: Grado del polinomio (1 = recta).
+          - transformacion: Variante de los datos ("lineal", "log_x", "log_y" o "log_xy").
+
+        Retorna:
+          - Un diccionario con transformacion, grado, coeficientes (c₀, c₁, ... sobre la variable
+            transformada), ecuacion, r_squared, r_squared_adj y SCE (en la escala transformada);
+            None si la transformación no aplica a los datos.
+        """
+        if grado > self.grado_max:
+            raise ValueError(f"El índice solo tiene sumas hasta el grado {self.grado_max}.")
+        if transformacion not in self.transformaciones:
+            raise ValueError(f"La transformación {transformacion} no está en el índice.")
+        if transformacion in self.invalidas or transformacion not in self._centros:
+            return None
+
+        sumas = self._potencias[transformacion]
+        cruzadas = self._cruzadas[transformacion][:grado + 1]
+        centro_x, escala_x, centro_y = self._centros[transformacion]
+
+        # Ecuaciones normales: M[i, j] = Σu^(i + j), M·β = Σuⁱ·v
+        indices = np.arange(grado + 1)
+        M = sumas[indices[:, None] + indices[None, :]]
+        beta = np.linalg.lstsq(M, cruzadas, rcond=None)[0]
+
+        # Suma de cuadrados (v centrada en el primer bloque; el intercepto absorbe el desplazamiento)
+        Svv = self._cuadrados[transformacion]
+        SCE = max(0.0, Svv - 2 * beta @ cruzadas + beta @ M @ beta)
+        Syy = Svv - cruzadas[0] ** 2 / sumas[0]
+
+        n = self.n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r_squared = 1 - SCE / Syy if Syy > 0 else float("nan")
+            gl = n - grado - 1
+            r_squared_adj = 1 - (SCE / gl) / (Syy / (n - 1)) if gl > 0 and Syy > 0 else float("nan")
+
+        # Se regresa de u = (x - centro)/escala y v = y - centro_y a la variable transformada
+        polinomio_u = np.polynomial.Polynomial(beta)
+        polinomio = polinomio_u(np.polynomial.Polynomial([-centro_x / escala_x, 1 / escala_x]))
+        coeficientes = np.zeros(grado + 1)
+        coeficientes[:len(polinomio.coef)] = polinomio.coef
+        coeficientes[0] += centro_y
+
+        return {
+            "transformacion": transformacion,
+            "grado": grado,
+            "coeficientes": coeficientes.tolist(),
+            "ecuacion": ecuacion_polinomio(coeficientes, transformacion),
+            "r_squared": float(r_squared),
+            "r_squared_adj": float(r_squared_adj),
+            "SCE": float(SCE),
+        }
+
+    def comparar(self, grados=None):
+        """
+        Ajusta todas las combinaciones de grado y transformación del índice.
+
+        Parámetros:
+          - grados: Grados a ajustar (por defecto, de 1 a grado_max).
+
+        Retorna:
+          - Un diccionario {nombre del modelo: ajuste} y el nombre del modelo con mayor R²ₐⱼ
+            (dentro de la misma escala de y que la recta, es decir sin log y).
+        """
+        grados = grados or range(1, self.grado_max + 1)
+        modelos = {}
+        for transformacion in self.transformaciones:
+            for grado in grados:
+                ajuste = self.ajustar(grado, transformacion)
+                if ajuste is not None:
+                    modelos[nombre_modelo(grado, transformacion)] = ajuste
+
+        # R²ₐⱼ solo es comparable entre modelos con la misma y
+        comparables = {nombre: ajuste for nombre, ajuste in modelos.items()
+                       if TRANSFORMACIONES[ajuste["transformacion"]][1] is None and not np.isnan(ajuste["r_squared_adj"])}
+        mejor = max(comparables, key=lambda nombre: comparables[nombre]["r_squared_adj"]) if comparables else None
+
+        return modelos, mejor
+
+
+def nombre_modelo(grado, transformacion):
+    """Nombre corto de un modelo, por ejemplo "grado 2" o "log_x grado 1"."""
+    return f"grado {grado}" if transformacion == "lineal" else f"{transformacion} grado {grado}"
+
+
+def ecuacion_polinomio(coeficientes, transformacion="lineal"):
+    """
+    Escribe la ecuación de un polinomio ajustado, por ejemplo "ŷ = 1.2000 - 0.5000x + 0.0300x²".
+
+    Parámetros:
+      - coeficientes: c₀, c₁, ... del polinomio.
+      - transformacion: Variante de los datos (cambia cómo se escriben x y ŷ).
+    """
+    _, _, texto_x, texto_y = TRANSFORMACIONES[transformacion]
+    exponentes = {2: "²", 3: "³", 4: "⁴", 5: "⁵", 6: "⁶", 7: "⁷", 8: "⁸", 9: "⁹"}
+
+    ecuacion = f"{texto_y} = {coeficientes[0]:.4f}"
+    for k, c in enumerate(coeficientes[1:], start=1):
+        termino = texto_x if k == 1 else f"{texto_x}{exponentes.get(k, f'^{k}')}"
+        ecuacion += f" {'+' if c >= 0 else '-'} {abs(c):.4f}{termino}"
+    return ecuacion
+
+
+def evaluar_modelo(ajuste, x_arr):
+    """
+    Evalúa un modelo de IndicePotencias.ajustar en la escala original de y.
+
+    Parámetros:
+      - ajuste: Diccionario retornado por ajustar.
+      - x_arr: Valores de x donde evaluar.
+
+    Retorna:
+      - Un arreglo con ŷ.
+    """
+    funcion_x, funcion_y, _, _ = TRANSFORMACIONES[ajuste["transformacion"]]
+    x = np.asarray(x_arr, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xt = funcion_x(x) if funcion_x else x
+        y = np.polynomial.polynomial.polyval(xt, ajuste["coeficientes"])
+        return np.exp(y) if funcion_y else y
@@ -1,8 +1,14 @@
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .regresion_lineal import RegresionLineal
-from rich.console import Console
-from rich.align import Align
 
-def ejecutar_regresion(x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, save_path="./diagrama_dispersion.png", ascii_output=False):
+# Renderizador compartido de ejecutar_regresion_en_fondo (se crea la primera vez que se usa)
+_RENDERIZADOR = None
+_CANDADO_RENDERIZADOR = threading.Lock()
+
+
+def ejecutar_regresion(x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, save_path="./diagrama_dispersion.png", ascii_output=False, cache=None):
     """
     Función auxiliar para ejecutar todo el proceso de regresión lineal de manera sencilla.
 
@@ -14,13 +20,189 @@ def ejecutar_regresion(x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, t
       - niv_significancia: Nivel de significancia para calcular las hipótesis.
       - titulo_diagrama: Título para el diagrama de dispersión.
       - save_path: Ruta donde guardar el diagrama de dispersión.
+      - cache: CacheResultados opcional; si los mismos datos y opciones ya se calcularon,
+        se reutilizan los resultados y el PNG sin volver a calcular ni graficar.
 
     Retorna:
       - Un objeto RegresionLineal con todos los cálculos realizados.
     """
-    regresion = RegresionLineal(x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output)
+    regresion, llave, entrada = _calcular(x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output, cache)
+
     regresion.mostrar_resultados()
-    regresion.mostrar_grafico(save_path=save_path)
+    _graficar(regresion, save_path, ascii_output, cache, llave, entrada)
     regresion.creditos()
 
     return regresion  # Por si el que lo use quiere un valor en particular
+
+
+def ejecutar_regresion_en_fondo(x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, save_path="./diagrama_dispersion.png", ascii_output=False, cache=None, renderizador=None):
+    """
+    Igual que ejecutar_regresion, pero solo espera los cálculos: las tablas y el gráfico se
+    generan en un hilo de fondo.
+
+    Parámetros:
+      - x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, save_path,
+        ascii_output, cache: Los mismos de ejecutar_regresion (save_path es obligatorio si
+        no hay salida ASCII, porque la ventana de matplotlib no se puede abrir desde otro hilo).
+      - renderizador: RenderizadorFondo donde encolar el trabajo (por defecto, uno compartido
+        con 8 tareas pendientes como máximo). Si la cola está llena se espera a que haya lugar.
+
+    Retorna:
+      - Una tupla (regresion, renderizado): el RegresionLineal ya calculado y un Renderizado con
+        los futuros "resultados" (tablas y créditos) y "grafico" (se puede esperar con
+        renderizado.result() o con await).
+    """
+    if not save_path and not ascii_output:
+        raise ValueError("En segundo plano el gráfico se tiene que guardar: indica save_path o usa ascii_output.")
+
+    renderizador = renderizador or renderizador_compartido()
+    regresion, llave, entrada = _calcular(x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output, cache)
+
+    # Lo que se guarda en caché se copia ahora, por si el que llama modifica los resultados después
+    resultados_cache = copy.deepcopy(dict(regresion.resultados)) if cache is not None and entrada is None else None
+
+    def mostrar():
+        regresion.mostrar_resultados()
+        regresion.creditos()
+
+    futuros = {
+        "resultados": renderizador.enviar(mostrar),
+        "grafico": renderizador.enviar(_graficar, regresion, save_path, ascii_output, cache, llave, entrada, resultados_cache),
+    }
+    return regresion, Renderizado(futuros)
+
+
+def _calcular(x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output, cache):
+    """Crea la regresión (o la recupera de la caché); retorna (regresion, llave, entrada de la caché)."""
+    if cache is None:
+        return RegresionLineal(x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output), None, None
+
+    from .cache import llave_cache
+
+    llave = llave_cache(x_arr, y_arr, niv_significancia=niv_significancia, var_ind=var_ind, var_dep=var_dep,
+                        titulo_diagrama=titulo_diagrama, ascii_output=ascii_output)
+    entrada = cache.obtener(llave)
+
+    # Perezoso: si hay acierto no se calcula nada, solo se ponen los resultados guardados
+    regresion = RegresionLineal(x_arr, y_arr, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output, perezoso=entrada is not None)
+    if entrada is not None:
+        regresion.resultados = copy.deepcopy(entrada["resultados"])
+
+    return regresion, llave, entrada
+
+
+def _graficar(regresion, save_path, ascii_output, cache, llave, entrada, resultados_cache=None):
+    """Genera (o copia de la caché) el diagrama de dispersión y guarda lo nuevo en la caché."""
+    if cache is None:
+        regresion.mostrar_grafico(save_path=save_path)
+        return
+
+    png = entrada["artefactos"].get("diagrama.png") if entrada is not None else None
+    if png is not None and save_path:
+        with open(save_path, "wb") as archivo:
+            archivo.write(png)
+    else:
+        regresion.mostrar_grafico(save_path=save_path)
+        if not ascii_output and save_path:
+            with open(save_path, "rb") as archivo:
+                png = archivo.read()
+
+    if entrada is None or (png is not None and "diagrama.png" not in entrada["artefactos"]):
+        if resultados_cache is None:
+            resultados_cache = copy.deepcopy(dict(regresion.resultados))
+        cache.guardar(llave, resultados_cache, {"diagrama.png": png} if png is not None else None)
+
+
+class RenderizadorFondo:
+    """
+    Hilo de fondo para las tablas de rich y los gráficos de matplotlib, con una cola acotada.
+
+    Hay un solo hilo para que las tablas salgan en orden en la terminal; graphic() usa una
+    figura por hilo, así que se puede dibujar a la vez con otros renderizadores o con
+    ejecutar_regresion. A lo más hay `max_pendientes` tareas en cola o en ejecución:
+    `enviar` espera a que se libere un lugar, así una ráfaga de ajustes no acumula trabajo
+    de dibujo sin límite.
+
+    Parámetros:
+      - max_pendientes: Cantidad máxima de tareas encoladas o en ejecución.
+    """
+
+    def __init__(self, max_pendientes=8):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="renderizador")
+        self._lugares = threading.BoundedSemaphore(max_pendientes)
+
+    def enviar(self, funcion, *args, timeout=None):
+        """
+        Encola `funcion(*args)`.
+
+        Parámetros:
+          - funcion: Lo que se ejecuta en el hilo de fondo.
+          - args: Argumentos de la función.
+          - timeout: Segundos máximos para esperar lugar en la cola (None = sin límite).
+
+        Retorna:
+          - Un concurrent.futures.Future con el resultado.
+        """
+        if not self._lugares.acquire(timeout=timeout):
+            raise TimeoutError("La cola del renderizador está llena.")
+
+        try:
+            futuro = self._executor.submit(funcion, *args)
+        except BaseException:
+            self._lugares.release()
+            raise
+
+        futuro.add_done_callback(lambda _: self._lugares.release())
+        return futuro
+
+    def cerrar(self, esperar=True):
+        """Deja de aceptar tareas y, si `esperar`, espera a que terminen las pendientes."""
+        self._executor.shutdown(wait=esperar)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def renderizador_compartido():
+    """Retorna el RenderizadorFondo que se usa por defecto, creándolo la primera vez."""
+    global _RENDERIZADOR
+    with _CANDADO_RENDERIZADOR:
+        if _RENDERIZADOR is None:
+            _RENDERIZADOR = RenderizadorFondo()
+        return _RENDERIZADOR
+
+
+class Renderizado:
+    """
+    Futuros del trabajo de presentación de una regresión ("resultados" y "grafico").
+
+    Se puede esperar con result() desde código normal o con `await renderizado` desde asyncio.
+    """
+
+    def __init__(self, futuros):
+        self.futuros = futuros
+
+    @property
+    def resultados(self):
+        return self.futuros["resultados"]
+
+    @property
+    def grafico(self):
+        return self.futuros["grafico"]
+
+    def listo(self):
+        """True si ya terminaron las tablas y el gráfico."""
+        return all(futuro.done() for futuro in self.futuros.values())
+
+    def result(self, timeout=None):
+        """Espera a que termine todo (y relanza el error de la tarea que haya fallado)."""
+        for futuro in self.futuros.values():
+            futuro.result(timeout)
+
+    def __await__(self):
+        import asyncio
+
+        return asyncio.gather(*(asyncio.wrap_future(futuro) for futuro in self.futuros.values())).__await__()
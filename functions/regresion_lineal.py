@@ -1,28 +1,212 @@
 import numpy as np
-from scipy.stats import t
-from scipy.stats import norm
-from .graphic import graphic
-from .table import table
-from .coeficiente_correlacion import calcular_coeficiente_correlacion
-from rich.console import Console
-from rich.align import Align
+from functools import partial
+from .acumulador import AcumuladorRegresion
+from .entrada import preparar_datos
+from .coeficiente_correlacion import concluir_correlacion
+from .instrumentacion import Instrumentacion
+from .valores_criticos import estadistico_tabla, valor_p
+
+# scipy (en valores_criticos), matplotlib y rich se importan dentro de las funciones que los usan para que
+# el núcleo numérico cargue rápido (solo depende de numpy).
+
+
+def _plantilla_resultados():
+    """Retorna el diccionario de resultados con todos los valores en cero."""
+    return {
+        "correlacion": {
+            "r": 0,
+            "conclusion": ""
+        },
+        "regresion": {
+            "sum_x": 0,
+            "sum_y": 0,
+            "mean_x": 0,
+            "mean_y": 0,
+            "sum_x2": 0,
+            "sum_y2": 0,
+            "sum_xy": 0,
+            "Sxx": 0,
+            "Syy": 0,
+            "Sxy": 0,
+            "a": 0,
+            "b": 0
+        },
+        "determinacion": {
+            "r_squared": 0,
+            "SCE": 0,
+            "CMT": 0,
+            "CME": 0,
+            "r_squared_adj": 0
+        },
+        "prueba_beta": {
+            "error_std_b": 0,
+            "ep_b": 0,
+            "stat_tabla": 0,
+            "stat_used": "",
+            "p_valor": 0,
+            "conclusion": ""
+        },
+        "prueba_rho": {
+            "error_std_r": 0,
+            "ep_r": 0,
+            "stat_tabla": 0,
+            "stat_used": "",
+            "p_valor": 0,
+            "conclusion": ""
+        }
+    }
+
+
+# Conclusión de cada prueba según si se rechaza Hₒ (el texto de β se conserva como estaba)
+_CONCLUSIONES_PRUEBA = {
+    "β": {
+        True: ("Como se cumple la región de rechazo entonces se rechaza Hₒ.\n"
+               "Entonces existe evidencia suficiente para rechazar que β = 0.\n"
+               "Entonces existe una relación lineal entre las variables X y Y."),
+        False: ("Como se no cumple la región de rechazo entonces se rechaza Hₒ.\n"
+                "Entonces no existe evidencia suficiente para rechazar que β = 0.\n"
+                "Entonces no existe una relación lineal entre las variables X y Y."),
+    },
+    "ρ": {
+        True: ("Como se cumple la región de rechazo entonces se rechaza Hₒ.\n"
+               "Entonces existe evidencia suficiente para rechazar que ρ = 0.\n"
+               "Entonces existe una correlación lineal entre las variables X y Y."),
+        False: ("Como se no cumple la región de rechazo entonces no se rechaza Hₒ.\n"
+                "Entonces no existe evidencia suficiente para rechazar que ρ = 0.\n"
+                "Entonces no existe una correlación lineal entre las variables X y Y."),
+    },
+}
+
+
+def concluir_prueba(estadistico, stat_tabla, parametro):
+    """
+    Redacta la conclusión de la prueba de hipótesis de dos colas para β o ρ.
+
+    Parámetros:
+      - estadistico: Estadístico de prueba (ep_b o ep_r).
+      - stat_tabla: Valor de tabla t_α/2 (o z_α/2).
+      - parametro: "β" o "ρ".
+
+    Retorna:
+      - La conclusión como string (con las marcas de color de rich).
+    """
+    # Verde si se cumple, rojo si no se cumple
+    color1 = "green" if estadistico < -stat_tabla else "red"
+    color2 = "green" if estadistico > stat_tabla else "red"
+    cond1 = f"[{color1}]{round(estadistico, 4)} < -{round(stat_tabla, 4)}[/{color1}]"
+    cond2 = f"[{color2}]{round(estadistico, 4)} > {round(stat_tabla, 4)}[/{color2}]"
+    rechaza = color1 == "green" or color2 == "green"
+
+    return (
+        "Prueba de hipótesis de dos colas:\n"
+        "Se evaluó: " + cond1 + " ó " + cond2 + "\n\n" +
+        _CONCLUSIONES_PRUEBA[parametro][rechaza]
+    )
+
+
+class _ResultadosPerezosos(dict):
+    """
+    Diccionario de resultados que calcula cada grupo la primera vez que se consulta.
+
+    Cada grupo ("correlacion", "regresion", ...) se calcula con su método y queda
+    memorizado; si un cálculo consulta otro grupo, ese se resuelve primero. Para
+    tener todos los grupos (por ejemplo, antes de serializar) se usa `completar`.
+    """
+
+    def __init__(self, calculos):
+        super().__init__()
+        self._calculos = calculos
+
+    def __missing__(self, grupo):
+        if grupo not in self._calculos:
+            raise KeyError(grupo)
+
+        self[grupo] = _plantilla_resultados()[grupo]
+        try:
+            self._calculos[grupo]()
+        except Exception:
+            del self[grupo]
+            raise
+
+        return dict.__getitem__(self, grupo)
+
+    def get(self, grupo, default=None):
+        if grupo in self._calculos:
+            return self[grupo]
+        return super().get(grupo, default)
+
+    def completar(self):
+        """Calcula todos los grupos que falten y retorna el mismo diccionario."""
+        for grupo in self._calculos:
+            self[grupo]
+        return self
 
 
 class RegresionLineal:
-    def __init__(self, x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, ascii_output=False):
+    # Grupo de resultados -> método que lo calcula
+    _GRUPOS = {
+        "correlacion": "_calcular_coeficiente_correlacion",
+        "regresion": "_calcular_regresion",
+        "determinacion": "_calcular_coeficiente_determinacion",
+        "prueba_beta": "_calcular_prueba_beta",
+        "prueba_rho": "_calcular_prueba_rho"
+    }
+
+    def __init__(self, x_arr, y_arr, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, ascii_output=False, perezoso=False, instrumentacion=None):
         """
         Inicializa el objeto de regresión lineal.
 
         Parámetros:
-          - x_arr: Array de valores de la variable independiente.
-          - y_arr: Array de valores de la variable dependiente.
+          - x_arr: Valores de la variable independiente: array, memoryview, columna de pandas/Arrow
+            o ruta a un archivo .npy (se abre con memory-map). No se copian si no hace falta.
+          - y_arr: Valores de la variable dependiente (mismos tipos que x_arr).
           - var_ind: Descripción de la variable independiente.
           - var_dep: Descripción de la variable dependiente.
           - niv_significancia: Nivel de significancia para calcular las hipótesis.
           - titulo_diagrama: Título para el diagrama de dispersión.
+          - perezoso: Si es True, cada grupo de resultados se calcula hasta que se consulta.
+          - instrumentacion: Instrumentacion (o True) para medir tiempo y memoria de cada etapa.
+        """
+        # Vistas de solo lectura, validadas una sola vez (longitud, tipo y valores finitos)
+        self.x, self.y = preparar_datos(x_arr, y_arr)
+        self._acumulador = None
+        self._configurar(var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output, len(self.x), perezoso, instrumentacion)
+
+        # Realizar todos los cálculos
+        if not perezoso:
+            self._calcular_todo()
+
+    @classmethod
+    def desde_acumulador(cls, acumulador, var_ind, var_dep, niv_significancia=0.05, titulo_diagrama=None, perezoso=False, instrumentacion=None):
         """
-        self.x = np.array(x_arr)
-        self.y = np.array(y_arr)
+        Crea la regresión a partir de un AcumuladorRegresion, sin tener los datos en memoria.
+
+        Parámetros:
+          - acumulador: AcumuladorRegresion con todos los bloques ya agregados.
+          - var_ind: Descripción de la variable independiente.
+          - var_dep: Descripción de la variable dependiente.
+          - niv_significancia: Nivel de significancia para calcular las hipótesis.
+          - titulo_diagrama: Título para el diagrama de dispersión.
+          - perezoso: Si es True, cada grupo de resultados se calcula hasta que se consulta.
+          - instrumentacion: Instrumentacion (o True) para medir tiempo y memoria de cada etapa.
+
+        Retorna:
+          - Un objeto RegresionLineal con los mismos resultados que con los arreglos completos
+            (no puede mostrar el gráfico porque no conserva los datos).
+        """
+        regresion = cls.__new__(cls)
+        regresion.x = None
+        regresion.y = None
+        regresion._acumulador = acumulador
+        regresion._configurar(var_ind, var_dep, niv_significancia, titulo_diagrama, False, acumulador.n, perezoso, instrumentacion)
+
+        if not perezoso:
+            regresion._calcular_todo()
+
+        return regresion
+
+    def _configurar(self, var_ind, var_dep, niv_significancia, titulo_diagrama, ascii_output, n, perezoso=False, instrumentacion=None):
+        """Guarda los parámetros del análisis e inicializa los resultados."""
         self.ascii_output = ascii_output
         self.alpha = niv_significancia
         self.var_ind = var_ind
@@ -31,106 +215,86 @@ class RegresionLineal:
             var_ind} vs {var_dep}"
 
         # Cantidad de datos
-        self.n = len(self.x)
+        self.n = n
 
-        # Inicializar variables de resultados
-        self.resultados = {
-            "correlacion": {
-                "r": 0,
-                "conclusion": ""
-            },
-            "regresion": {
-                "sum_x": 0,
-                "sum_y": 0,
-                "mean_x": 0,
-                "mean_y": 0,
-                "sum_x2": 0,
-                "sum_y2": 0,
-                "sum_xy": 0,
-                "Sxx": 0,
-                "Syy": 0,
-                "Sxy": 0,
-                "a": 0,
-                "b": 0
-            },
-            "determinacion": {
-                "r_squared": 0,
-                "SCE": 0,
-                "CMT": 0,
-                "CME": 0,
-                "r_squared_adj": 0
-            },
-            "prueba_beta": {
-                "error_std_b": 0,
-                "ep_b": 0,
-                "stat_tabla": 0,
-                "stat_used": "",
-                "conclusion": ""
-            },
-            "prueba_rho": {
-                "error_std_r": 0,
-                "ep_r": 0,
-                "stat_tabla": 0,
-                "stat_used": "",
-                "conclusion": ""
-            }
-        }
+        # Estadístico en tabla, se calcula al primer uso
+        self._stat_tabla = None
 
-        # Realizar todos los cálculos
-        self._calcular_todo()
+        # Medición opcional de cada etapa (None = sin costo extra)
+        self._instrumentacion = Instrumentacion() if instrumentacion is True else instrumentacion
+
+        # Inicializar variables de resultados
+        if perezoso:
+            self.resultados = _ResultadosPerezosos({
+                grupo: partial(self._medir, grupo, getattr(self, metodo))
+                for grupo, metodo in self._GRUPOS.items()
+            })
+        else:
+            self.resultados = _plantilla_resultados()
+
+    @property
+    def metricas(self):
+        """Tiempo y memoria de cada etapa (vacío si no se activó la instrumentación)."""
+        if self._instrumentacion is None:
+            return {}
+        return self._instrumentacion.metricas
+
+    def _medir(self, etapa, calculo):
+        """Ejecuta `calculo` y, si la instrumentación está activa, lo registra como `etapa`."""
+        if self._instrumentacion is None:
+            return calculo()
+        with self._instrumentacion.etapa(etapa):
+            return calculo()
 
     def _calcular_todo(self):
         """Realiza todos los cálculos necesarios para la regresión lineal."""
-        self._calcular_coeficiente_correlacion()
-        self._calcular_regresion()
-        self._calcular_coeficiente_determinacion()
+        self._medir("correlacion", self._calcular_coeficiente_correlacion)
+        self._medir("regresion", self._calcular_regresion)
+        self._medir("determinacion", self._calcular_coeficiente_determinacion)
         self._calcular_pruebas_hipotesis()
 
+    def _momentos(self):
+        """Retorna el AcumuladorRegresion con los momentos de los datos (se calcula una sola vez)."""
+        if self._acumulador is None:
+            self._acumulador = self._medir("momentos", lambda: AcumuladorRegresion().agregar(self.x, self.y))
+        return self._acumulador
+
     def _calcular_coeficiente_correlacion(self):
-        """Calcula el coeficiente de correlación de Pearson usando la función existente."""
-        # Usar la función ya creada
-        r_value, conclusion, n = calcular_coeficiente_correlacion(
-            self.x, self.y, self.var_ind, self.var_dep
-        )
+        """Calcula el coeficiente de correlación de Pearson a partir de los momentos."""
+        r_value = self._momentos().r
+        conclusion = concluir_correlacion(r_value, self.var_ind, self.var_dep)
 
         # Almacenar resultados
         self.resultados["correlacion"]["r"] = r_value
         self.resultados["correlacion"]["conclusion"] = conclusion
 
-        # Calcular sumas (necesario para regresión)
-        sum_x = np.sum(self.x)
-        sum_y = np.sum(self.y)
-        sum_xy = np.sum(self.x * self.y)
-        sum_x2 = np.sum(self.x ** 2)
-        sum_y2 = np.sum(self.y ** 2)
+    def _calcular_sumas(self):
+        """Calcula las sumas necesarias para la regresión."""
+        momentos = self._momentos()
 
         # Guardar en resultados
-        self.resultados["regresion"]["sum_x"] = round(sum_x, 4)
-        self.resultados["regresion"]["sum_y"] = round(sum_y, 4)
-        self.resultados["regresion"]["sum_xy"] = round(sum_xy, 4)
-        self.resultados["regresion"]["sum_x2"] = round(sum_x2, 4)
-        self.resultados["regresion"]["sum_y2"] = round(sum_y2, 4)
+        self.resultados["regresion"]["sum_x"] = round(momentos.sum_x, 4)
+        self.resultados["regresion"]["sum_y"] = round(momentos.sum_y, 4)
+        self.resultados["regresion"]["sum_xy"] = round(momentos.sum_xy, 4)
+        self.resultados["regresion"]["sum_x2"] = round(momentos.sum_x2, 4)
+        self.resultados["regresion"]["sum_y2"] = round(momentos.sum_y2, 4)
 
     def _calcular_regresion(self):
         """Calcula los parámetros de la regresión lineal."""
-        # Calcular medias
-        sum_x = self.resultados["regresion"]["sum_x"]
-        sum_y = self.resultados["regresion"]["sum_y"]
+        self._medir("sumas", self._calcular_sumas)
+        momentos = self._momentos()
 
-        mean_x = sum_x / self.n
-        mean_y = sum_y / self.n
+        # Medias
+        mean_x = momentos.mean_x
+        mean_y = momentos.mean_y
 
         self.resultados["regresion"]["mean_x"] = round(mean_x, 4)
         self.resultados["regresion"]["mean_y"] = round(mean_y, 4)
 
-        # Calcular Sxx, Syy, Sxy
-        sum_x2 = self.resultados["regresion"]["sum_x2"]
-        sum_y2 = self.resultados["regresion"]["sum_y2"]
-        sum_xy = self.resultados["regresion"]["sum_xy"]
-
-        Sxx = sum_x2 - self.n * mean_x ** 2
-        Syy = sum_y2 - self.n * mean_y ** 2
-        Sxy = sum_xy - self.n * mean_x * mean_y
+        # Sxx, Syy, Sxy centrados: no pierden precisión como Σx² - n·x̄²
+        Sxx = momentos.Sxx
+        Syy = momentos.Syy
+        Sxy = momentos.Sxy
 
         self.resultados["regresion"]["Sxx"] = round(Sxx, 4)
         self.resultados["regresion"]["Syy"] = round(Syy, 4)
@@ -158,8 +322,8 @@ class RegresionLineal:
         SCE = Syy * (1 - r_squared)
         self.resultados["determinacion"]["SCE"] = SCE
 
-        # Calcular CMT (Cuadrado Medio Total)
-        CMT = self.resultados["regresion"]["Syy"] / (self.n - 1)
+        # Calcular CMT (Cuadrado Medio Total); no está definido con un solo dato
+        CMT = self.resultados["regresion"]["Syy"] / (self.n - 1) if self.n > 1 else float("nan")
         self.resultados["determinacion"]["CMT"] = CMT
 
         # Calcular CME (Cuadrado Medio del Error)
@@ -167,29 +331,37 @@ class RegresionLineal:
             CME = SCE / (self.n - 2)
             self.resultados["determinacion"]["CME"] = CME
 
-            # Calcular R² ajustado
-            r_squared_adj = 1 - (CME / CMT)
+            # Calcular R² ajustado (nan si y es constante, como en lote.estadisticos_desde_momentos)
+            r_squared_adj = 1 - (CME / CMT) if CMT != 0 else float("nan")
             self.resultados["determinacion"]["r_squared_adj"] = r_squared_adj
 
     def _calcular_pruebas_hipotesis(self):
         """Calcula pruebas de hipótesis para β y ρ."""
-        # Calcular el estadistico en tabla
-        if self.n <= 2:
-            stat_tabla = 0  # No hay grados de libertad suficientes
-        elif self.n < 30:
-            gl = self.n - 2
-            stat_tabla = t.ppf(1 - self.alpha / 2, gl)
-            stat_used = "t"
-        else:
-            stat_tabla = norm.ppf(1 - self.alpha / 2)
-            stat_used = "z"
+        self._medir("prueba_beta", self._calcular_prueba_beta)
+        self._medir("prueba_rho", self._calcular_prueba_rho)
+
+    def _valor_tabla(self):
+        """Retorna el estadístico en tabla y cuál distribución se usó (se calcula una sola vez)."""
+        if self._stat_tabla is None:
+            self._stat_tabla = self._medir("valor_tabla", self._buscar_valor_tabla)
+
+        return self._stat_tabla
+
+    def _buscar_valor_tabla(self):
+        """Busca el estadístico en tabla (t si n < 30, z si n >= 30) en el caché de valores críticos."""
+        return estadistico_tabla(self.alpha, self.n)
+
+    def _valor_p(self, estadistico):
+        """Valor p de dos colas con la misma distribución que el estadístico en tabla."""
+        _, stat_used = self._valor_tabla()
+        return valor_p(estadistico, self.n - 2 if stat_used == "t" else None)
 
+    def _calcular_prueba_beta(self):
+        """Calcula la prueba de hipótesis para β."""
+        stat_tabla, stat_used = self._valor_tabla()
         self.resultados["prueba_beta"]["stat_tabla"] = stat_tabla
         self.resultados["prueba_beta"]["stat_used"] = stat_used
 
-        self.resultados["prueba_rho"]["stat_tabla"] = stat_tabla
-        self.resultados["prueba_rho"]["stat_used"] = stat_used
-
         # Prueba para β
         if self.resultados["determinacion"]["SCE"] > 0 and self.n > 2:
             CME = self.resultados["determinacion"]["CME"]
@@ -200,47 +372,15 @@ class RegresionLineal:
             b = self.resultados["regresion"]["b"]
             ep_b = b / error_std_b
             self.resultados["prueba_beta"]["ep_b"] = ep_b
+            self.resultados["prueba_beta"]["p_valor"] = self._valor_p(ep_b)
 
-            # Hacer la conclusión
-            if ep_b < -stat_tabla:
-                # Verde si se cumple
-                cond1 = f"[green]{
-                    round(ep_b, 4)} < -{round(stat_tabla, 4)}[/green]"
-                rechazo1 = False
-            else:
-                # Rojo si no se cumple
-                cond1 = f"[red]{
-                    round(ep_b, 4)} < -{round(stat_tabla, 4)}[/red]"
-                rechazo1 = True
-
-            if ep_b > stat_tabla:
-                cond2 = f"[green]{round(ep_b, 4)} > {round(
-                    stat_tabla, 4)}[/green]"        # Verde si se cumple
-                rechazo2 = False
-            else:
-                # Rojo si no se cumple
-                cond2 = f"[red]{round(ep_b, 4)} > {round(stat_tabla, 4)}[/red]"
-                rechazo2 = True
-
-            if rechazo1 and rechazo2:
-                conclusion_rr = ("Como se no cumple la región de rechazo entonces se rechaza Hₒ.\n"
-                                 "Entonces no existe evidencia suficiente para rechazar que β = 0.\n"
-                                 "Entonces no existe una relación lineal entre las variables X y Y."
-                                 )
-            else:
-                conclusion_rr = ("Como se cumple la región de rechazo entonces se rechaza Hₒ.\n"
-                                 "Entonces existe evidencia suficiente para rechazar que β = 0.\n"
-                                 "Entonces existe una relación lineal entre las variables X y Y."
-                                 )
-
-            mensaje = (
-                "Prueba de hipótesis de dos colas:\n"
-                # "t < -t_α/2, n - 2 ó t > t_α/2, n - 2\n"
-                "Se evaluó: " + cond1 + " ó " + cond2 + "\n\n" +
-                conclusion_rr
-            )
-
-            self.resultados["prueba_beta"]["conclusion"] = mensaje
+            self.resultados["prueba_beta"]["conclusion"] = concluir_prueba(ep_b, stat_tabla, "β")
+
+    def _calcular_prueba_rho(self):
+        """Calcula la prueba de hipótesis para ρ."""
+        stat_tabla, stat_used = self._valor_tabla()
+        self.resultados["prueba_rho"]["stat_tabla"] = stat_tabla
+        self.resultados["prueba_rho"]["stat_used"] = stat_used
 
         # Prueba para ρ
         r = self.resultados["correlacion"]["r"]
@@ -250,67 +390,46 @@ class RegresionLineal:
 
             ep_r = r / error_std_r
             self.resultados["prueba_rho"]["ep_r"] = ep_r
+            self.resultados["prueba_rho"]["p_valor"] = self._valor_p(ep_r)
+
+            self.resultados["prueba_rho"]["conclusion"] = concluir_prueba(ep_r, stat_tabla, "ρ")
+
+    def mostrar_resultados(self, formato="rich", destino=None):
+        """
+        Muestra todos los resultados calculados.
+
+        Parámetros:
+          - formato: "rich" (tablas en la terminal), "texto", "json" o "html".
+          - destino: Ruta de archivo o stream donde escribir (por defecto, la terminal).
+        """
+        from .reportes import escribir_reporte
+
+        self._medir("mostrar_resultados", lambda: escribir_reporte(self, formato, destino))
+
+    def mostrar_grafico(self, save_path="~/diagrama_dispersion.png", umbral_densidad=100_000, marcados=None):
+        """
+        Muestra el gráfico de dispersión con la línea de regresión (densidad si hay más de `umbral_densidad` puntos).
+
+        `marcados` son puntos a resaltar: máscara, índices o el resultado de diagnosticar().
+        """
+        if self.x is None:
+            raise ValueError("No hay datos para graficar: la regresión se creó desde un acumulador.")
+
+        from .graphic import graphic
 
-            # Hacer la conclusión
-            if ep_r < -stat_tabla:
-                # Verde si se cumple
-                cond1 = f"[green]{
-                    round(ep_r, 4)} < -{round(stat_tabla, 4)}[/green]"
-                rechazo1 = False
-            else:
-                # Rojo si no se cumple
-                cond1 = f"[red]{
-                    round(ep_r, 4)} < -{round(stat_tabla, 4)}[/red]"
-                rechazo1 = True
-
-            if ep_r > stat_tabla:
-                cond2 = f"[green]{round(ep_r, 4)} > {round(
-                    stat_tabla, 4)}[/green]"        # Verde si se cumple
-                rechazo2 = False
-            else:
-                # Rojo si no se cumple
-                cond2 = f"[red]{round(ep_r, 4)} > {round(stat_tabla, 4)}[/red]"
-                rechazo2 = True
-
-            if rechazo1 and rechazo2:
-                conclusion_rr = ("Como se no cumple la región de rechazo entonces no se rechaza Hₒ.\n"
-                                 "Entonces no existe evidencia suficiente para rechazar que ρ = 0.\n"
-                                 "Entonces no existe una correlación lineal entre las variables X y Y."
-                                 )
-            else:
-                conclusion_rr = ("Como se cumple la región de rechazo entonces se rechaza Hₒ.\n"
-                                 "Entonces existe evidencia suficiente para rechazar que ρ = 0.\n"
-                                 "Entonces existe una correlación lineal entre las variables X y Y."
-                                 )
-
-            mensaje = (
-                "Prueba de hipótesis de dos colas:\n"
-                # "t < -t_α/2, n - 2 ó t > t_α/2, n - 2\n"
-                "Se evaluó: " + cond1 + " ó " + cond2 + "\n\n" +
-                conclusion_rr
-            )
-
-            self.resultados["prueba_rho"]["conclusion"] = mensaje
-
-    def mostrar_resultados(self):
-        """Muestra todos los resultados calculados en tablas."""
-        # Llamar a la función table con los resultados
-        table(
-            self.var_ind,
-            self.var_dep,
-            self.resultados["correlacion"]["r"],
-            self.resultados["correlacion"]["conclusion"],
-            self.n,
-            self.resultados
-        )
-
-    def mostrar_grafico(self, save_path="~/diagrama_dispersion.png"):
-        """Muestra el gráfico de dispersión con la línea de regresión."""
         a = self.resultados["regresion"]["a"]
         b = self.resultados["regresion"]["b"]
 
+        # Si se ajustaron modelos polinomiales se dibujan también (los de grado >= 2 y el mejor)
+        curvas = None
+        polinomial = self.resultados.get("polinomial")
+        if polinomial:
+            curvas = {nombre: ajuste for nombre, ajuste in polinomial["modelos"].items()
+                      if (ajuste["transformacion"] == "lineal" and ajuste["grado"] >= 2) or nombre == polinomial["mejor_modelo"]}
+            curvas.pop("grado 1", None)
+
         # Usar la función graphic actualizada para incluir la línea de regresión
-        graphic(
+        self._medir("mostrar_grafico", lambda: graphic(
             self.x,
             self.y,
             self.var_ind,
@@ -320,8 +439,183 @@ class RegresionLineal:
             save_path=save_path,
             a=a,
             b=b,
-            ascii_output=self.ascii_output
-        )
+            ascii_output=self.ascii_output,
+            umbral_densidad=umbral_densidad,
+            curvas=curvas,
+            marcados=marcados
+        ))
+
+    def diagnosticar(self, k=None, umbral_residuo=3.0, umbral_cook=None, bloque=1 << 16, out=None):
+        """
+        Residuos, residuos estandarizados, apalancamiento y distancia de Cook de cada dato,
+        recorriendo x y y por bloques con a, b, CME y Sxx ya calculados (ver diagnostico.diagnosticar).
+
+        Parámetros:
+          - k: Si se da, se retornan los k datos con mayor distancia de Cook.
+          - umbral_residuo: Límite para |residuo estandarizado|.
+          - umbral_cook: Límite para la distancia de Cook (por defecto, 4/n).
+          - bloque: Cantidad de datos que se procesan a la vez.
+          - out: Arreglo booleano de longitud n para la máscara (opcional).
+
+        Retorna:
+          - Con k, los k datos más influyentes; sin k, la máscara de datos marcados.
+        """
+        if self.x is None:
+            raise ValueError("No hay datos: la regresión se creó desde un acumulador.")
+
+        from .diagnostico import diagnosticar
+
+        momentos = self._momentos()
+        return self._medir("diagnostico", lambda: diagnosticar(
+            self.x, self.y, self.resultados["regresion"]["a"], self.resultados["regresion"]["b"],
+            momentos.mean_x, momentos.Sxx, self.resultados["determinacion"]["CME"],
+            k, umbral_residuo, umbral_cook, bloque, out))
+
+    def ajustar_modelos(self, grado_max=3, transformaciones=("lineal", "log_x", "log_y", "log_xy"), bloque=1 << 16):
+        """
+        Ajusta polinomios hasta `grado_max` y variantes con logaritmos a partir de un índice de
+        sumas de potencias construido en una sola pasada sobre los datos.
+
+        Los resultados quedan en resultados["polinomial"] (y se muestran en los reportes y el gráfico).
+        El índice queda en self.indice_potencias para ajustar otros grados sin volver a leer los datos.
+
+        Parámetros:
+          - grado_max: Grado máximo de los polinomios.
+          - transformaciones: Variantes de los datos ("lineal", "log_x", "log_y", "log_xy").
+          - bloque: Cantidad de datos que se procesan a la vez.
+
+        Retorna:
+          - El diccionario {"modelos": {nombre: ajuste}, "mejor_modelo": nombre}.
+        """
+        if self.x is None:
+            raise ValueError("No hay datos: la regresión se creó desde un acumulador.")
+
+        from .polinomial import IndicePotencias
+
+        self.indice_potencias = self._medir(
+            "indice_potencias", lambda: IndicePotencias(grado_max, transformaciones).agregar(self.x, self.y, bloque))
+        modelos, mejor = self.indice_potencias.comparar()
+
+        self.resultados["polinomial"] = {"modelos": modelos, "mejor_modelo": mejor}
+        return self.resultados["polinomial"]
+
+    def remuestrear(self, n_remuestras=10_000, semilla=None, n_trabajadores=None, memoria_max=256 * 1024 ** 2):
+        """
+        Agrega a las pruebas t/z intervalos bootstrap para β y ρ y el valor p de una prueba de
+        permutación, que no suponen residuos normales (ver remuestreo.pruebas_remuestreo).
+
+        Los resultados quedan en resultados["remuestreo"] (y se muestran en los reportes).
+
+        Parámetros:
+          - n_remuestras: Cantidad de remuestras bootstrap y de permutaciones.
+          - semilla: Entero para repetir el resultado (None = al azar; la semilla usada queda en los resultados).
+          - n_trabajadores: Cantidad de hilos (por defecto, los núcleos disponibles).
+          - memoria_max: Bytes máximos para los bloques de remuestras.
+
+        Retorna:
+          - El diccionario de resultados["remuestreo"].
+        """
+        if self.x is None:
+            raise ValueError("No hay datos: la regresión se creó desde un acumulador.")
+
+        from .remuestreo import pruebas_remuestreo
+
+        self.resultados["remuestreo"] = self._medir("remuestreo", lambda: pruebas_remuestreo(
+            self.x, self.y, n_remuestras, self.alpha, semilla, n_trabajadores, memoria_max))
+        return self.resultados["remuestreo"]
+
+    def predecir(self, x_nuevos, out=None, intervalos=False, bloque=1 << 16):
+        """
+        Evalúa ŷ = a + b·x para muchos valores nuevos, por bloques y sin ciclos por elemento.
+
+        Con `intervalos` también calcula, con el mismo estadístico en tabla de las pruebas
+        (t si n < 30, z si n >= 30):
+          - Intervalo de confianza de la media: ŷ ± t·√(CME·(1/n + (x - x̄)²/Sxx))
+          - Intervalo de predicción: ŷ ± t·√(CME·(1 + 1/n + (x - x̄)²/Sxx))
+
+        Parámetros:
+          - x_nuevos: Valores de la variable independiente (cualquier forma).
+          - out: Arreglo (C-contiguo) donde escribir el resultado. Sin intervalos tiene la forma
+            de x_nuevos; con intervalos tiene la forma (5, *x_nuevos.shape).
+          - intervalos: Si es True también se calculan los intervalos.
+          - bloque: Cantidad de valores que se procesan a la vez.
+
+        Retorna:
+          - Sin intervalos, el arreglo con ŷ.
+          - Con intervalos, un diccionario con "prediccion", "confianza_inf", "confianza_sup",
+            "prediccion_inf" y "prediccion_sup" (vistas de un mismo arreglo).
+        """
+        x = np.asarray(x_nuevos)
+        a = self.resultados["regresion"]["a"]
+        b = self.resultados["regresion"]["b"]
+
+        forma = (5, *x.shape) if intervalos else x.shape
+        if out is None:
+            out = np.empty(forma, dtype=np.result_type(x.dtype, np.float64))
+        elif out.shape != forma or not out.flags.c_contiguous:
+            raise ValueError(f"out debe ser un arreglo C-contiguo con forma {forma}.")
+
+        if intervalos:
+            momentos = self._momentos()
+            CME = self.resultados["determinacion"]["CME"]
+            stat_tabla, _ = self._valor_tabla()
+            if self.n <= 2 or momentos.Sxx == 0:
+                raise ValueError("Se necesitan n > 2 y valores de x distintos para calcular intervalos.")
+            salidas = out.reshape(5, -1)
+        else:
+            salidas = out.reshape(1, -1)
+
+        x_plano = x.reshape(-1)
+        total = len(x_plano)
+        if intervalos:
+            # Buffers reutilizables para el término (x - x̄)² y los semianchos
+            h = np.empty(min(bloque, total))
+            semiancho = np.empty(min(bloque, total))
+
+        for i in range(0, total, bloque):
+            xb = x_plano[i:i + bloque]
+            m = len(xb)
+            yb = salidas[0, i:i + m]
+
+            np.multiply(xb, b, out=yb, casting="unsafe")
+            yb += a
+
+            if intervalos:
+                hb = h[:m]
+                sb = semiancho[:m]
+
+                # h = 1/n + (x - x̄)²/Sxx
+                np.subtract(xb, momentos.mean_x, out=hb)
+                np.square(hb, out=hb)
+                hb /= momentos.Sxx
+                hb += 1 / self.n
+
+                np.multiply(hb, CME, out=sb)
+                np.sqrt(sb, out=sb)
+                sb *= stat_tabla
+                np.subtract(yb, sb, out=salidas[1, i:i + m], casting="unsafe")
+                np.add(yb, sb, out=salidas[2, i:i + m], casting="unsafe")
+
+                hb += 1
+                np.multiply(hb, CME, out=sb)
+                np.sqrt(sb, out=sb)
+                sb *= stat_tabla
+                np.subtract(yb, sb, out=salidas[3, i:i + m], casting="unsafe")
+                np.add(yb, sb, out=salidas[4, i:i + m], casting="unsafe")
+
+        if not intervalos:
+            return out
+
+        return dict(zip(("prediccion", "confianza_inf", "confianza_sup", "prediccion_inf", "prediccion_sup"), out))
+
+    def compactar(self):
+        """
+        Retorna los resultados como un ResultadoRegresion (números y códigos, sin datos ni textos),
+        para guardar muchos ajustes en poca memoria (ver almacen.AlmacenResultados).
+        """
+        from .almacen import ResultadoRegresion
+
+        return ResultadoRegresion.desde_regresion(self)
 
     def obtener_ecuacion_recta(self):
         """Retorna la ecuación de la recta de regresión."""
@@ -335,5 +629,8 @@ class RegresionLineal:
 
     def creditos(self):
         """Imprime en la terminal los créditos"""
+        from rich.console import Console
+        from rich.align import Align
+
         console = Console()
         console.print(Align("\nHecho por Gael Mora   ", align="right"))
@@ -0,0 +1,203 @@
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+# Cada grupo de remuestras tiene su propia semilla (hija de la semilla principal), así el resultado
+# depende solo de la semilla y de n_remuestras, no de la cantidad de hilos ni del límite de memoria.
+_REMUESTRAS_POR_SEMILLA = 1024
+
+# Bytes por remuestra y por dato: índices, x y y remuestreados (bootstrap) o y permutada
+_BYTES_POR_DATO = {"bootstrap": 24, "permutacion": 8}
+
+
+def _datos_centrados(x_arr, y_arr):
+    """x y y como float64 centrados en su media (así las sumas de las remuestras no pierden precisión)."""
+    x = np.asarray(x_arr, dtype=np.float64).ravel()
+    y = np.asarray(y_arr, dtype=np.float64).ravel()
+    if len(x) != len(y):
+        raise ValueError("x y y deben tener la misma longitud.")
+    if len(x) < 3:
+        raise ValueError("Se necesitan al menos 3 datos para remuestrear.")
+    xc = x - x.mean()
+    if not np.any(xc):
+        raise ValueError("x es constante: no se puede estimar la pendiente al remuestrear.")
+    return xc, y - y.mean()
+
+
+def _semilla(semilla):
+    """SeedSequence de la semilla dada (o una nueva al azar si es None)."""
+    return semilla if isinstance(semilla, np.random.SeedSequence) else np.random.SeedSequence(semilla)
+
+
+def _ejecutar_grupos(tarea, n_remuestras, semilla, n_trabajadores, memoria_max, metodo, n):
+    """
+    Reparte las remuestras en grupos con semillas independientes y los procesa en un pool de hilos.
+
+    Cada hilo procesa su grupo en bloques de filas (remuestras) que caben en `memoria_max`
+    repartida entre los hilos; `tarea(rng, inicio, fin)` llena las salidas del rango.
+    """
+    n_trabajadores = n_trabajadores or os.cpu_count() or 1
+    filas = max(1, int(memoria_max // (n_trabajadores * _BYTES_POR_DATO[metodo] * n)))
+    inicios = range(0, n_remuestras, _REMUESTRAS_POR_SEMILLA)
+    semillas = semilla.spawn(len(inicios))
+
+    def grupo(i):
+        rng = np.random.default_rng(semillas[i])
+        inicio = inicios[i]
+        fin = min(inicio + _REMUESTRAS_POR_SEMILLA, n_remuestras)
+        # Los bloques de un grupo salen en orden del mismo generador: mismos números que en una sola llamada
+        for j in range(inicio, fin, filas):
+            tarea(rng, j, min(j + filas, fin))
+
+    if n_trabajadores == 1 or len(inicios) == 1:
+        for i in range(len(inicios)):
+            grupo(i)
+    else:
+        with ThreadPoolExecutor(max_workers=n_trabajadores) as executor:
+            list(executor.map(grupo, range(len(inicios))))
+
+
+def replicas_bootstrap(x_arr, y_arr, n_remuestras=10_000, semilla=None, n_trabajadores=None, memoria_max=256 * 1024 ** 2):
+    """
+    Calcula b y r de `n_remuestras` remuestras bootstrap de pares (x, y), por bloques vectorizados.
+
+    Cada bloque sortea los índices de varias remuestras a la vez (una fila por remuestra) y
+    calcula todos sus momentos con operaciones sobre el bloque, sin crear un RegresionLineal por remuestra.
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - n_remuestras: Cantidad de remuestras.
+      - semilla: Entero o np.random.SeedSequence (None = al azar).
+      - n_trabajadores: Cantidad de hilos (por defecto, los núcleos disponibles).
+      - memoria_max: Bytes máximos para los bloques de todos los hilos juntos.
+
+    Retorna:
+      - Una tupla (b, r) de arreglos con un valor por remuestra (nan si en la remuestra x es constante).
+    """
+    xc, yc = _datos_centrados(x_arr, y_arr)
+    n = len(xc)
+    tipo_indice = np.int32 if n < 2 ** 31 else np.int64
+    b = np.empty(n_remuestras)
+    r = np.empty(n_remuestras)
+
+    def tarea(rng, inicio, fin):
+        indices = rng.integers(0, n, size=(fin - inicio, n), dtype=tipo_indice)
+        xb = np.take(xc, indices)
+        yb = np.take(yc, indices)
+        del indices
+
+        mean_x = xb.mean(axis=1)
+        mean_y = yb.mean(axis=1)
+        Sxx = np.einsum("ij,ij->i", xb, xb) - n * mean_x ** 2
+        Syy = np.einsum("ij,ij->i", yb, yb) - n * mean_y ** 2
+        Sxy = np.einsum("ij,ij->i", xb, yb) - n * mean_x * mean_y
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            b[inicio:fin] = np.where(Sxx > 0, Sxy / Sxx, np.nan)
+            r[inicio:fin] = np.where((Sxx > 0) & (Syy > 0), Sxy / np.sqrt(Sxx * Syy), np.nan)
+
+    _ejecutar_grupos(tarea, n_remuestras, _semilla(semilla), n_trabajadores, memoria_max, "bootstrap", n)
+    return b, r
+
+
+def replicas_permutacion(x_arr, y_arr, n_remuestras=10_000, semilla=None, n_trabajadores=None, memoria_max=256 * 1024 ** 2):
+    """
+    Calcula Sxy de `n_remuestras` permutaciones de y (Hₒ: no hay relación entre x y y).
+
+    Al permutar y, las medias, Sxx y Syy no cambian: b = Sxy/Sxx y r = Sxy/√(Sxx·Syy) dependen
+    solo de Sxy, que para un bloque de permutaciones es un solo producto matriz-vector.
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - n_remuestras: Cantidad de permutaciones.
+      - semilla: Entero o np.random.SeedSequence (None = al azar).
+      - n_trabajadores: Cantidad de hilos (por defecto, los núcleos disponibles).
+      - memoria_max: Bytes máximos para los bloques de todos los hilos juntos.
+
+    Retorna:
+      - Un arreglo con Sxy de cada permutación.
+    """
+    xc, yc = _datos_centrados(x_arr, y_arr)
+    n = len(xc)
+    Sxy = np.empty(n_remuestras)
+
+    def tarea(rng, inicio, fin):
+        permutadas = np.tile(yc, (fin - inicio, 1))
+        rng.permuted(permutadas, axis=1, out=permutadas)
+        # einsum suma cada fila igual sin importar cuántas filas tenga el bloque (matmul puede cambiar el orden)
+        np.einsum("ij,j->i", permutadas, xc, out=Sxy[inicio:fin])
+
+    _ejecutar_grupos(tarea, n_remuestras, _semilla(semilla), n_trabajadores, memoria_max, "permutacion", n)
+    return Sxy
+
+
+def pruebas_remuestreo(x_arr, y_arr, n_remuestras=10_000, niv_significancia=0.05, semilla=None, n_trabajadores=None, memoria_max=256 * 1024 ** 2):
+    """
+    Intervalos bootstrap para β y ρ y valor p de permutación, como complemento de las pruebas t/z
+    (no suponen que los residuos sean normales).
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente.
+      - y_arr: Valores de la variable dependiente.
+      - n_remuestras: Cantidad de remuestras bootstrap y de permutaciones.
+      - niv_significancia: Nivel de significancia (los intervalos son de 1 - α).
+      - semilla: Entero para repetir el resultado (None = al azar; la semilla usada se reporta).
+      - n_trabajadores: Cantidad de hilos (por defecto, los núcleos disponibles).
+      - memoria_max: Bytes máximos para los bloques de remuestras.
+
+    Retorna:
+      - Un diccionario con n_remuestras, semilla, los intervalos percentil (b_inf, b_sup, r_inf, r_sup),
+        los errores estándar bootstrap, el valor p de permutación (el mismo para β y ρ) y la conclusión.
+        Si y es constante, r y lo que depende de ella quedan como nan; si x es constante se lanza ValueError.
+    """
+    semilla = _semilla(semilla)
+    semilla_bootstrap, semilla_permutacion = semilla.spawn(2)
+
+    xc, yc = _datos_centrados(x_arr, y_arr)
+    Sxx, Syy, Sxy = xc @ xc, yc @ yc, xc @ yc
+
+    b, r = replicas_bootstrap(xc, yc, n_remuestras, semilla_bootstrap, n_trabajadores, memoria_max)
+    permutadas = replicas_permutacion(xc, yc, n_remuestras, semilla_permutacion, n_trabajadores, memoria_max)
+
+    # Valor p de dos colas con la corrección +1 (nunca es 0); el margen evita empates por redondeo
+    extremos = np.count_nonzero(np.abs(permutadas) >= np.abs(Sxy) * (1 - 1e-12))
+    p_valor = (extremos + 1) / (n_remuestras + 1)
+
+    percentiles = (100 * niv_significancia / 2, 100 * (1 - niv_significancia / 2))
+    b_inf, b_sup = np.nanpercentile(b, percentiles)
+    with warnings.catch_warnings():
+        # Si y es constante todas las r son nan (y el intervalo y el error estándar también)
+        warnings.simplefilter("ignore", RuntimeWarning)
+        r_inf, r_sup = np.nanpercentile(r, percentiles)
+        error_std_r = np.nanstd(r, ddof=1)
+
+    nivel = f"{(1 - niv_significancia) * 100:g}%"
+    rechaza = p_valor < niv_significancia
+    color = "green" if rechaza else "red"
+    conclusion = (
+        f"Intervalo bootstrap de {nivel} para β: [{b_inf:.4f}, {b_sup:.4f}]\n"
+        f"Intervalo bootstrap de {nivel} para ρ: [{r_inf:.4f}, {r_sup:.4f}]\n"
+        f"Prueba de permutación: [{color}]p = {p_valor:.4f}[/{color}]\n" +
+        ("Entonces se rechaza Hₒ: existe una relación lineal entre las variables X y Y."
+         if rechaza else
+         "Entonces no se rechaza Hₒ: no existe evidencia de una relación lineal entre las variables X y Y.")
+    )
+
+    return {
+        "n_remuestras": n_remuestras,
+        "semilla": semilla.entropy,
+        "b": float(Sxy / Sxx),
+        "b_inf": float(b_inf),
+        "b_sup": float(b_sup),
+        "error_std_b": float(np.nanstd(b, ddof=1)),
+        "r": float(Sxy / np.sqrt(Sxx * Syy)) if Syy > 0 else float("nan"),
+        "r_inf": float(r_inf),
+        "r_sup": float(r_sup),
+        "error_std_r": float(error_std_r),
+        "remuestras_degeneradas": int(np.count_nonzero(np.isnan(r))),
+        "p_valor": float(p_valor),
+        "conclusion": conclusion
+    }
@@ -0,0 +1,279 @@
+import html
+import json
+import math
+import re
+import sys
+from contextlib import contextmanager
+import numpy as np
+
+# Grupos de resultados en el orden en que se reportan
+GRUPOS = ("correlacion", "regresion", "determinacion", "prueba_beta", "prueba_rho")
+
+# Marcas de color de rich que se usan en las conclusiones ([green]...[/green])
+_MARCAS_RICH = re.compile(r"\[(/?)(green|red)\]")
+
+
+def datos_reporte(regresion, conservar_marcas=False):
+    """
+    Extrae lo necesario para un reporte de un RegresionLineal (o de un diccionario ya armado).
+
+    Parámetros:
+      - regresion: Objeto RegresionLineal o diccionario con var_ind, var_dep, n y resultados.
+      - conservar_marcas: Si es True no se quitan las marcas de color de rich (para el HTML).
+
+    Retorna:
+      - Un diccionario {"var_ind", "var_dep", "n", "resultados"} con valores de Python
+        (sin tipos de numpy, sin marcas de color y con None en lugar de NaN o infinito).
+    """
+    if isinstance(regresion, dict):
+        var_ind, var_dep, n, resultados = regresion["var_ind"], regresion["var_dep"], regresion["n"], regresion["resultados"]
+    else:
+        var_ind, var_dep, n, resultados = regresion.var_ind, regresion.var_dep, regresion.n, regresion.resultados
+
+    # .get() también calcula los grupos pendientes si los resultados son perezosos
+    grupos = dict.fromkeys([*GRUPOS, *resultados.keys()])
+    planos = {grupo: {clave: valor_plano(valor, conservar_marcas) for clave, valor in resultados.get(grupo).items()}
+              for grupo in grupos if resultados.get(grupo) is not None}
+
+    return {"var_ind": var_ind, "var_dep": var_dep, "n": int(n), "resultados": planos}
+
+
+def valor_plano(valor, conservar_marcas=False):
+    """
+    Convierte tipos de numpy a tipos de Python, quita las marcas de rich de los textos y cambia
+    NaN e infinito por None (JSON estricto no los admite); entra en diccionarios y listas.
+    """
+    if isinstance(valor, str):
+        return valor if conservar_marcas else _MARCAS_RICH.sub("", valor)
+    if isinstance(valor, dict):
+        return {clave: valor_plano(v, conservar_marcas) for clave, v in valor.items()}
+    if isinstance(valor, (list, tuple, np.ndarray)):
+        return [valor_plano(v, conservar_marcas) for v in (valor.tolist() if isinstance(valor, np.ndarray) else valor)]
+    if isinstance(valor, np.generic):
+        valor = valor.item()
+    if isinstance(valor, float) and not math.isfinite(valor):
+        return None
+    return valor
+
+
+def renderizar_rich(regresion, destino):
+    """Reporte con las tablas de rich (el mismo de mostrar_resultados)."""
+    from rich.console import Console
+    from .table import table
+
+    if isinstance(regresion, dict):
+        var_ind, var_dep, n, resultados = regresion["var_ind"], regresion["var_dep"], regresion["n"], regresion["resultados"]
+    else:
+        var_ind, var_dep, n, resultados = regresion.var_ind, regresion.var_dep, regresion.n, regresion.resultados
+
+    # En la terminal se conservan los colores; en archivos se escribe sin códigos ANSI
+    console = Console() if destino is sys.stdout else Console(file=destino, force_terminal=False, no_color=True)
+    correlacion = resultados["correlacion"]
+    table(var_ind, var_dep, correlacion["r"], correlacion["conclusion"], n, resultados, console=console)
+
+
+def renderizar_texto(regresion, destino):
+    """Reporte en texto plano, con las mismas secciones que las tablas de rich."""
+    datos = regresion if _es_plano(regresion) else datos_reporte(regresion)
+    res = datos["resultados"]
+    reg, det = res.get("regresion", {}), res.get("determinacion", {})
+
+    secciones = [
+        ("Declaración de variables", [
+            f"Sea x {datos['var_ind']} (variable independiente)",
+            f"    y {datos['var_dep']} (variable dependiente)"
+        ]),
+        ("Correlación de las variables", [
+            f"r = {_num(res['correlacion']['r'])}",
+            res["correlacion"]["conclusion"]
+        ]),
+        ("Suma de cuadrados de regresión", [
+            f"n = {datos['n']}",
+            f"Σx = {reg.get('sum_x', 0)}    x̄ = {reg.get('mean_x', 0)}",
+            f"Σy = {reg.get('sum_y', 0)}    ȳ = {reg.get('mean_y', 0)}",
+            f"Σx² = {reg.get('sum_x2', 0)}    Sₓₓ = {reg.get('Sxx', 0)}",
+            f"Σy² = {reg.get('sum_y2', 0)}    Sᵧᵧ = {reg.get('Syy', 0)}",
+            f"Σxy = {reg.get('sum_xy', 0)}    Sₓᵧ = {reg.get('Sxy', 0)}"
+        ]),
+        ("Estimadores de mínimos cuadrados de α y β", [
+            f"b = {_num(reg.get('b', 0))}",
+            f"a = {_num(reg.get('a', 0))}"
+        ]),
+        ("Coeficiente de determinación", [
+            f"r² = {_num(det.get('r_squared', 0))} = {_num(det.get('r_squared', 0), 100, 2)}%"
+        ]),
+        ("Coeficiente de determinación ajustado R²ₐⱼ", [
+            f"SCE = {_num(det.get('SCE', 0))}",
+            f"CMT = {_num(det.get('CMT', 0))}",
+            f"CME = {_num(det.get('CME', 0))}",
+            f"R²ₐⱼ = {_num(det.get('r_squared_adj', 0))} = {_num(det.get('r_squared_adj', 0), 100, 2)}%"
+        ]),
+        _seccion_prueba("Pruebas para β", "β", "δ_b", "ep_b", "error_std_b", res.get("prueba_beta", {})),
+        _seccion_prueba("Pruebas para ρ", "ρ", "δᵣ", "ep_r", "error_std_r", res.get("prueba_rho", {})),
+    ]
+
+    # Grupos adicionales (por ejemplo de otros análisis) se listan como clave = valor
+    for grupo, valores in res.items():
+        if grupo == "polinomial":
+            secciones.append(("Modelos polinomiales", [
+                *(f"{nombre}: {ajuste['ecuacion']}    R² = {_num(ajuste['r_squared'])}    R²ₐⱼ = {_num(ajuste['r_squared_adj'])}"
+                  for nombre, ajuste in valores["modelos"].items()),
+                f"Mejor modelo: {valores['mejor_modelo']}"
+            ]))
+        elif grupo not in GRUPOS:
+            secciones.append((grupo, [f"{clave} = {valor}" for clave, valor in valores.items()]))
+
+    for titulo, lineas in secciones:
+        destino.write(f"== {titulo} ==\n")
+        destino.write("\n".join(lineas))
+        destino.write("\n\n")
+
+
+def _num(valor, escala=1, decimales=4):
+    """Formatea un número del reporte (None, que viene de NaN o infinito, se escribe como "nan")."""
+    return "nan" if valor is None else f"{valor * escala:.{decimales}f}"
+
+
+def _seccion_prueba(titulo, parametro, simbolo_error, llave_ep, llave_error, prueba):
+    """Líneas de texto de una prueba de hipótesis."""
+    stat_used = prueba.get("stat_used", "")
+    return (titulo, [
+        f"Hₒ: {parametro} = 0",
+        f"Hₐ: {parametro} ≠ 0",
+        f"{simbolo_error} = {_num(prueba.get(llave_error, 0))}",
+        f"{stat_used} = {_num(prueba.get(llave_ep, 0))}",
+        f"{stat_used}_α/2, n - 2 = +- {_num(prueba.get('stat_tabla', 0))}",
+        f"p = {_num(prueba.get('p_valor', 0))}",
+        prueba.get("conclusion", "")
+    ])
+
+
+def renderizar_json(regresion, destino):
+    """Reporte en JSON (un objeto por regresión, en una sola línea)."""
+    # Siempre se pasa por datos_reporte: también limpia los NaN de un diccionario ya armado
+    datos = datos_reporte(regresion)
+    destino.write(json.dumps(datos, ensure_ascii=False, default=valor_plano, allow_nan=False))
+    destino.write("\n")
+
+
+_ESTILO_HTML = (
+    "<style>body{font-family:sans-serif}table{border-collapse:collapse;margin:0.5em 0}"
+    "td{border:1px solid #aaa;padding:0.2em 0.6em;white-space:pre-line}"
+    ".verde{color:green}.rojo{color:red}</style>"
+)
+
+
+def renderizar_html(regresion, destino, documento=True):
+    """
+    Reporte en HTML.
+
+    Parámetros:
+      - regresion: Objeto RegresionLineal o resultado de datos_reporte().
+      - destino: Stream de texto donde escribir.
+      - documento: Si es False solo se escribe la sección (para juntar varias en un archivo).
+    """
+    # Las marcas de color se conservan para convertirlas en clases de CSS
+    datos = regresion if _es_plano(regresion) else datos_reporte(regresion, conservar_marcas=True)
+
+    if documento:
+        destino.write(f"<!DOCTYPE html><html><head><meta charset=\"utf-8\">{_ESTILO_HTML}</head><body>\n")
+
+    destino.write(f"<section class=\"regresion\"><h2>{html.escape(str(datos['var_dep']))} vs {html.escape(str(datos['var_ind']))}</h2>\n")
+    destino.write(f"<p>n = {datos['n']}</p>\n")
+    for grupo, valores in datos["resultados"].items():
+        destino.write(f"<h3>{html.escape(grupo)}</h3><table>\n")
+        for clave, valor in valores.items():
+            destino.write(f"<tr><td>{html.escape(clave)}</td><td>{_html_valor(valor)}</td></tr>\n")
+        destino.write("</table>\n")
+    destino.write("</section>\n")
+
+    if documento:
+        destino.write("</body></html>\n")
+
+
+def _html_valor(valor):
+    """Escapa el valor y convierte las marcas de color de rich en clases de CSS (los diccionarios, como subtabla)."""
+    if isinstance(valor, dict):
+        filas = "".join(f"<tr><td>{html.escape(str(clave))}</td><td>{_html_valor(v)}</td></tr>" for clave, v in valor.items())
+        return f"<table>{filas}</table>"
+    texto = html.escape(str(valor))
+    return _MARCAS_RICH.sub(lambda m: "</span>" if m.group(1) else f"<span class=\"{'verde' if m.group(2) == 'green' else 'rojo'}\">", texto)
+
+
+def _es_plano(regresion):
+    """True si ya es la salida de datos_reporte()."""
+    return isinstance(regresion, dict) and "resultados" in regresion and "var_ind" in regresion
+
+
+# formato -> función renderizadora(regresion, destino)
+RENDERIZADORES = {
+    "rich": renderizar_rich,
+    "texto": renderizar_texto,
+    "json": renderizar_json,
+    "html": renderizar_html,
+}
+
+
+@contextmanager
+def _abrir_destino(destino):
+    """Abre el destino si es una ruta; si es un stream (o None = stdout) lo usa tal cual."""
+    if destino is None:
+        yield sys.stdout
+    elif hasattr(destino, "write"):
+        yield destino
+    else:
+        with open(destino, "w", encoding="utf-8") as archivo:
+            yield archivo
+
+
+def escribir_reporte(regresion, formato="rich", destino=None):
+    """
+    Escribe el reporte de una regresión en el formato pedido.
+
+    Parámetros:
+      - regresion: Objeto RegresionLineal.
+      - formato: "rich", "texto", "json" o "html".
+      - destino: Ruta de archivo, stream de texto, o None para la terminal.
+    """
+    if formato not in RENDERIZADORES:
+        raise ValueError(f"Formato no soportado: {formato} (usa {', '.join(RENDERIZADORES)}).")
+
+    with _abrir_destino(destino) as salida:
+        RENDERIZADORES[formato](regresion, salida)
+
+
+def escribir_reportes(regresiones, destino, formato="json"):
+    """
+    Escribe los reportes de muchas regresiones en un solo archivo, en una sola pasada.
+
+    No se construyen objetos de rich: "json" escribe una línea JSON por regresión (JSON Lines),
+    "texto" concatena los reportes y "html" arma un solo documento con una sección por regresión.
+    `regresiones` puede ser un generador, así no hace falta tenerlas todas en memoria.
+
+    Parámetros:
+      - regresiones: Iterable de RegresionLineal (o de salidas de datos_reporte()).
+      - destino: Ruta de archivo o stream de texto.
+      - formato: "json", "texto" o "html".
+
+    Retorna:
+      - La cantidad de reportes escritos.
+    """
+    if formato not in ("json", "texto", "html"):
+        raise ValueError(f"Formato no soportado para reportes en lote: {formato} (usa json, texto o html).")
+
+    total = 0
+    with _abrir_destino(destino) as salida:
+        if formato == "html":
+            salida.write(f"<!DOCTYPE html><html><head><meta charset=\"utf-8\">{_ESTILO_HTML}</head><body>\n")
+
+        for regresion in regresiones:
+            if formato == "html":
+                renderizar_html(regresion, salida, documento=False)
+            else:
+                RENDERIZADORES[formato](regresion, salida)
+            total += 1
+
+        if formato == "html":
+            salida.write("</body></html>\n")
+
+    return total
@@ -0,0 +1,299 @@
+"""
+Servicio local de regresión lineal sobre asyncio (HTTP o socket Unix).
+
+Las peticiones que llegan casi al mismo tiempo se juntan durante una ventana corta
+y se calculan juntas con ajustar_lote, así muchas regresiones pequeñas cuestan
+unas cuantas operaciones vectorizadas.
+
+Uso:
+    python -m functions.servidor servir --puerto 8765 --ventana-ms 5
+    python -m functions.servidor servir --unix /tmp/regresion.sock
+    python -m functions.servidor carga --puerto 8765 --concurrencia 64 --total 20000
+
+Petición:
+    POST /ajustar  {"x": [...], "y": [...], "niv_significancia": 0.05}
+Respuesta:
+    {"n": ..., "resultados": {...}}  (misma estructura que RegresionLineal.resultados)
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import numpy as np
+from .entrada import validar_datos
+from .lote import ajustar_lote, resultados_desde_lote
+
+_ESTADOS = {
+    200: "200 OK",
+    400: "400 Bad Request",
+    404: "404 Not Found",
+    500: "500 Internal Server Error",
+    503: "503 Service Unavailable",
+}
+
+
+class ServidorRegresion:
+    """
+    Servidor asyncio que agrupa las peticiones de ajuste en micro-lotes.
+
+    Parámetros:
+      - host, puerto: Dirección TCP donde escuchar.
+      - ruta_unix: Si se da, escucha en este socket Unix en lugar de TCP.
+      - ventana_ms: Tiempo que se espera a que lleguen más peticiones antes de calcular un lote.
+      - max_lote: Cantidad máxima de peticiones por lote.
+      - profundidad_cola: Peticiones en espera permitidas; si se llena se responde 503.
+    """
+
+    def __init__(self, host="127.0.0.1", puerto=8765, ruta_unix=None, ventana_ms=5, max_lote=1024, profundidad_cola=10_000):
+        self.host = host
+        self.puerto = puerto
+        self.ruta_unix = ruta_unix
+        self.ventana_ms = ventana_ms
+        self.max_lote = max_lote
+        self.profundidad_cola = profundidad_cola
+
+        self._cola = None
+        self._servidor = None
+        self._tarea_lotes = None
+        self.estadisticas = {"peticiones": 0, "lotes": 0, "rechazadas": 0}
+
+    async def iniciar(self):
+        """Empieza a escuchar y a procesar lotes (sin bloquear)."""
+        self._cola = asyncio.Queue(maxsize=self.profundidad_cola)
+        self._tarea_lotes = asyncio.create_task(self._procesar_lotes())
+
+        if self.ruta_unix:
+            self._servidor = await asyncio.start_unix_server(self._atender, path=self.ruta_unix)
+        else:
+            self._servidor = await asyncio.start_server(self._atender, self.host, self.puerto)
+            # Si se pidió el puerto 0, se guarda el que asignó el sistema
+            self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def servir(self):
+        """Inicia el servidor y atiende peticiones hasta que se cancele."""
+        await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def cerrar(self):
+        """Deja de aceptar conexiones y detiene el procesamiento de lotes."""
+        self._servidor.close()
+        await self._servidor.wait_closed()
+        self._tarea_lotes.cancel()
+
+    async def _atender(self, lector, escritor):
+        """Atiende una conexión HTTP/1.1 (con keep-alive)."""
+        try:
+            while True:
+                linea = await lector.readline()
+                if not linea:
+                    break
+                metodo, ruta, _ = linea.decode("latin-1").split(" ", 2)
+
+                encabezados = {}
+                while True:
+                    encabezado = await lector.readline()
+                    if encabezado in (b"\r\n", b"\n", b""):
+                        break
+                    llave, _, valor = encabezado.decode("latin-1").partition(":")
+                    encabezados[llave.strip().lower()] = valor.strip()
+
+                cuerpo = await lector.readexactly(int(encabezados.get("content-length", 0)))
+                estado, respuesta = await self._despachar(metodo, ruta, cuerpo)
+
+                datos = json.dumps(respuesta, allow_nan=False).encode()
+                escritor.write(
+                    f"HTTP/1.1 {_ESTADOS[estado]}\r\nContent-Type: application/json\r\n"
+                    f"Content-Length: {len(datos)}\r\n\r\n".encode() + datos
+                )
+                await escritor.drain()
+
+                if encabezados.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            escritor.close()
+
+    async def _despachar(self, metodo, ruta, cuerpo):
+        """Resuelve la ruta pedida y retorna (código de estado, respuesta)."""
+        if metodo == "GET" and ruta == "/salud":
+            return 200, {"estado": "ok", "cola": self._cola.qsize(), **self.estadisticas}
+
+        if metodo != "POST" or ruta != "/ajustar":
+            return 404, {"error": f"Ruta no encontrada: {metodo} {ruta}"}
+
+        try:
+            peticion = json.loads(cuerpo)
+            x = np.asarray(peticion["x"], dtype=np.float64)
+            y = np.asarray(peticion["y"], dtype=np.float64)
+            alpha = float(peticion.get("niv_significancia", 0.05))
+            if x.ndim != 1 or x.shape != y.shape or len(x) == 0:
+                raise ValueError("x y y deben ser listas de números de la misma longitud.")
+            # json.loads acepta NaN e Infinity: se rechazan igual que en RegresionLineal
+            validar_datos(x, y)
+            if not 0 < alpha < 1:
+                raise ValueError("niv_significancia debe estar entre 0 y 1.")
+        except (ValueError, KeyError, TypeError) as e:
+            return 400, {"error": str(e)}
+
+        futuro = asyncio.get_running_loop().create_future()
+        try:
+            self._cola.put_nowait((x, y, alpha, futuro))
+        except asyncio.QueueFull:
+            self.estadisticas["rechazadas"] += 1
+            return 503, {"error": "Cola llena, intenta más tarde."}
+
+        self.estadisticas["peticiones"] += 1
+        try:
+            return 200, await futuro
+        except Exception as e:
+            return 500, {"error": repr(e)}
+
+    async def _procesar_lotes(self):
+        """Junta las peticiones de cada ventana y las calcula como un solo lote."""
+        while True:
+            pendientes = [await self._cola.get()]
+
+            # Se espera un poco para que se junten más peticiones
+            if self.ventana_ms > 0:
+                await asyncio.sleep(self.ventana_ms / 1000)
+
+            while len(pendientes) < self.max_lote and not self._cola.empty():
+                pendientes.append(self._cola.get_nowait())
+
+            await self._resolver(pendientes)
+
+    async def _resolver(self, pendientes):
+        """Calcula un lote (agrupado por nivel de significancia) y responde a cada petición."""
+        loop = asyncio.get_running_loop()
+
+        por_alpha = {}
+        for pendiente in pendientes:
+            por_alpha.setdefault(pendiente[2], []).append(pendiente)
+
+        for alpha, grupo in por_alpha.items():
+            try:
+                offsets = np.concatenate([[0], np.cumsum([len(x) for x, _, _, _ in grupo])])
+                x = np.concatenate([x for x, _, _, _ in grupo])
+                y = np.concatenate([y for _, y, _, _ in grupo])
+
+                # numpy libera el GIL, así el event loop sigue aceptando peticiones
+                lote = await loop.run_in_executor(None, ajustar_lote, x, y, offsets, alpha)
+
+                for i, (_, _, _, futuro) in enumerate(grupo):
+                    if not futuro.done():
+                        futuro.set_result({"n": int(lote["n"][i]), "resultados": resultados_desde_lote(lote, i)})
+            except Exception as e:
+                for _, _, _, futuro in grupo:
+                    if not futuro.done():
+                        futuro.set_exception(e)
+
+        self.estadisticas["lotes"] += 1
+
+
+async def prueba_carga(host="127.0.0.1", puerto=8765, ruta_unix=None, concurrencia=64, total=10_000, n=30, semilla=0):
+    """
+    Cliente de prueba de carga: `concurrencia` conexiones mandan `total` peticiones en total.
+
+    Parámetros:
+      - host, puerto, ruta_unix: Dirección del servidor.
+      - concurrencia: Cantidad de conexiones simultáneas.
+      - total: Cantidad total de peticiones.
+      - n: Cantidad de datos de cada regresión.
+      - semilla: Semilla para generar los datos.
+
+    Retorna:
+      - Un diccionario con el throughput (peticiones/s) y la latencia (p50, p99) en ms.
+    """
+    rng = np.random.default_rng(semilla)
+    x = rng.uniform(10, 30, n)
+    cuerpo = json.dumps({"x": x.tolist(), "y": (5 - 0.15 * x + rng.normal(0, 1, n)).tolist()}).encode()
+    peticion = (
+        f"POST /ajustar HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n\r\n".encode() + cuerpo
+    )
+
+    latencias = []
+    errores = 0
+
+    async def cliente(cantidad):
+        nonlocal errores
+        if ruta_unix:
+            lector, escritor = await asyncio.open_unix_connection(ruta_unix)
+        else:
+            lector, escritor = await asyncio.open_connection(host, puerto)
+
+        for _ in range(cantidad):
+            inicio = time.perf_counter()
+            escritor.write(peticion)
+            await escritor.drain()
+
+            estado = await lector.readline()
+            largo = 0
+            while True:
+                encabezado = await lector.readline()
+                if encabezado in (b"\r\n", b""):
+                    break
+                if encabezado.lower().startswith(b"content-length:"):
+                    largo = int(encabezado.split(b":")[1])
+            await lector.readexactly(largo)
+
+            latencias.append(time.perf_counter() - inicio)
+            if b" 200 " not in estado:
+                errores += 1
+
+        escritor.close()
+
+    inicio = time.perf_counter()
+    por_cliente = [total // concurrencia + (1 if i < total % concurrencia else 0) for i in range(concurrencia)]
+    await asyncio.gather(*(cliente(cantidad) for cantidad in por_cliente if cantidad))
+    duracion = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "peticiones": len(latencias),
+        "errores": errores,
+        "duracion_s": duracion,
+        "peticiones_por_s": len(latencias) / duracion,
+        "latencia_p50_ms": 1000 * statistics.median(latencias),
+        "latencia_p99_ms": 1000 * latencias[int(0.99 * (len(latencias) - 1))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio local de regresión lineal")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    servir = subparsers.add_parser("servir", help="Inicia el servidor")
+    carga = subparsers.add_parser("carga", help="Prueba de carga contra un servidor en marcha")
+    for sub in (servir, carga):
+        sub.add_argument("--host", default="127.0.0.1")
+        sub.add_argument("--puerto", type=int, default=8765)
+        sub.add_argument("--unix", help="Ruta de un socket Unix (en lugar de TCP)")
+
+    servir.add_argument("--ventana-ms", type=float, default=5)
+    servir.add_argument("--max-lote", type=int, default=1024)
+    servir.add_argument("--cola", type=int, default=10_000, help="Profundidad máxima de la cola")
+
+    carga.add_argument("--concurrencia", type=int, default=64)
+    carga.add_argument("--total", type=int, default=10_000)
+    carga.add_argument("--n", type=int, default=30, help="Datos por regresión")
+
+    args = parser.parse_args()
+
+    if args.comando == "servir":
+        servidor = ServidorRegresion(args.host, args.puerto, args.unix, args.ventana_ms, args.max_lote, args.cola)
+        print(f"Escuchando en {args.unix or f'{args.host}:{args.puerto}'}")
+        try:
+            asyncio.run(servidor.servir())
+        except KeyboardInterrupt:
+            pass
+    else:
+        resultado = asyncio.run(prueba_carga(args.host, args.puerto, args.unix, args.concurrencia, args.total, args.n))
+        print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ from rich.align import Align
 from rich import box
 
 
-def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
+def table(var_ind, var_dep, r_value, conclusion, n, resultados=None, console=None) -> None:
     """
     Crea y muestra una tabla completa con los resultados de la regresión lineal.
 
@@ -15,11 +15,12 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
       - conclusion: Conclusión del problema.
       - n: Número de observaciones.
       - resultados: Diccionario con todos los resultados calculados (opcional).
+      - console: Console de rich donde imprimir (por defecto, una nueva en la terminal).
     """
     if type(r_value) != str or type(conclusion) != str:
         r_value, conclusion = map(str, (r_value, conclusion))
 
-    console = Console()
+    console = console or Console()
 
     # Primera tabla: Declaración de variables
     table = Table(title="Declaración de variables",
@@ -30,7 +31,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row("(Justificación de la relación de las variables)")
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Segunda tabla: Diagrama de dispersión (referencia)
     table = Table(title="(Aquí va el diagrama de dispersión)",
@@ -40,7 +41,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row("(Lectura del diagrama)")
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Tercera tabla: Correlación
     table = Table(title="Correlación de las variables",
@@ -50,7 +51,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row(conclusion)
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Valores por defecto para los cálculos
     sum_x = sum_y = mean_x = mean_y = sum_x2 = sum_y2 = sum_xy = Sxx = Syy = Sxy = 0
@@ -86,7 +87,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_section()
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Valores por defecto
     a = b = 0
@@ -106,7 +107,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row(f"a = {a:.4f}")
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Valores por defecto
     r_squared = 0
@@ -122,7 +123,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row(f"r² = {r_squared:.4f} = {r_squared * 100:.2f}%")
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Valores por defecto
     SCE = CMT = CME = r_squared_adj = 0
@@ -148,10 +149,10 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row(f"R²ₐⱼ = {r_squared_adj:.4f} = {r_squared_adj * 100:.2f}%")
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Valores por defecto para prueba beta
-    error_std_b = ep_b = stat_tabla = 0
+    error_std_b = ep_b = stat_tabla = p_valor = 0
     concl_beta = "(poner una variable de conclusion de hipotesis b)"
 
     # Si se proporcionan resultados, usar valores calculados
@@ -161,6 +162,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
         ep_b = p_beta.get("ep_b", 0)
         stat_used = p_beta.get("stat_used")
         stat_tabla = p_beta.get("stat_tabla", 0)
+        p_valor = p_beta.get("p_valor", 0)
         concl_beta = p_beta.get("conclusion", concl_beta)
 
     # Octava tabla: Pruebas para beta
@@ -178,13 +180,16 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row("Valor de tabla")
     table.add_row(f"{stat_used}_α/2, n - 2 = +- {stat_tabla:.4f}")
     table.add_section()
+    table.add_row("Valor p")
+    table.add_row(f"p = {p_valor:.4f}")
+    table.add_section()
     table.add_row(concl_beta)
     console.print(Align(table, align="center"))
 
-    print()
+    console.print()
 
     # Valores por defecto para prueba rho
-    error_std_r = ep_r = stat_tabla = 0
+    error_std_r = ep_r = stat_tabla = p_valor = 0
     concl_rho = "(poner una variable de conclusion de hipotesis p)"
 
     # Si se proporcionan resultados, usar valores calculados
@@ -194,6 +199,7 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
         ep_r = p_rho.get("ep_r", 0)
         stat_used = p_rho.get("stat_used")
         stat_tabla = p_rho.get("stat_tabla", 0)
+        p_valor = p_rho.get("p_valor", 0)
         concl_rho = p_rho.get("conclusion", concl_rho)
 
     # Novena tabla: Pruebas para rho
@@ -211,5 +217,39 @@ def table(var_ind, var_dep, r_value, conclusion, n, resultados=None) -> None:
     table.add_row("Valor de tabla")
     table.add_row(f"{stat_used}_α/2, n - 2 = +- {stat_tabla:.4f}")
     table.add_section()
+    table.add_row("Valor p")
+    table.add_row(f"p = {p_valor:.4f}")
+    table.add_section()
     table.add_row(concl_rho)
     console.print(Align(table, align="center"))
+
+    # Décima tabla (solo si se ajustaron): Modelos polinomiales y con logaritmos
+    polinomial = resultados.get("polinomial") if resultados else None
+    if polinomial:
+        console.print()
+
+        table = Table(title="Modelos polinomiales", box=box.ROUNDED, style="white")
+        table.add_column("Modelo")
+        table.add_column("Ecuación")
+        table.add_column("R²", justify="right")
+        table.add_column("R²ₐⱼ", justify="right")
+        for nombre, ajuste in polinomial["modelos"].items():
+            table.add_row(nombre, ajuste["ecuacion"], f"{ajuste['r_squared']:.4f}", f"{ajuste['r_squared_adj']:.4f}")
+        table.add_section()
+        table.add_row("Mejor modelo (R²ₐⱼ, misma escala de y)", str(polinomial["mejor_modelo"]), "", "")
+        console.print(Align(table, align="center"))
+
+    # Tabla de remuestreo (solo si se calculó): Intervalos bootstrap y prueba de permutación
+    remuestreo = resultados.get("remuestreo") if resultados else None
+    if remuestreo:
+        console.print()
+
+        table = Table(title="Pruebas por remuestreo", show_header=False,
+                      box=box.ROUNDED, style="white")
+        table.add_row(f"Remuestras = {remuestreo['n_remuestras']}", f"Semilla = {remuestreo['semilla']}")
+        table.add_section()
+        table.add_row(f"b = {remuestreo['b']:.4f}", f"δ_b bootstrap = {remuestreo['error_std_b']:.4f}")
+        table.add_row(f"r = {remuestreo['r']:.4f}", f"δᵣ bootstrap = {remuestreo['error_std_r']:.4f}")
+        table.add_section()
+        table.add_row(remuestreo["conclusion"])
+        console.print(Align(table, align="center"))
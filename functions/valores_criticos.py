@@ -0,0 +1,151 @@
+from functools import lru_cache
+import numpy as np
+
+# Niveles de significancia más usados y grados de libertad de las tablas precalculadas
+ALFAS_COMUNES = (0.01, 0.05, 0.10)
+GL_TABLA = 1000
+
+# alpha -> arreglo con t_α/2 para gl = 1, 2, ..., len(arreglo)
+_TABLAS = {}
+
+
+def precalcular_tablas(alfas=ALFAS_COMUNES, gl_max=GL_TABLA):
+    """
+    Precalcula las tablas t_α/2 de los niveles de significancia dados, para gl = 1..gl_max.
+
+    Después de esto, buscar un valor crítico de esos alfas es solo indexar un arreglo.
+
+    Parámetros:
+      - alfas: Niveles de significancia a precalcular.
+      - gl_max: Grados de libertad máximos de cada tabla.
+    """
+    from scipy.special import stdtrit
+
+    gl = np.arange(1, gl_max + 1)
+    for alpha in alfas:
+        _TABLAS[float(alpha)] = stdtrit(gl, 1 - alpha / 2)
+
+
+@lru_cache(maxsize=4096)
+def _valor_critico_cacheado(alpha, gl):
+    """Valor crítico de dos colas (z si gl es None); las llaves menos usadas se descartan."""
+    from scipy.special import stdtrit, ndtri
+
+    if gl is None:
+        return float(ndtri(1 - alpha / 2))
+    return float(stdtrit(gl, 1 - alpha / 2))
+
+
+def valor_critico(alpha, gl=None):
+    """
+    Retorna el valor crítico de dos colas t_α/2, gl (o z_α/2 si gl es None).
+
+    Parámetros:
+      - alpha: Nivel de significancia.
+      - gl: Grados de libertad de la t de Student (None para la normal).
+
+    Retorna:
+      - El valor crítico como float.
+    """
+    alpha = float(alpha)
+    tabla = _TABLAS.get(alpha)
+    if gl is not None and tabla is not None and 1 <= gl <= len(tabla):
+        return float(tabla[gl - 1])
+    return _valor_critico_cacheado(alpha, None if gl is None else int(gl))
+
+
+def valores_criticos(alpha, gl):
+    """
+    Versión vectorizada de valor_critico para un arreglo de grados de libertad.
+
+    Parámetros:
+      - alpha: Nivel de significancia.
+      - gl: Arreglo de grados de libertad (enteros >= 1).
+
+    Retorna:
+      - Un arreglo con t_α/2, gl para cada elemento.
+    """
+    gl = np.asarray(gl, dtype=np.int64)
+    resultado = np.empty(gl.shape)
+
+    # Los que están en una tabla precalculada solo se indexan
+    tabla = _TABLAS.get(float(alpha))
+    en_tabla = np.zeros(gl.shape, dtype=bool)
+    if tabla is not None:
+        en_tabla = (gl >= 1) & (gl <= len(tabla))
+        resultado[en_tabla] = tabla[gl[en_tabla] - 1]
+
+    # El resto se calcula una vez por cada gl distinto
+    faltan = ~en_tabla
+    if np.any(faltan):
+        gl_unicos, inverso = np.unique(gl[faltan], return_inverse=True)
+        resultado[faltan] = np.array([valor_critico(alpha, int(g)) for g in gl_unicos])[inverso]
+
+    return resultado
+
+
+def estadistico_tabla(alpha, n):
+    """
+    Aplica la regla del proyecto: t con n - 2 grados de libertad si n < 30, z si n >= 30.
+
+    Parámetros:
+      - alpha: Nivel de significancia.
+      - n: Cantidad de datos.
+
+    Retorna:
+      - Una tupla (valor de tabla, "t" o "z"); (0, "") si n <= 2.
+    """
+    if n <= 2:
+        return (0, "")  # No hay grados de libertad suficientes
+    elif n < 30:
+        return (valor_critico(alpha, n - 2), "t")
+    else:
+        return (valor_critico(alpha), "z")
+
+
+def estadisticos_tabla(alpha, n):
+    """
+    Versión vectorizada de estadistico_tabla para un arreglo de tamaños de muestra.
+
+    Retorna:
+      - Una tupla (arreglo de valores de tabla, arreglo de "t"/"z"); nan y "" si n <= 2.
+    """
+    n = np.asarray(n, dtype=np.int64)
+    stat_tabla = np.full(n.shape, np.nan)
+    stat_used = np.full(n.shape, "", dtype="<U1")
+
+    usa_t = (n > 2) & (n < 30)
+    usa_z = n >= 30
+
+    if np.any(usa_t):
+        stat_tabla[usa_t] = valores_criticos(alpha, n[usa_t] - 2)
+        stat_used[usa_t] = "t"
+    if np.any(usa_z):
+        stat_tabla[usa_z] = valor_critico(alpha)
+        stat_used[usa_z] = "z"
+
+    return stat_tabla, stat_used
+
+
+def valor_p(estadistico, gl=None):
+    """
+    Valor p exacto de dos colas para un estadístico t (o z si gl es None). Acepta arreglos.
+
+    Parámetros:
+      - estadistico: Estadístico de prueba.
+      - gl: Grados de libertad (None para la normal); puede ser un arreglo con nan donde se use z.
+
+    Retorna:
+      - El valor p (float o arreglo).
+    """
+    from scipy.special import stdtr, ndtr
+
+    menos_abs = -np.abs(estadistico)
+    if gl is None:
+        p = 2 * ndtr(menos_abs)
+    else:
+        gl = np.asarray(gl, dtype=np.float64)
+        # Donde no hay grados de libertad (nan) se usa la normal
+        p = np.where(np.isnan(gl), 2 * ndtr(menos_abs), 2 * stdtr(np.nan_to_num(gl, nan=1.0), menos_abs))
+
+    return float(p) if np.ndim(p) == 0 else p
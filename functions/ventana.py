@@ -0,0 +1,278 @@
+from collections import deque
+import numpy as np
+from .acumulador import AcumuladorRegresion
+from .lote import estadisticos_desde_momentos
+
+
+class RegresionMovil:
+    """
+    Regresión lineal sobre una ventana móvil (o creciente) que se actualiza dato por dato.
+
+    Cada dato nuevo se suma a los momentos (n, medias, Sxx, Syy, Sxy) y, si la ventana
+    está llena, el más viejo se resta; ambas operaciones son O(1), sin recorrer la ventana.
+    Cada cierto número de actualizaciones los momentos se recalculan desde la ventana
+    para que no se acumule el error de redondeo de las restas.
+
+    Parámetros:
+      - ventana: Cantidad de datos de la ventana (None para una ventana creciente con todo el historial).
+      - niv_significancia: Nivel de significancia para las pruebas de hipótesis.
+      - recalcular_cada: Actualizaciones entre cada recálculo desde la ventana
+        (por defecto 10 veces la ventana, así el costo amortizado sigue siendo O(1)).
+    """
+
+    def __init__(self, ventana=None, niv_significancia=0.05, recalcular_cada=None):
+        if ventana is not None and ventana < 1:
+            raise ValueError("La ventana debe tener al menos un dato.")
+
+        self.ventana = ventana
+        self.niv_significancia = niv_significancia
+        self.recalcular_cada = recalcular_cada or (10 * ventana if ventana else None)
+
+        self._acumulador = AcumuladorRegresion()
+        self._datos = deque() if ventana else None
+        self._actualizaciones = 0
+
+    @property
+    def n(self):
+        return self._acumulador.n
+
+    def actualizar(self, x, y):
+        """
+        Agrega un dato y, si la ventana ya está llena, quita el más viejo.
+
+        Parámetros:
+          - x: Valor de la variable independiente.
+          - y: Valor de la variable dependiente.
+
+        Retorna:
+          - El mismo objeto (para poder encadenar llamadas).
+        """
+        x, y = float(x), float(y)
+        acumulador = self._acumulador
+        Sxx_antes, Syy_antes = acumulador.Sxx, acumulador.Syy
+        recalcular = False
+
+        if self._datos is not None:
+            self._datos.append((x, y))
+            if len(self._datos) > self.ventana:
+                x_viejo, y_viejo = self._datos.popleft()
+                acumulador._quitar_momentos(1, x_viejo, y_viejo, 0.0, 0.0, 0.0)
+                # Si una varianza cae casi a cero la resta perdió casi todos los dígitos
+                recalcular = acumulador.Sxx < 1e-8 * Sxx_antes or acumulador.Syy < 1e-8 * Syy_antes
+
+        acumulador._combinar_momentos(1, x, y, 0.0, 0.0, 0.0)
+
+        self._actualizaciones += 1
+        if recalcular or (self.recalcular_cada and self._actualizaciones % self.recalcular_cada == 0):
+            self._recalcular()
+
+        return self
+
+    def extender(self, x_arr, y_arr):
+        """Agrega varios datos en orden, como si se llamara actualizar con cada uno."""
+        for x, y in zip(np.asarray(x_arr).ravel().tolist(), np.asarray(y_arr).ravel().tolist()):
+            self.actualizar(x, y)
+        return self
+
+    def _recalcular(self):
+        """Vuelve a calcular los momentos desde los datos de la ventana."""
+        datos = np.array(self._datos, dtype=np.float64).reshape(-1, 2)
+        self._acumulador = AcumuladorRegresion().agregar(datos[:, 0], datos[:, 1])
+
+    def estadisticos(self):
+        """
+        Estadísticos de la ventana actual (los mismos que calcula ajustar_lote).
+
+        Retorna:
+          - Un diccionario con a, b, r, r_squared, r_squared_adj, ep_b, ep_r, stat_tabla, valores p, etc.
+        """
+        a = self._acumulador
+        lote = estadisticos_desde_momentos([a.n], [a.mean_x], [a.mean_y], [a.Sxx], [a.Syy], [a.Sxy], self.niv_significancia)
+        return {llave: valores[0].item() for llave, valores in lote.items()}
+
+    def regresion(self, var_ind, var_dep, titulo_diagrama=None, perezoso=False):
+        """
+        Arma un RegresionLineal con la ventana actual (con las conclusiones en texto),
+        igual al que se obtendría ajustando desde cero los datos de la ventana.
+
+        Parámetros:
+          - var_ind: Descripción de la variable independiente.
+          - var_dep: Descripción de la variable dependiente.
+          - titulo_diagrama: Título para el diagrama de dispersión.
+          - perezoso: Si es True, cada grupo de resultados se calcula hasta que se consulta.
+
+        Retorna:
+          - Un objeto RegresionLineal.
+        """
+        from .regresion_lineal import RegresionLineal
+
+        copia = AcumuladorRegresion()
+        copia.combinar(self._acumulador)
+        regresion = RegresionLineal.desde_acumulador(copia, var_ind, var_dep, self.niv_significancia, titulo_diagrama, perezoso)
+
+        if self._datos is not None:
+            datos = np.array(self._datos, dtype=np.float64).reshape(-1, 2)
+            regresion.x, regresion.y = datos[:, 0], datos[:, 1]
+
+        return regresion
+
+
+def regresion_movil(x_arr, y_arr, ventana=None, niv_significancia=0.05, bloque=4096):
+    """
+    Calcula la regresión de cada ventana de una serie completa en O(n).
+
+    Los datos se parten en bloques centrados cada uno en su propia media, y dentro de cada bloque
+    se calculan con sumas acumuladas los momentos de todos sus prefijos y sufijos. Una ventana
+    de tamaño fijo es el sufijo de un bloque de su mismo tamaño más el prefijo del siguiente, y
+    una ventana creciente es lo acumulado de los bloques anteriores más un prefijo; las partes se
+    combinan con la fórmula de Chan. Así las restas son siempre entre valores de la escala de un
+    bloque y no se pierde precisión aunque x tenga tendencia (tiempos, índices).
+
+    Parámetros:
+      - x_arr: Valores de la variable independiente (en orden de tiempo).
+      - y_arr: Valores de la variable dependiente.
+      - ventana: Cantidad de datos de cada ventana (None para ventanas crecientes).
+      - niv_significancia: Nivel de significancia para las pruebas de hipótesis.
+      - bloque: Tamaño de bloque para las ventanas crecientes.
+
+    Retorna:
+      - Un diccionario de arreglos como el de ajustar_lote. El elemento i corresponde a la
+        ventana que termina en el dato ventana - 1 + i (o en el dato i si la ventana es creciente).
+    """
+    x = np.asarray(x_arr, dtype=np.float64).ravel()
+    y = np.asarray(y_arr, dtype=np.float64).ravel()
+
+    if len(x) != len(y):
+        raise ValueError("x y y deben tener la misma longitud.")
+    if ventana is not None and not 1 <= ventana <= len(x):
+        raise ValueError("La ventana debe estar entre 1 y la cantidad de datos.")
+
+    if ventana is None:
+        momentos = _ventanas_crecientes(x, y, bloque)
+    else:
+        momentos = _ventanas_fijas(x, y, ventana)
+
+    return estadisticos_desde_momentos(*momentos, niv_significancia)
+
+
+def _bloques_centrados(x, y, largo):
+    """
+    Parte x y y en bloques de `largo` datos (el último se completa repitiendo el último dato)
+    y centra cada bloque en su media. Retorna (dx, dy, centros_x, centros_y) con dx y dy de forma (bloques, largo).
+    """
+    bloques = -(-len(x) // largo)
+    relleno = bloques * largo - len(x)
+    dx = np.pad(x, (0, relleno), mode="edge").reshape(bloques, largo)
+    dy = np.pad(y, (0, relleno), mode="edge").reshape(bloques, largo)
+    centros_x = dx.mean(axis=1)
+    centros_y = dy.mean(axis=1)
+    dx -= centros_x[:, None]
+    dy -= centros_y[:, None]
+    return dx, dy, centros_x, centros_y
+
+
+def _prefijos(dx, dy):
+    """
+    Momentos de cada prefijo de cada fila de datos ya centrados por fila: el elemento [k, m]
+    corresponde a los primeros m + 1 datos de la fila k. Retorna (n, mean_dx, mean_dy, Sxx, Syy, Sxy, escala_x, escala_y),
+    donde las escalas (Σdx², Σdy²) sirven para reconocer una varianza que solo es error de redondeo.
+    """
+    n = np.broadcast_to(np.arange(1, dx.shape[1] + 1, dtype=np.float64), dx.shape)
+    s_x = np.cumsum(dx, axis=1)
+    s_y = np.cumsum(dy, axis=1)
+    s_xx = np.cumsum(dx * dx, axis=1)
+    s_yy = np.cumsum(dy * dy, axis=1)
+    s_xy = np.cumsum(dx * dy, axis=1)
+
+    mean_dx = s_x / n
+    mean_dy = s_y / n
+    Sxx = np.maximum(s_xx - s_x * mean_dx, 0.0)
+    Syy = np.maximum(s_yy - s_y * mean_dy, 0.0)
+    Sxy = s_xy - s_x * mean_dy
+
+    return n, mean_dx, mean_dy, Sxx, Syy, Sxy, s_xx, s_yy
+
+
+def _combinar(a, b, delta_x, delta_y):
+    """
+    Combina (fórmula de Chan) los momentos de dos partes, vectorizado. `delta_x` y `delta_y` son
+    la diferencia entre los centros de b y de a; las medias del resultado quedan en el centro de a.
+    """
+    n_a, mean_x_a, mean_y_a, Sxx_a, Syy_a, Sxy_a, escala_x_a, escala_y_a = a
+    n_b, mean_x_b, mean_y_b, Sxx_b, Syy_b, Sxy_b, escala_x_b, escala_y_b = b
+
+    n = n_a + n_b
+    d_x = delta_x + mean_x_b - mean_x_a
+    d_y = delta_y + mean_y_b - mean_y_a
+    factor = n_a * n_b / n
+
+    return (
+        n,
+        mean_x_a + d_x * n_b / n,
+        mean_y_a + d_y * n_b / n,
+        Sxx_a + Sxx_b + d_x * d_x * factor,
+        Syy_a + Syy_b + d_y * d_y * factor,
+        Sxy_a + Sxy_b + d_x * d_y * factor,
+        escala_x_a + escala_x_b,
+        escala_y_a + escala_y_b,
+    )
+
+
+def _limpiar_constantes(n, mean_x, mean_y, Sxx, Syy, Sxy, escala_x, escala_y):
+    """Anula lo que queda por debajo del error de redondeo (ventanas constantes) y retorna los momentos."""
+    Sxx[Sxx <= 1e-12 * escala_x] = 0.0
+    Syy[Syy <= 1e-12 * escala_y] = 0.0
+    Sxy[(Sxx == 0) | (Syy == 0)] = 0.0
+    return n.astype(np.int64), mean_x, mean_y, Sxx, Syy, Sxy
+
+
+def _ventanas_fijas(x, y, ventana):
+    """Momentos de cada ventana de `ventana` datos: sufijo del bloque k más prefijo del bloque k + 1."""
+    dx, dy, centros_x, centros_y = _bloques_centrados(x, y, ventana)
+    prefijos = _prefijos(dx, dy)
+    # Sufijos: prefijos de las filas al revés; [k, j] son los datos j..ventana - 1 del bloque k
+    sufijos = [m[:, ::-1] for m in _prefijos(dx[:, ::-1], dy[:, ::-1])]
+
+    inicios = np.arange(len(x) - ventana + 1)
+    k, j = np.divmod(inicios, ventana)
+    siguiente = np.minimum(k + 1, len(centros_x) - 1)
+
+    # j = 0: la ventana es exactamente el bloque k; si no, sufijo (ventana - j datos) más prefijo (j datos)
+    completo = [m[k, -1] for m in prefijos]
+    partido = _combinar([m[k, j] for m in sufijos], [m[siguiente, j - 1] for m in prefijos],
+                        centros_x[siguiente] - centros_x[k], centros_y[siguiente] - centros_y[k])
+    momentos = [np.where(j == 0, c, p) for c, p in zip(completo, partido)]
+
+    momentos[1] += centros_x[k]
+    momentos[2] += centros_y[k]
+    return _limpiar_constantes(*momentos)
+
+
+def _ventanas_crecientes(x, y, bloque):
+    """Momentos de cada ventana [0, i]: lo acumulado de los bloques anteriores más un prefijo del bloque actual."""
+    n = len(x)
+    salida = np.empty((8, n))
+    acumulado = None
+    centro_acumulado = (0.0, 0.0)
+
+    for inicio in range(0, n, bloque):
+        dx, dy, centros_x, centros_y = _bloques_centrados(x[inicio:inicio + bloque], y[inicio:inicio + bloque], bloque)
+        m = min(bloque, n - inicio)
+        prefijos = [p[0, :m] for p in _prefijos(dx, dy)]
+
+        if acumulado is None:
+            momentos = prefijos
+            centro_x, centro_y = centros_x[0], centros_y[0]
+        else:
+            centro_x, centro_y = centro_acumulado
+            momentos = _combinar(acumulado, prefijos, centros_x[0] - centro_x, centros_y[0] - centro_y)
+
+        salida[:, inicio:inicio + m] = momentos
+        salida[1, inicio:inicio + m] += centro_x
+        salida[2, inicio:inicio + m] += centro_y
+
+        # Lo acumulado hasta el final del bloque, centrado en el centro que se está usando
+        acumulado = [np.asarray(v[-1]) for v in momentos]
+        centro_acumulado = (centro_x, centro_y)
+
+    return _limpiar_constantes(*salida)
@@ -0,0 +1,17 @@
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_nucleo_no_carga_modulos_pesados():
+    """Importar regresion_helper no debe cargar scipy, matplotlib ni rich (se cargan al usarlos)."""
+    codigo = (
+        "import sys, json\n"
+        "import functions.regresion_helper\n"
+        "print(json.dumps(sorted({m.split('.')[0] for m in sys.modules} & {'scipy', 'matplotlib', 'rich'})))\n"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+    assert json.loads(salida.stdout) == []
@@ -0,0 +1,14 @@
+import numpy as np
+import pytest
+from functions.paralelo import ajustar_paralelo
+
+
+@pytest.mark.parametrize("modo", ["hilos", "procesos"])
+def test_paralelo_rechaza_nan_como_el_ajuste_serial(modo):
+    """Un nan en los datos es un error también en el ajuste paralelo (no resultados nan)."""
+    x = np.arange(1000, dtype=np.float64)
+    y = 2 * x + 1
+    y[500] = np.nan
+
+    with pytest.raises(ValueError, match="no finito"):
+        ajustar_paralelo(x, y, "X", "Y", n_trabajadores=2, modo=modo)
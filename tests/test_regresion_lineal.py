@@ -0,0 +1,20 @@
+import math
+import numpy as np
+from functions.acumulador import AcumuladorRegresion
+from functions.regresion_lineal import RegresionLineal
+
+
+def test_y_constante_da_nan_en_lugar_de_error():
+    """Con y constante (Syy = 0) el R² ajustado queda como nan, desde los arreglos y desde el acumulador."""
+    x = np.arange(10, dtype=np.float64)
+    y = np.full(10, 3.0)
+
+    acumulador = AcumuladorRegresion()
+    acumulador.agregar(x, y)
+
+    for regresion in (RegresionLineal(x, y, "X", "Y"), RegresionLineal.desde_acumulador(acumulador, "X", "Y")):
+        determinacion = regresion.resultados["determinacion"]
+        assert determinacion["CMT"] == 0
+        assert math.isnan(determinacion["r_squared_adj"])
+        assert regresion.resultados["regresion"]["b"] == 0
+        assert regresion.resultados["regresion"]["a"] == 3
@@ -0,0 +1,21 @@
+import math
+import warnings
+import numpy as np
+import pytest
+from functions.remuestreo import pruebas_remuestreo
+
+
+def test_x_constante_es_error():
+    with pytest.raises(ValueError, match="constante"):
+        pruebas_remuestreo(np.ones(20), np.arange(20.0), n_remuestras=100, semilla=0)
+
+
+def test_y_constante_da_r_nan_sin_advertencias():
+    """Con y constante, r y su intervalo son nan (floats) y no salen RuntimeWarnings de numpy."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        resultado = pruebas_remuestreo(np.arange(20.0), np.full(20, 3.0), n_remuestras=200, semilla=0)
+
+    assert resultado["b"] == 0.0
+    for clave in ("r", "r_inf", "r_sup", "error_std_r"):
+        assert isinstance(resultado[clave], float) and math.isnan(resultado[clave])
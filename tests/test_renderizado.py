@@ -0,0 +1,50 @@
+import threading
+import numpy as np
+from functions.graphic import graphic
+from functions.regresion_helper import RenderizadorFondo, ejecutar_regresion, ejecutar_regresion_en_fondo
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+def _datos(semilla):
+    rng = np.random.default_rng(semilla)
+    x = rng.uniform(0, 10, 200)
+    return x, 2 * x + 1 + rng.normal(0, 1, 200)
+
+
+def test_renderizado_fondo_y_sincrono_a_la_vez(tmp_path, capsys):
+    """Los gráficos de fondo y los síncronos se guardan completos aunque se dibujen a la vez."""
+    errores = []
+    rutas = []
+
+    def sincronos(hilo):
+        try:
+            for i in range(4):
+                ruta = tmp_path / f"sincrono_{hilo}_{i}.png"
+                rutas.append(ruta)
+                if i % 2:
+                    graphic(*_datos(i), save_path=str(ruta), a=1, b=2)
+                else:
+                    ejecutar_regresion(*_datos(i), "X", "Y", save_path=str(ruta))
+        except Exception as e:
+            errores.append(e)
+
+    with RenderizadorFondo() as uno, RenderizadorFondo() as otro:
+        renderizados = []
+        for i in range(4):
+            for renderizador in (uno, otro):
+                ruta = tmp_path / f"fondo_{id(renderizador)}_{i}.png"
+                rutas.append(ruta)
+                renderizados.append(ejecutar_regresion_en_fondo(*_datos(i), "X", "Y", save_path=str(ruta), renderizador=renderizador)[1])
+
+        hilos = [threading.Thread(target=sincronos, args=(h,)) for h in range(2)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+        for renderizado in renderizados:
+            renderizado.result(timeout=60)
+
+    assert errores == []
+    for ruta in rutas:
+        assert ruta.read_bytes().startswith(PNG)
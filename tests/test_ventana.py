@@ -0,0 +1,47 @@
+import numpy as np
+from functions.ventana import RegresionMovil, regresion_movil
+
+
+def _ajuste_directo(x, y):
+    """Sxx, b y r de un ajuste nuevo sobre la ventana."""
+    dx, dy = x - x.mean(), y - y.mean()
+    Sxx, Syy, Sxy = dx @ dx, dy @ dy, dx @ dy
+    return Sxx, Sxy / Sxx, Sxy / np.sqrt(Sxx * Syy)
+
+
+def _datos_con_tendencia(n=2_000_000):
+    rng = np.random.default_rng(0)
+    x = np.arange(n, dtype=np.float64)
+    return x, 0.5 * x + rng.normal(0, 10, n)
+
+
+def test_ventana_fija_con_tendencia_igual_a_ajuste_directo():
+    x, y = _datos_con_tendencia()
+    resultado = regresion_movil(x, y, ventana=100)
+
+    for i in (0, 1, 57, 99, 100, 123_456, 1_000_000, len(x) - 100):
+        Sxx, b, r = _ajuste_directo(x[i:i + 100], y[i:i + 100])
+        assert np.isclose(resultado["Sxx"][i], Sxx, rtol=1e-9)
+        assert np.isclose(resultado["b"][i], b, rtol=1e-9)
+        assert np.isclose(resultado["r"][i], r, rtol=1e-9)
+
+
+def test_ventana_creciente_con_tendencia_igual_a_ajuste_directo():
+    x, y = _datos_con_tendencia()
+    resultado = regresion_movil(x, y)
+
+    for i in (2, 10, 4095, 4096, 1_000_000, len(x) - 1):
+        Sxx, b, r = _ajuste_directo(x[:i + 1], y[:i + 1])
+        assert np.isclose(resultado["Sxx"][i], Sxx, rtol=1e-9)
+        assert np.isclose(resultado["b"][i], b, rtol=1e-9)
+
+
+def test_ventana_constante_y_version_por_dato():
+    rng = np.random.default_rng(1)
+    x, y = rng.normal(size=500), rng.normal(size=500)
+    x[200:260] = 3.0
+    resultado = regresion_movil(x, y, ventana=50)
+    assert resultado["Sxx"][205] == 0
+
+    movil = RegresionMovil(ventana=50).extender(x[:400], y[:400])
+    assert np.isclose(movil.estadisticos()["b"], resultado["b"][350], rtol=1e-9)